@@ -9,12 +9,46 @@ if sys.version_info.major == 2:
     from airwaveapiclient import AirWaveAPIClient
     from airwaveapiclient import APList
     from airwaveapiclient import APDetail
+    from airwaveapiclient import FolderList
     from airwaveapiclient import Report
     from ap_graph import APGraph
+    from graph_data import GraphData
+    from records import AP
+    from records import Radio
+    from records import Client
+    from records import NeighborAP
+    from cache import ResponseCache
+    from snapshot import Snapshot
+    from snapshot import save_snapshot
+    from xmlparse import set_backend
+    from client_table import ClientTable
+    from neighbors import NeighborStore
+    from throttle import TokenBucket
+    from throttle import ConcurrencyLimiter
+    from metrics import Metrics
+    from metrics import set_metrics
 
 else:
     from airwaveapiclient.airwaveapiclient import AirWaveAPIClient
     from airwaveapiclient.airwaveapiclient import APList
     from airwaveapiclient.airwaveapiclient import APDetail
+    from airwaveapiclient.airwaveapiclient import FolderList
     from airwaveapiclient.airwaveapiclient import Report
     from airwaveapiclient.ap_graph import APGraph
+    from airwaveapiclient.graph_data import GraphData
+    from airwaveapiclient.records import AP
+    from airwaveapiclient.records import Radio
+    from airwaveapiclient.records import Client
+    from airwaveapiclient.records import NeighborAP
+    from airwaveapiclient.cache import ResponseCache
+    from airwaveapiclient.snapshot import Snapshot
+    from airwaveapiclient.snapshot import save_snapshot
+    from airwaveapiclient.xmlparse import set_backend
+    from airwaveapiclient.client_table import ClientTable
+    from airwaveapiclient.neighbors import NeighborStore
+    from airwaveapiclient.throttle import TokenBucket
+    from airwaveapiclient.throttle import ConcurrencyLimiter
+    from airwaveapiclient.metrics import Metrics
+    from airwaveapiclient.metrics import set_metrics
+    if sys.version_info >= (3, 6):
+        from airwaveapiclient.aio import AsyncAirWaveAPIClient
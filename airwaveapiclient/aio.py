@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.aio"""
+
+
+import asyncio
+from urllib.parse import urljoin
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+from airwaveapiclient.airwaveapiclient import APDetail
+
+
+class AsyncAirWaveAPIClient(object):
+
+    """Aruba networks AirWave API client for asyncio.
+
+    It has the same methods as AirWaveAPIClient, as coroutines running
+    on one aiohttp connection pool. Requires aiohttp
+    (pip install airwaveapiclient[async]).
+
+    Attributes:
+
+        :username (str): AirWave Login username.
+        :password (str): AirWave Login password.
+        :url (str): AirWave URL.
+        :max_concurrency (int): Maximum number of requests in flight.
+        :session (aiohttp.ClientSession): Session for connection pooling.
+
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize AsyncAirWaveAPIClient.
+
+        Args:
+
+            :username (str): AirWave Login username.
+            :password (str): AirWave Login password.
+            :url (str): AirWave url.
+            :max_concurrency (optional[int]): Maximum number of requests
+                in flight, also the connection pool size. Default is 100.
+
+        Usage: ::
+
+            >>> from airwaveapiclient import AsyncAirWaveAPIClient
+            >>> airwave = AsyncAirWaveAPIClient(username='admin',
+            >>>                                 password='xxxxx',
+            >>>                                 url='https://192.168.1.1/')
+            >>>
+
+        """
+        self.username = kwargs['username']
+        self.password = kwargs['password']
+        self.url = kwargs['url']
+        self.max_concurrency = kwargs.get('max_concurrency', 100)
+        self.session = None
+        self.semaphore = None
+
+    async def login(self):
+        """Login to AirWave.
+
+        Returns:
+
+            aiohttp.ClientResponse
+
+        Usage: ::
+
+            >>> res = await airwave.login()
+            >>> res.status
+            200
+
+        """
+        if aiohttp is None:
+            raise ImportError('AsyncAirWaveAPIClient requires aiohttp.')
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency,
+                                         ssl=False)
+        self.session = aiohttp.ClientSession(connector=connector)
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        url = self.api_path('LOGIN')
+        params = {'credential_0': self.username,
+                  'credential_1': self.password,
+                  'login': 'Log In',
+                  'destination': '/',
+                  'next_action': ''}
+        return await self.request('post', url, params=params)
+
+    async def logout(self):
+        """Logout.
+
+        Close the session.
+
+        Usage: ::
+
+            >>> await airwave.logout()
+
+        """
+        await self.session.close()
+
+    def api_path(self, path):
+        """API URL.
+
+        Args:
+
+            :path (str): Path for API URL.
+
+        Returns:
+
+            URL string 'https://xxx.xxx.xxx.xxx/xxxxxx'
+
+        """
+        return urljoin(self.url, path)
+
+    async def request(self, method, url, params=None):
+        """Send a request, waiting for a free concurrency slot.
+
+        The body is read before returning, so the connection is already
+        back in the pool and res.text() does not block on the network.
+
+        Args:
+
+            :method (str): HTTP method.
+            :url (str): URL.
+            :params (optional[list]): Query parameters as
+                (key, value) pairs.
+
+        Returns:
+
+            :aiohttp.ClientResponse: Response with its body read.
+
+        """
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self.semaphore:
+            async with self.session.request(method, url,
+                                            params=params) as res:
+                await res.read()
+                return res
+
+    async def amp_stats(self):
+        """Get AMP stats.
+
+        Usage: ::
+
+            >>> res = await airwave.amp_stats()
+            >>> await res.text()  # xml output.
+            '<?xml version="1.0" encoding="utf-8" ...'
+
+        """
+        return await self.request('get', self.api_path('amp_stats.xml'))
+
+    async def ap_list(self, ap_ids=None):
+        """Get Access Point list.
+
+        Args:
+
+            :ap_ids (optional[list]): You may specify multiple
+                Access Point IDs. Default is None.
+
+        Usage: ::
+
+            >>> res = await airwave.ap_list()
+            >>> objs = APList(await res.text())
+
+        """
+        url = self.api_path('ap_list.xml')
+        params = None
+        if ap_ids:
+            params = [('id', str(ap_id)) for ap_id in ap_ids]
+        return await self.request('get', url, params=params)
+
+    async def folder_list(self, folder_ids=None):
+        """Get Folders list.
+
+        Args:
+
+            :folder_ids (optional[list]): You may specify multiple
+                Folder IDs. Default is None.
+
+        """
+        url = self.api_path('folder_list.xml')
+        params = None
+        if folder_ids:
+            params = [('id', str(folder_id)) for folder_id in folder_ids]
+        return await self.request('get', url, params=params)
+
+    async def ap_detail(self, ap_id):
+        """Get Access Point detail information.
+
+        Args:
+
+            :ap_id (int): Access Point ID.
+
+        Usage: ::
+
+            >>> res = await airwave.ap_detail(123)
+            >>> obj = APDetail(await res.text())
+
+        """
+        return await self.__get('ap_detail.xml', {'id': ap_id})
+
+    async def ap_detail_many(self, ap_ids, typed=False):
+        """Get many Access Point details concurrently.
+
+        At most max_concurrency requests are in flight. A failed request
+        does not abort the batch; its exception is yielded instead of
+        the detail.
+
+        Args:
+
+            :ap_ids (list): Access Point IDs.
+            :typed (optional[bool]): Build typed APDetail objects.
+                Default is False.
+
+        Returns:
+
+            :async generator: (ap_id, APDetail or Exception) tuples,
+                in completion order.
+
+        Usage: ::
+
+            >>> async for ap_id, obj in airwave.ap_detail_many([1, 2]):
+            ...     ap_id, obj['name']
+            (2, 'AP002')
+            (1, 'AP001')
+
+        """
+        async def fetch(ap_id):
+            """Fetch and parse one detail."""
+            try:
+                res = await self.ap_detail(ap_id)
+                res.raise_for_status()
+                return ap_id, APDetail(await res.read(), typed=typed)
+            except Exception as err:  # pylint: disable=broad-except
+                return ap_id, err
+
+        tasks = [asyncio.ensure_future(fetch(ap_id)) for ap_id in ap_ids]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def ap_search(self, query=None):
+        """Return Access Point search results for the query.
+
+        Args:
+
+            :query (str): Query string (partial/complete MAC address).
+
+        """
+        return await self.__get('ap_search.xml', {'query': query})
+
+    async def client_detail(self, mac):
+        """Client detail information.
+
+        Args:
+
+            :mac (str): Client device's MAC address.
+
+        """
+        return await self.__get('client_detail.xml', {'mac': mac})
+
+    async def client_search(self, query=None):
+        """Return Client search results for the query.
+
+        Args:
+
+            :query (str): Query string (partial/complete MAC address).
+
+        """
+        return await self.__get('client_search.xml', {'query': query})
+
+    async def client_location(self, mac):
+        """Client location information.
+
+        Args:
+
+            :mac (str): Client device's MAC address.
+
+        """
+        return await self.__get('/visualrf/location.xml', {'mac': mac})
+
+    async def rogue_detail(self, ap_id):
+        """Rogue detail information.
+
+        Args:
+
+            :ap_id (int): Access Point ID.
+
+        """
+        return await self.__get('rogue_detail.xml', {'id': ap_id})
+
+    async def latest_report(self, report_definition_id):
+        """Latest report information.
+
+        Args:
+
+            :report_definition_id (int): Report definition ID.
+
+        """
+        return await self.__get('latest_report.xml',
+                                {'id': report_definition_id})
+
+    async def __get(self, path, params):
+        """GET request with sorted parameters."""
+        url = self.api_path(path)
+        params = [(key, str(value)) for key, value in sorted(params.items())]
+        return await self.request('get', url, params=params)
@@ -4,12 +4,44 @@
 
 
 from collections import OrderedDict
-import xmltodict
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+import hashlib
+import json
+import random
+import threading
+import time
 import requests
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from requests.adapters import HTTPAdapter
 try:
     from urllib.parse import urljoin
+    from urllib.parse import urlparse
 except ImportError:
     from urlparse import urljoin
+    from urlparse import urlparse
+# pylint: disable=import-error,relative-import
+try:
+    from airwaveapiclient.xmlstream import iterparse
+    from airwaveapiclient.xmlstream import parse_lazy
+    from airwaveapiclient.records import AP
+    from airwaveapiclient.graph_data import GraphData
+    from airwaveapiclient import metrics
+    from airwaveapiclient import xmlparse
+except ImportError:
+    from xmlstream import iterparse
+    from xmlstream import parse_lazy
+    from records import AP
+    from graph_data import GraphData
+    import metrics
+    import xmlparse
+
+
+LOGIN_FORM = b'credential_0'
 
 
 class AirWaveAPIClient(object):
@@ -22,6 +54,23 @@ class AirWaveAPIClient(object):
         :password (str): AirWave Login password.
         :url (str): AirWave URL.
         :session (requests.sessions.Session): Session for connection pooling.
+        :pool_connections (int): Number of host pools to cache.
+        :pool_maxsize (int): Maximum connections kept per host.
+        :pool_block (bool): Block when no connection is free.
+        :keep_alive (bool): Reuse connections between requests.
+        :timeout (float or tuple): Connect and read timeouts in seconds.
+        :max_url_length (int): URL length limit of batched id requests.
+        :cache (ResponseCache): Response cache, or None.
+        :graph_data_path (str): Path serving graph data as rrdtool
+            xport XML.
+        :retries (int): Retries of requests failing with a 5xx status,
+            a connection error or a timeout.
+        :backoff (float): Base delay between retries in seconds.
+        :backoff_max (float): Maximum delay between retries in seconds.
+        :relogin (bool): Login again when the session expired.
+        :rate_limit (TokenBucket): Request rate limiter, or None.
+        :concurrency (ConcurrencyLimiter): Adaptive limit of requests
+            in flight, or None.
 
     """
 
@@ -33,6 +82,41 @@ class AirWaveAPIClient(object):
             :username (str): AirWave Login username.
             :password (str): AirWave Login password.
             :url (str): AirWave url.
+            :pool_connections (optional[int]): Number of host pools to
+                cache. Default is 10.
+            :pool_maxsize (optional[int]): Maximum connections kept per
+                host. Size it to the number of threads sharing the
+                client. Default is 10.
+            :pool_block (optional[bool]): Block when no connection is
+                free instead of opening a throwaway one. Default is False.
+            :keep_alive (optional[bool]): Reuse connections between
+                requests. Default is True.
+            :timeout (optional[float or tuple]): Socket timeout, or
+                (connect, read) timeouts in seconds. Default is None.
+            :max_url_length (optional[int]): URL length limit used to
+                split id lists of ap_list_many and folder_list_many.
+                Default is 4000.
+            :cache (optional[ResponseCache]): Cache GET responses.
+                Default is None (no cache).
+            :graph_data_path (optional[str]): Path serving the data of
+                the /nf/rrd_graph graphs as rrdtool xport XML.
+                Default is '/nf/rrd_xport'.
+            :retries (optional[int]): Retries of requests failing with
+                a 5xx status, a connection error or a timeout, waiting
+                a random delay up to backoff * 2 ** retry seconds.
+                Default is 0.
+            :backoff (optional[float]): Base delay between retries in
+                seconds. Default is 0.5.
+            :backoff_max (optional[float]): Maximum delay between
+                retries in seconds. Default is 30.
+            :relogin (optional[bool]): Login again and resend when a
+                request gets the login page because the session
+                expired. Default is True.
+            :rate_limit (optional[TokenBucket]): Limit the request rate.
+                Default is None (no limit).
+            :concurrency (optional[ConcurrencyLimiter]): Adapt the
+                number of requests in flight to the latency and errors
+                of AirWave. Default is None (no limit).
 
         Usage: ::
 
@@ -42,12 +126,63 @@ class AirWaveAPIClient(object):
             >>>                            url='https://192.168.1.1/')
             >>>
 
+            # Tuned for 32 worker threads.
+
+            >>> airwave = AirWaveAPIClient(username='admin',
+            >>>                            password='xxxxx',
+            >>>                            url='https://192.168.1.1/',
+            >>>                            pool_maxsize=32,
+            >>>                            timeout=(5, 60))
+            >>>
+
+            # Long batch jobs, retrying server and connection errors.
+
+            >>> airwave = AirWaveAPIClient(username='admin',
+            >>>                            password='xxxxx',
+            >>>                            url='https://192.168.1.1/',
+            >>>                            retries=5,
+            >>>                            backoff=1)
+            >>>
+
+            # Fan-out jobs sharing the appliance with UI users.
+
+            >>> from airwaveapiclient import ConcurrencyLimiter
+            >>> from airwaveapiclient import TokenBucket
+            >>> airwave = AirWaveAPIClient(username='admin',
+            >>>                            password='xxxxx',
+            >>>                            url='https://192.168.1.1/',
+            >>>                            pool_maxsize=32,
+            >>>                            rate_limit=TokenBucket(50),
+            >>>                            concurrency=ConcurrencyLimiter(
+            >>>                                max_limit=32))
+            >>>
+
 
         """
         self.username = kwargs['username']
         self.password = kwargs['password']
         self.url = kwargs['url']
+        self.pool_connections = kwargs.get('pool_connections', 10)
+        self.pool_maxsize = kwargs.get('pool_maxsize', 10)
+        self.pool_block = kwargs.get('pool_block', False)
+        self.keep_alive = kwargs.get('keep_alive', True)
+        self.timeout = kwargs.get('timeout')
+        self.max_url_length = kwargs.get('max_url_length', 4000)
+        self.cache = kwargs.get('cache')
+        self.graph_data_path = kwargs.get('graph_data_path', '/nf/rrd_xport')
+        self.retries = kwargs.get('retries', 0)
+        self.backoff = kwargs.get('backoff', 0.5)
+        self.backoff_max = kwargs.get('backoff_max', 30)
+        self.relogin = kwargs.get('relogin', True)
+        self.rate_limit = kwargs.get('rate_limit')
+        self.concurrency = kwargs.get('concurrency')
         self.session = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.login_lock = threading.Lock()
+        self.login_generation = 0
+        self.sleep = time.sleep
 
     def login(self):
         """Login to AirWave.
@@ -65,6 +200,17 @@ class AirWaveAPIClient(object):
         """
         requests.packages.urllib3.disable_warnings()
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections,
+                              pool_maxsize=self.pool_maxsize,
+                              pool_block=self.pool_block)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if not self.keep_alive:
+            self.session.headers['Connection'] = 'close'
+        return self.__post_login()
+
+    def __post_login(self):
+        """Post the credentials on the session."""
         url = self.api_path('LOGIN')
         destination = '/'
         next_action = ''
@@ -73,7 +219,7 @@ class AirWaveAPIClient(object):
                   'login': 'Log In',
                   'destination': destination,
                   'next_action': next_action}
-        return self.session.post(url, params=params, verify=False)
+        return self.request('post', url, params=params)
 
     def logout(self):
         """Logout.
@@ -87,6 +233,235 @@ class AirWaveAPIClient(object):
         """
         self.session.close()
 
+    def request(self, method, url, **kwargs):
+        """Send a request on the session.
+
+        All API methods go through here. The configured timeout is
+        applied and certificate verification is disabled. GET requests
+        are answered from the cache when one is configured, except
+        streamed ones. An expired session is renewed with a single
+        login shared by all threads, and failed requests are retried
+        as configured.
+
+        Args:
+
+            :method (str): HTTP method.
+            :url (str): URL.
+            :kwargs: Other arguments of requests.Session.request.
+
+        Returns:
+
+            :Response: requests.models.Response.
+
+        """
+        kwargs.setdefault('verify', False)
+        kwargs.setdefault('timeout', self.timeout)
+        if (self.cache is not None and method.lower() == 'get' and
+                not kwargs.get('stream')):
+            def send(headers):
+                """Send with conditional GET headers."""
+                if headers:
+                    headers.update(kwargs.get('headers') or {})
+                    kwargs['headers'] = headers
+                return self.__send(method, url, **kwargs)
+            return self.cache.request(send, url, kwargs.get('params'))
+        return self.__send(method, url, **kwargs)
+
+    def __send(self, method, url, **kwargs):
+        """Send a request, logging in again and retrying as configured."""
+        attempt = 0
+        relogged = False
+        while True:
+            generation = self.login_generation
+            try:
+                res = self.__send_once(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout):
+                if attempt >= self.retries:
+                    raise
+            else:
+                if (self.relogin and AirWaveAPIClient.session_expired(res) and
+                        url != self.api_path('LOGIN')):
+                    if relogged:
+                        raise requests.exceptions.HTTPError(
+                            'AirWave session expired and login failed.',
+                            response=res)
+                    self.__relogin(generation)
+                    relogged = True
+                    continue
+                if res.status_code < 500 or attempt >= self.retries:
+                    return res
+                res.close()
+            self.sleep(self.backoff_delay(attempt))
+            attempt += 1
+
+    def __relogin(self, generation):
+        """Login again, unless another thread did since generation."""
+        with self.login_lock:
+            if generation == self.login_generation:
+                self.__post_login()
+                self.login_generation += 1
+
+    def backoff_delay(self, attempt):
+        """Delay before a retry, with full jitter.
+
+        Args:
+
+            :attempt (int): Number of the failed attempt, from 0.
+
+        Returns:
+
+            :float: Random delay up to backoff * 2 ** attempt seconds,
+                capped to backoff_max.
+
+        """
+        return random.uniform(0, min(self.backoff_max,
+                                     self.backoff * 2 ** attempt))
+
+    @staticmethod
+    def session_expired(res):
+        """Check if a response is the login page of an expired session.
+
+        AirWave answers API requests of an expired session with its
+        login page and status 200.
+
+        Args:
+
+            :res (requests.models.Response): API response.
+
+        Returns:
+
+            :bool: True for the login page.
+
+        """
+        content_type = res.headers.get('Content-Type', '')
+        if res.status_code != 200 or not content_type.startswith('text/html'):
+            return False
+        return LOGIN_FORM in res.content
+
+    def __send_once(self, method, url, **kwargs):
+        """Send a request on the session, within the configured limits."""
+        if self.rate_limit is not None:
+            self.rate_limit.acquire()
+        if self.concurrency is None:
+            return self.__send_counted(method, url, **kwargs)
+        self.concurrency.acquire()
+        start = time.time()
+        error = True
+        try:
+            res = self.__send_counted(method, url, **kwargs)
+            error = res.status_code >= 500
+            return res
+        finally:
+            self.concurrency.release(time.time() - start, error)
+
+    def __send_counted(self, method, url, **kwargs):
+        """Send a request on the session, counting requests in flight."""
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if metrics.METRICS is None:
+                return self.session.request(method, url, **kwargs)
+            return self.__send_recorded(metrics.METRICS, method, url,
+                                        **kwargs)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def __send_recorded(self, registry, method, url, **kwargs):
+        """Send a request on the session, recording it in registry."""
+        endpoint = urlparse(url).path
+        start = time.time()
+        try:
+            res = self.session.request(method, url, **kwargs)
+        except Exception as err:
+            registry.record_request(method, endpoint, time.time() - start,
+                                    error=err)
+            raise
+        size = res.headers.get('Content-Length')
+        if size is not None:
+            size = int(size)
+        elif not kwargs.get('stream'):
+            size = len(res.content)
+        registry.record_request(method, endpoint, time.time() - start,
+                                status=res.status_code, size=size)
+        return res
+
+    def parse(self, res, cls):
+        """Parse a response.
+
+        With a cache, a response served from it is parsed only once and
+        the same object is returned for later hits.
+
+        Args:
+
+            :res (requests.models.Response): API response.
+            :cls (type): APList, APDetail, FolderList or Report.
+
+        Returns:
+
+            :object: cls(res).
+
+        Usage: ::
+
+            >>> res = airwave.ap_list()
+            >>> objs = airwave.parse(res, APList)
+
+        """
+        if self.cache is not None:
+            return self.cache.parse(res, cls)
+        return cls(res)
+
+    def pool_stats(self):
+        """Connection pool utilization counters.
+
+        Returns:
+
+            :dict: 'in_flight' and 'max_in_flight' request counts of
+                this client, 'concurrency', the ConcurrencyLimiter stats
+                or None, and 'pools', a list of per host dicts with
+                'host', 'maxsize', 'num_connections' (opened so far),
+                'num_requests' and 'idle' (connections ready for reuse).
+
+        Usage: ::
+
+            >>> airwave.pool_stats()
+            {'in_flight': 0,
+             'max_in_flight': 10,
+             'concurrency': None,
+             'pools': [{'host': '192.168.1.1',
+                        'maxsize': 10,
+                        'num_connections': 10,
+                        'num_requests': 1201,
+                        'idle': 10}]}
+
+        """
+        pools = []
+        if self.session is not None:
+            for adapter in set(self.session.adapters.values()):
+                manager = getattr(adapter, 'poolmanager', None)
+                if manager is None:
+                    continue
+                for key in manager.pools.keys():
+                    pool = manager.pools.get(key)
+                    if pool is None or pool.pool is None:
+                        continue
+                    conns = list(pool.pool.queue)
+                    pools.append({'host': pool.host,
+                                  'maxsize': pool.pool.maxsize,
+                                  'num_connections': pool.num_connections,
+                                  'num_requests': pool.num_requests,
+                                  'idle': len([conn for conn in conns
+                                               if conn is not None])})
+        concurrency = None
+        if self.concurrency is not None:
+            concurrency = self.concurrency.stats()
+        return {'in_flight': self.in_flight,
+                'max_in_flight': self.max_in_flight,
+                'concurrency': concurrency,
+                'pools': pools}
+
     def api_path(self, path):
         """API URL.
 
@@ -128,15 +503,17 @@ class AirWaveAPIClient(object):
 
         """
         url = self.api_path('amp_stats.xml')
-        return self.session.get(url, verify=False)
+        return self.request('get', url)
 
-    def ap_list(self, ap_ids=None):
+    def ap_list(self, ap_ids=None, stream=False):
         """Get Access Point list.
 
         Args:
 
             :ap_ids (optional[list]): You may specify multiple
                 Access Point IDs. Default is None.
+            :stream (optional[bool]): Do not download the body up front.
+                Use with APList.iter_from_response. Default is False.
 
         Returns:
 
@@ -160,12 +537,19 @@ class AirWaveAPIClient(object):
             >>> res.text  # xml output.
             '<?xml version="1.0" encoding="utf-8" ...'
 
+            # Stream a large Access Point list.
+
+            >>> res = airwave.ap_list(stream=True)
+            >>> for obj in APList.iter_from_response(res):
+            ...     obj['name']
+            'AP001'
+
         """
         url = self.api_path('ap_list.xml')
         if ap_ids:
             params = AirWaveAPIClient.id_params(ap_ids)
-            return self.session.get(url, verify=False, params=params)
-        return self.session.get(url, verify=False)
+            return self.request('get', url, params=params, stream=stream)
+        return self.request('get', url, stream=stream)
 
     def folder_list(self, folder_ids=None):
         """Get Folders list.
@@ -201,8 +585,93 @@ class AirWaveAPIClient(object):
         url = self.api_path('folder_list.xml')
         if folder_ids:
             params = AirWaveAPIClient.id_params(folder_ids)
-            return self.session.get(url, verify=False, params=params)
-        return self.session.get(url, verify=False)
+            return self.request('get', url, params=params)
+        return self.request('get', url)
+
+    def ap_list_many(self, ap_ids, max_workers=None, typed=False):
+        """Get a large set of Access Points in URL-length-bounded batches.
+
+        The ids are split so that every request URL fits in
+        max_url_length, the batches are requested concurrently and the
+        results are merged in request order.
+
+        Args:
+
+            :ap_ids (list): Access Point IDs.
+            :max_workers (optional[int]): Number of worker threads.
+                Default is pool_maxsize.
+            :typed (optional[bool]): Build typed AP records.
+                Default is False.
+
+        Returns:
+
+            :APList: Access Points of all batches.
+
+        Raises:
+
+            :requests.exceptions.RequestException: A batch failed.
+
+        Usage: ::
+
+            >>> objs = airwave.ap_list_many(range(1, 5001))
+            >>> len(objs)
+            5000
+
+        """
+        def fetch(ids):
+            """Fetch and parse one batch."""
+            res = self.ap_list(ids)
+            res.raise_for_status()
+            return APList(res, typed=typed)
+
+        objs = APList.from_nodes([])
+        for batch in self.__map_id_chunks('ap_list.xml', fetch, ap_ids,
+                                          max_workers):
+            objs.extend(batch)
+        return objs
+
+    def folder_list_many(self, folder_ids, max_workers=None):
+        """Get a large set of Folders in URL-length-bounded batches.
+
+        Args:
+
+            :folder_ids (list): Folder IDs.
+            :max_workers (optional[int]): Number of worker threads.
+                Default is pool_maxsize.
+
+        Returns:
+
+            :FolderList: Folders of all batches, in request order.
+
+        Raises:
+
+            :requests.exceptions.RequestException: A batch failed.
+
+        """
+        def fetch(ids):
+            """Fetch and parse one batch."""
+            res = self.folder_list(ids)
+            res.raise_for_status()
+            return FolderList(res)
+
+        objs = FolderList.from_nodes([])
+        for batch in self.__map_id_chunks('folder_list.xml', fetch,
+                                          folder_ids, max_workers):
+            objs.extend(batch)
+        return objs
+
+    def __map_id_chunks(self, path, func, ids, max_workers):
+        """Apply func to URL-length-bounded id chunks concurrently."""
+        max_length = self.max_url_length - len(self.api_path(path)) - 1
+        chunks = list(AirWaveAPIClient.id_chunks(ids, max_length))
+        if len(chunks) < 2:
+            return [func(chunk) for chunk in chunks]
+        executor = ThreadPoolExecutor(max_workers=max_workers or
+                                      self.pool_maxsize)
+        try:
+            return list(executor.map(func, chunks))
+        finally:
+            executor.shutdown(wait=False)
 
     def ap_detail(self, ap_id):
         """Get Access Point detail information.
@@ -229,7 +698,121 @@ class AirWaveAPIClient(object):
         url = self.api_path('ap_detail.xml')
         params = {'id': ap_id}
         params = AirWaveAPIClient.urlencode(params)
-        return self.session.get(url, verify=False, params=params)
+        return self.request('get', url, params=params)
+
+    def ap_detail_many(self, ap_ids, max_workers=None, typed=False):
+        """Get many Access Point details concurrently.
+
+        Requests are spread across a pool of worker threads sharing the
+        session. Details are yielded as they complete. A failed request
+        does not abort the batch; its exception is yielded instead of
+        the detail.
+
+        Args:
+
+            :ap_ids (list): Access Point IDs.
+            :max_workers (optional[int]): Number of worker threads.
+                Default is pool_maxsize.
+            :typed (optional[bool]): Build typed APDetail objects.
+                Default is False.
+
+        Returns:
+
+            :generator: (ap_id, APDetail or Exception) tuples,
+                in completion order.
+
+        Usage: ::
+
+            >>> for ap_id, obj in airwave.ap_detail_many([1, 2, 3]):
+            ...     if isinstance(obj, Exception):
+            ...         continue
+            ...     ap_id, obj['name']
+            (2, 'AP002')
+            (1, 'AP001')
+            (3, 'AP003')
+
+        """
+        def fetch(ap_id):
+            """Fetch and parse one detail."""
+            res = self.ap_detail(ap_id)
+            res.raise_for_status()
+            return APDetail(res, typed=typed)
+
+        return self.__map_completed(fetch, ap_ids, max_workers)
+
+    def __map_completed(self, func, keys, max_workers):
+        """Yield (key, func(key) or Exception) as the calls complete."""
+        executor = ThreadPoolExecutor(max_workers=max_workers or
+                                      self.pool_maxsize)
+        futures = {}
+        try:
+            for key in keys:
+                futures[executor.submit(func, key)] = key
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as err:  # pylint: disable=broad-except
+                    result = err
+                yield futures[future], result
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def graph_data(self, graph_url):
+        """Get the time series behind an RRD graph.
+
+        The query of the graph URL is sent to graph_data_path.
+
+        Args:
+
+            :graph_url (str): Graph URL from an APGraph method.
+
+        Returns:
+
+            requests.models.Response
+
+        Usage: ::
+
+            >>> ap_graph = APGraph(airwave.url, obj)
+            >>> res = airwave.graph_data(ap_graph.radio_noise_802dot11an())
+            >>> data = GraphData(res)
+
+        """
+        query = urlparse(graph_url).query
+        url = '%s?%s' % (self.api_path(self.graph_data_path), query)
+        return self.request('get', url)
+
+    def graph_data_many(self, graph_urls, max_workers=None):
+        """Get the time series of many RRD graphs concurrently.
+
+        Args:
+
+            :graph_urls (iterable): Graph URLs, such as those of
+                APGraph.bulk_urls.
+            :max_workers (optional[int]): Number of worker threads.
+                Default is pool_maxsize.
+
+        Returns:
+
+            :generator: (graph_url, GraphData or Exception) tuples,
+                in completion order.
+
+        Usage: ::
+
+            >>> urls = [row[3] for row in APGraph.bulk_urls(
+            ...     airwave.url, objs, ['radio_noise'], ['aN'])]
+            >>> for url, data in airwave.graph_data_many(urls):
+            ...     timestamps, values = data.to_numpy()
+
+        """
+        def fetch(graph_url):
+            """Fetch and parse one series."""
+            res = self.graph_data(graph_url)
+            res.raise_for_status()
+            return GraphData(res)
+
+        return self.__map_completed(fetch, graph_urls, max_workers)
 
     def ap_search(self, query=None):
         """Return Access Point search results for the query.
@@ -256,7 +839,7 @@ class AirWaveAPIClient(object):
         url = self.api_path('ap_search.xml')
         params = {'query': query}
         params = AirWaveAPIClient.urlencode(params)
-        return self.session.get(url, verify=False, params=params)
+        return self.request('get', url, params=params)
 
     def client_detail(self, mac):
         """Client detail information.
@@ -283,7 +866,7 @@ class AirWaveAPIClient(object):
         url = self.api_path('client_detail.xml')
         params = {'mac': mac}
         params = AirWaveAPIClient.urlencode(params)
-        return self.session.get(url, verify=False, params=params)
+        return self.request('get', url, params=params)
 
     def client_search(self, query=None):
         """Return Client search results for the query.
@@ -310,7 +893,7 @@ class AirWaveAPIClient(object):
         url = self.api_path('client_search.xml')
         params = {'query': query}
         params = AirWaveAPIClient.urlencode(params)
-        return self.session.get(url, verify=False, params=params)
+        return self.request('get', url, params=params)
 
     def client_location(self, mac):
         """Client detail information.
@@ -337,7 +920,7 @@ class AirWaveAPIClient(object):
         url = self.api_path('/visualrf/location.xml')
         params = {'mac': mac}
         params = AirWaveAPIClient.urlencode(params)
-        return self.session.get(url, verify=False, params=params)
+        return self.request('get', url, params=params)
 
     def rogue_detail(self, ap_id):
         """Rogue detail information.
@@ -362,15 +945,17 @@ class AirWaveAPIClient(object):
         url = self.api_path('rogue_detail.xml')
         params = {'id': ap_id}
         params = AirWaveAPIClient.urlencode(params)
-        return self.session.get(url, verify=False, params=params)
+        return self.request('get', url, params=params)
 
-    def latest_report(self, report_definition_id):
+    def latest_report(self, report_definition_id, stream=False):
         """Latest report information.
 
         Args:
 
             :report_definition_id (int): Report definition ID.
                 Please get it from "https://x.x.x.x/reports_definition".
+            :stream (optional[bool]): Do not download the body up front.
+                Use with Report.iter_from_response. Default is False.
 
         Returns:
 
@@ -386,17 +971,52 @@ class AirWaveAPIClient(object):
             >>> res.text
             '<?xml version="1.0" encoding="utf-8" ...'
 
+            # Stream a large report.
+
+            >>> res = airwave.latest_report(123, stream=True)
+            >>> for section, row in Report.iter_from_response(res):
+            ...     section, row['@ap_id']
+            ('pickled_ap_summary', '1')
+
         """
         url = self.api_path('latest_report.xml')
         params = {'id': report_definition_id}
         params = AirWaveAPIClient.urlencode(params)
-        return self.session.get(url, verify=False, params=params)
+        return self.request('get', url, params=params, stream=stream)
 
     @staticmethod
     def id_params(ap_ids):
         """Make access point id string."""
         return '&'.join(["id=%s" % ap_id for ap_id in ap_ids])
 
+    @staticmethod
+    def id_chunks(ids, max_length):
+        """Split ids into lists whose id string fits in max_length.
+
+        Args:
+
+            :ids (list): Access Point or Folder IDs.
+            :max_length (int): Maximum length of the id_params string.
+
+        Returns:
+
+            :generator: Lists of ids, in order. An id longer than
+                max_length gets a list of its own.
+
+        """
+        chunk = []
+        length = -1
+        for value in ids:
+            size = len('id=%s' % value) + 1
+            if chunk and length + size > max_length:
+                yield chunk
+                chunk = []
+                length = -1
+            chunk.append(value)
+            length += size
+        if chunk:
+            yield chunk
+
     @staticmethod
     def urlencode(params):
         """URL Encode."""
@@ -404,19 +1024,37 @@ class AirWaveAPIClient(object):
         return requests.packages.urllib3.request.urlencode(params)
 
 
+APListDiff = namedtuple('APListDiff', ['added', 'removed', 'changed'])
+
+
 class APList(list):
 
     """Access Point List.
 
     This class inherits the list class.
 
+    Attributes:
+
+        :INDEX_FIELDS (tuple): Fields searchable with search_by.
+
     """
-    def __init__(self, xml):
+
+    INDEX_FIELDS = ('@id', 'name', 'lan_mac', 'lan_ip',
+                    'serial_number', 'radio_mac')
+
+    _indexes = None
+
+    @metrics.timed_parse
+    def __init__(self, xml, typed=False):
         """Initialize APList.
 
         Args:
 
-            :xml (str): XML string.
+            :xml (str, bytes or requests.models.Response): XML document.
+                A Response or bytes is parsed without decoding it first.
+            :typed (optional[bool]): Build compact AP records with
+                converted values instead of OrderedDict nodes.
+                Default is False.
 
         Usage: ::
 
@@ -435,11 +1073,76 @@ class APList(list):
             'ID:2, AP002'
             'ID:3, AP003'
 
+            # Compact typed records.
+
+            >>> objs = APList(res.text, typed=True)
+            >>> objs[0].id, objs[0]['@id'], objs[0].radio[0].radio_type
+            (1, 1, 'bgn')
+
         """
-        data = xmltodict.parse(xml)
-        if 'ap' in data['amp:amp_ap_list']:
-            obj = data['amp:amp_ap_list']['ap']
-            list.__init__(self, obj)
+        if typed:
+            nodes = iterparse(xmlparse.document(xml), depth=2, tags=['ap'])
+            list.__init__(self, [AP.from_dict(node) for _, node in nodes])
+            return
+        data = xmlparse.parse(xml)
+        root = data['amp:amp_ap_list'] or {}
+        obj = root.get('ap', [])
+        if not isinstance(obj, list):
+            obj = [obj]
+        list.__init__(self, obj)
+
+    @classmethod
+    def from_nodes(cls, nodes):
+        """Create APList from Access Point nodes.
+
+        Args:
+
+            :nodes (iterable): APList elements or AP records.
+
+        Returns:
+
+            :APList: New list holding the nodes.
+
+        """
+        obj = cls.__new__(cls)
+        list.__init__(obj, nodes)
+        return obj
+
+    @staticmethod
+    def iter_from_response(res, chunk_size=65536, typed=False):
+        """Iterate Access Points from a streamed response.
+
+        The body is fed to an incremental parser chunk by chunk, so only
+        one <ap> element is held in memory at a time.
+
+        Args:
+
+            :res (requests.models.Response): Response of ap_list,
+                preferably requested with stream=True.
+            :chunk_size (optional[int]): Bytes read per chunk.
+                Default is 65536.
+            :typed (optional[bool]): Yield compact AP records.
+                Default is False.
+
+        Returns:
+
+            :generator: Access Point nodes, in the same form as the
+                elements of APList.
+
+        Usage: ::
+
+            >>> res = airwave.ap_list(stream=True)
+            >>> for obj in APList.iter_from_response(res):
+            ...     'ID:%s, %s' % (obj['@id'], obj['name'])
+            'ID:1, AP001'
+            'ID:2, AP002'
+
+        """
+        chunks = res.iter_content(chunk_size)
+        for _, node in iterparse(chunks, depth=2, tags=['ap']):
+            if typed:
+                node = AP.from_dict(node)
+            yield node
 
     def search(self, obj):
         """Search Access Point.
@@ -453,16 +1156,281 @@ class APList(list):
 
         """
         if isinstance(obj, int):
-            for node in self:
-                if int(node['@id']) == obj:
-                    return node
+            return self.search_by('@id', obj)
 
         if isinstance(obj, str):
-            for node in self:
-                if node['name'] == obj:
-                    return node
+            return self.search_by('name', obj)
         return None
 
+    def search_by(self, field, value):
+        """Search Access Point by an indexed field.
+
+        The index for the field is built on first use and dropped when
+        the list is modified, so repeated lookups are O(1).
+        Search Logic is a complete match. The first matching node in
+        list order is returned.
+
+        Args:
+
+            :field (str): One of '@id', 'name', 'lan_mac', 'lan_ip',
+                'serial_number' or 'radio_mac'.
+            :value (str or int): Field value.
+
+        Returns:
+
+            :OrderedDict: Access Point node, or None.
+
+        Usage: ::
+
+            >>> objs.search_by('lan_mac', '00:00:10:00:00:01')['name']
+            'AP001'
+            >>> objs.search_by('radio_mac', '10:00:00:00:00:02')['name']
+            'AP001'
+
+        """
+        if field not in APList.INDEX_FIELDS:
+            raise ValueError('Field %r is not indexed.' % field)
+        if field == '@id':
+            value = int(value)
+        return self.__index(field).get(value)
+
+    def diff(self, other):
+        """Compare with a later Access Point list.
+
+        Access Points are matched by id through the id index and
+        compared by content hash, so the cost is linear. Field paths
+        are only worked out for Access Points whose hash differs.
+        Radios are matched by their index attribute. As for search_by,
+        the id index is not refreshed when a node is edited in place.
+
+        Args:
+
+            :other (APList): Later Access Point list.
+
+        Returns:
+
+            :APListDiff: Named tuple of added (nodes only in other),
+                removed (nodes only in self) and changed, a list of
+                (old node, new node, field paths) tuples.
+
+        Usage: ::
+
+            >>> delta = old.diff(new)
+            >>> [node['name'] for node in delta.added]
+            ['AP005']
+            >>> for old_node, new_node, paths in delta.changed:
+            ...     new_node['name'], paths
+            ('AP001', ['is_up', 'radio[2].display_channel'])
+
+        """
+        old_index = self.__index('@id')
+        new_index = other.__index('@id')
+        added = []
+        changed = []
+        for ap_id, node in new_index.items():
+            old_node = old_index.get(ap_id)
+            if old_node is None:
+                added.append(node)
+            elif APList.__hash(old_node) != APList.__hash(node):
+                changed.append((old_node, node,
+                                APList.__diff_paths(old_node, node, '')))
+        removed = [node for ap_id, node in old_index.items()
+                   if ap_id not in new_index]
+        return APListDiff(added, removed, changed)
+
+    @staticmethod
+    def __hash(node):
+        """Content hash of a node."""
+        data = json.dumps(node, sort_keys=True,
+                          default=lambda obj: obj.to_dict())
+        return hashlib.sha1(data.encode('utf-8')).digest()
+
+    @staticmethod
+    def __diff_paths(old, new, prefix):
+        """Field paths whose values differ between two nodes."""
+        paths = []
+        keys = list(old.keys())
+        keys.extend(key for key in new.keys() if key not in old)
+        for key in keys:
+            path = prefix + key
+            old_value = old.get(key)
+            new_value = new.get(key)
+            if old_value == new_value:
+                continue
+            if key == 'radio':
+                paths.extend(APList.__diff_radios(old_value, new_value,
+                                                  path))
+            elif (hasattr(old_value, 'keys') and
+                  hasattr(new_value, 'keys')):
+                paths.extend(APList.__diff_paths(old_value, new_value,
+                                                 path + '.'))
+            else:
+                paths.append(path)
+        return paths
+
+    @staticmethod
+    def __diff_radios(old, new, prefix):
+        """Field paths whose values differ between radios by index."""
+        radios = []
+        for value in (old, new):
+            if value is None:
+                value = []
+            elif not isinstance(value, list):
+                value = [value]
+            radios.append(OrderedDict((str(radio.get('@index')), radio)
+                                      for radio in value))
+        old_radios, new_radios = radios
+        paths = []
+        keys = list(old_radios)
+        keys.extend(key for key in new_radios if key not in old_radios)
+        for key in keys:
+            path = '%s[%s]' % (prefix, key)
+            if key not in old_radios or key not in new_radios:
+                paths.append(path)
+            else:
+                paths.extend(APList.__diff_paths(old_radios[key],
+                                                 new_radios[key],
+                                                 path + '.'))
+        return paths
+
+    def __index(self, field):
+        """Return the field index, building it if necessary."""
+        if self._indexes is None:
+            self._indexes = {}
+        index = self._indexes.get(field)
+        if index is None:
+            index = OrderedDict()
+            for node in self:
+                for key in APList.__index_keys(node, field):
+                    index.setdefault(key, node)
+            self._indexes[field] = index
+        return index
+
+    @staticmethod
+    def __index_keys(node, field):
+        """Index keys of a node for the field."""
+        if field == '@id':
+            return [int(node['@id'])]
+        if field == 'radio_mac':
+            radios = node.get('radio') or []
+            if not isinstance(radios, list):
+                radios = [radios]
+            return [radio['radio_mac'] for radio in radios
+                    if radio.get('radio_mac') is not None]
+        value = node.get(field)
+        if value is None:
+            return []
+        return [value]
+
+    def __setitem__(self, key, value):
+        """Set item and invalidate indexes."""
+        self._indexes = None
+        list.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        """Delete item and invalidate indexes."""
+        self._indexes = None
+        list.__delitem__(self, key)
+
+    def __iadd__(self, other):
+        """Extend in place and invalidate indexes."""
+        self._indexes = None
+        return list.__iadd__(self, other)
+
+    def __imul__(self, other):
+        """Repeat in place and invalidate indexes."""
+        self._indexes = None
+        return list.__imul__(self, other)
+
+    def append(self, node):
+        """Append node and invalidate indexes."""
+        self._indexes = None
+        list.append(self, node)
+
+    def extend(self, nodes):
+        """Extend nodes and invalidate indexes."""
+        self._indexes = None
+        list.extend(self, nodes)
+
+    def insert(self, index, node):
+        """Insert node and invalidate indexes."""
+        self._indexes = None
+        list.insert(self, index, node)
+
+    def remove(self, node):
+        """Remove node and invalidate indexes."""
+        self._indexes = None
+        list.remove(self, node)
+
+    def pop(self, index=-1):
+        """Pop node and invalidate indexes."""
+        self._indexes = None
+        return list.pop(self, index)
+
+    def clear(self):
+        """Remove all nodes and invalidate indexes."""
+        self._indexes = None
+        del self[:]
+
+    def sort(self, *args, **kwargs):
+        """Sort nodes in place and invalidate indexes."""
+        self._indexes = None
+        list.sort(self, *args, **kwargs)
+
+    def reverse(self):
+        """Reverse nodes in place and invalidate indexes."""
+        self._indexes = None
+        list.reverse(self)
+
+
+class FolderList(list):
+
+    """Folder List.
+
+    This class inherits the list class.
+
+    """
+    def __init__(self, xml):
+        """Initialize FolderList.
+
+        Args:
+
+            :xml (str, bytes or requests.models.Response): XML document.
+                A Response or bytes is parsed without decoding it first.
+
+        Usage: ::
+
+            >>> res = airwave.folder_list()
+            >>> objs = FolderList(res.text)
+            >>> for obj in objs:
+            ...     'ID:%s, %s' % (obj['@id'], obj['name'])
+            'ID:1, Top'
+
+        """
+        data = xmlparse.parse(xml)
+        root = data['amp:amp_folder_list'] or {}
+        obj = root.get('folder', [])
+        if not isinstance(obj, list):
+            obj = [obj]
+        list.__init__(self, obj)
+
+    @classmethod
+    def from_nodes(cls, nodes):
+        """Create FolderList from Folder nodes.
+
+        Args:
+
+            :nodes (iterable): FolderList elements.
+
+        Returns:
+
+            :FolderList: New list holding the nodes.
+
+        """
+        obj = cls.__new__(cls)
+        list.__init__(obj, nodes)
+        return obj
+
 
 class APDetail(OrderedDict):
 
@@ -471,12 +1439,23 @@ class APDetail(OrderedDict):
     This class inherits the OrderedDict class.
 
     """
-    def __init__(self, xml):
+    LAZY_TAGS = ('client', 'neighbor_ap')
+
+    @metrics.timed_parse
+    def __init__(self, xml, typed=False, lazy=False):
         """Initialize APDetail.
 
         Args:
 
-            :xml (str): XML string.
+            :xml (str, bytes or requests.models.Response): XML document.
+                A Response or bytes is parsed without decoding it first.
+            :typed (optional[bool]): Build radios, clients and neighbor
+                access points as compact Radio, Client and NeighborAP
+                records with converted values. Default is False.
+            :lazy (optional[bool]): Keep the client and neighbor_ap
+                elements of each radio unparsed until they are read.
+                They are then LazyElements, read like lists. Cannot be
+                combined with typed. Default is False.
 
         Usage: ::
 
@@ -498,11 +1477,55 @@ class APDetail(OrderedDict):
             'ID:11000002, SIGNAL:-50, SNR:44'
             'ID:11000003, SIGNAL:-56, SNR:38'
 
+            # Compact typed records.
+
+            >>> obj = APDetail(res.text, typed=True)
+            >>> obj['radio'][0]['client'][0].snr
+            51
+
+            # Parse clients and neighbors only when they are read.
+
+            >>> obj = APDetail(res.content, lazy=True)
+            >>> obj['radio'][0]['neighbor_ap']
+            <LazyElements: 120 unparsed>
+            >>> obj['radio'][0]['client'][0]['snr']
+            '51'
+
         """
-        data = xmltodict.parse(xml)
+        if lazy:
+            if typed:
+                raise ValueError('typed and lazy cannot be combined.')
+            for _, node in parse_lazy(xmlparse.document(xml), depth=2,
+                                      tags=['ap'],
+                                      lazy_tags=APDetail.LAZY_TAGS):
+                OrderedDict.__init__(self, node)
+            return
+        if typed:
+            for _, node in iterparse(xmlparse.document(xml), depth=2,
+                                     tags=['ap']):
+                OrderedDict.__init__(self, AP.from_dict(node).items())
+            return
+        data = xmlparse.parse(xml)
         obj = data['amp:amp_ap_detail']['ap']
         OrderedDict.__init__(self, obj)
 
+    @classmethod
+    def from_dict(cls, node):
+        """Create APDetail from an Access Point detail node.
+
+        Args:
+
+            :node (dict): Detail node, or a typed AP record.
+
+        Returns:
+
+            :APDetail: New detail holding the node items.
+
+        """
+        obj = cls.__new__(cls)
+        OrderedDict.__init__(obj, node.items())
+        return obj
+
 
 class Report(OrderedDict):
 
@@ -511,12 +1534,14 @@ class Report(OrderedDict):
     This class inherits the OrderedDict class.
 
     """
+    @metrics.timed_parse
     def __init__(self, xml):
         """Initialize Report.
 
         Args:
 
-            :xml (str): XML string.
+            :xml (str, bytes or requests.models.Response): XML document.
+                A Response or bytes is parsed without decoding it first.
 
         Usage: ::
 
@@ -551,6 +1576,111 @@ class Report(OrderedDict):
                                     ...
 
         """
-        data = xmltodict.parse(xml)
+        data = xmlparse.parse(xml)
         obj = data['amp:report']
         OrderedDict.__init__(self, obj)
+
+    @staticmethod
+    def iter_from_response(res, sections=None, chunk_size=65536):
+        """Iterate report rows from a streamed response.
+
+        The body is fed to an incremental parser chunk by chunk, so only
+        one row is held in memory at a time. Rows of the sections not
+        asked for are skipped without building objects.
+
+        Args:
+
+            :res (requests.models.Response): Response of latest_report,
+                preferably requested with stream=True.
+            :sections (optional[iterable]): Section names such as
+                'pickled_ap_summary'. Default is None (all sections).
+            :chunk_size (optional[int]): Bytes read per chunk.
+                Default is 65536.
+
+        Returns:
+
+            :generator: (section, row) pairs in document order. Rows
+                have the same form as the elements of Report sections.
+
+        Usage: ::
+
+            >>> res = airwave.latest_report(123, stream=True)
+            >>> rows = Report.iter_from_response(
+            ...     res, sections=['pickled_rf_health'])
+            >>> for section, row in rows:
+            ...     row['@ap_name'], row['@average_noise']
+            ('AP001', '-80')
+
+        """
+        chunks = res.iter_content(chunk_size)
+        return iterparse(chunks, depth=2, tags=sections)
+
+    def table(self, section):
+        """Columnar view of a report section. Requires numpy.
+
+        The attribute values of all columns are gathered in one pass
+        over the rows, then each column is converted in one step to
+        int64, float64 (NaN for missing values) or, failing both, a
+        text array. Rows without attributes count as empty rows.
+
+        Args:
+
+            :section (str): Section name such as 'pickled_ap_summary'.
+
+        Returns:
+
+            :OrderedDict: numpy.ndarray columns keyed by attribute name
+                without '@'.
+
+        Usage: ::
+
+            >>> table = Report(res.text).table('pickled_ap_summary')
+            >>> table['avg_bw'].mean()
+            20.0
+            >>> table['name'][table['total_users'] > 10]
+            array(['AP002', 'AP003'], dtype='<U5')
+
+        """
+        if numpy is None:
+            raise ImportError('Report.table requires numpy.')
+        rows = self.get(section) or []
+        if not isinstance(rows, list):
+            rows = [rows]
+        columns = OrderedDict()
+        items = []
+        last = None
+        for index, row in enumerate(rows):
+            if not hasattr(row, 'keys'):
+                row = {}
+            row_keys = row.keys()
+            if row_keys != last:
+                for key in row_keys:
+                    if key[:1] == '@' and key not in columns:
+                        columns[key] = [None] * index
+                items = list(columns.items())
+                last = row_keys
+            for key, column in items:
+                column.append(row.get(key))
+        table = OrderedDict()
+        for key, column in items:
+            table[key[1:]] = Report.__typed_column(column)
+        return table
+
+    @staticmethod
+    def __typed_column(values):
+        """Convert attribute values to an int, float or text array."""
+        present = [value for value in values if value]
+        if not present:
+            return numpy.array([value or '' for value in values])
+        if len(present) == len(values):
+            numbers = values
+            try:
+                return numpy.array(numbers, dtype='int64')
+            except (ValueError, OverflowError):
+                pass
+        else:
+            numbers = [value or 'nan' for value in values]
+        try:
+            return numpy.array(numbers, dtype='float64')
+        except (ValueError, OverflowError):
+            return numpy.array([value or '' for value in values])
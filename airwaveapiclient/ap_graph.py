@@ -9,6 +9,19 @@ import requests
 from requests.compat import urljoin
 
 
+TIME_PATTERN = re.compile(r'(-?\d+)')
+TYPE_PARAMS = {}
+
+
+def type_param(graph_type):
+    """Encoded type query parameter, memoized by graph type."""
+    param = TYPE_PARAMS.get(graph_type)
+    if param is None:
+        param = APGraph.urlencode({'type': graph_type})
+        TYPE_PARAMS[graph_type] = param
+    return param
+
+
 class APGraph(OrderedDict):
 
     """Aruba networks AirWave Graph.
@@ -19,9 +32,22 @@ class APGraph(OrderedDict):
         :path (str): Graph path.
         :default_start_time(int): Graph start default time.
         :default_end_time(int): Graph end default time.
+        :PATH (str): Default graph path.
+        :DEFAULT_START_TIME (int): Default of default_start_time.
+        :DEFAULT_END_TIME (int): Default of default_end_time.
+        :AP_GRAPH_TYPES (tuple): Graph types keyed by Access Point id.
+        :RADIO_GRAPH_TYPES (tuple): Graph types keyed by LAN MAC address.
 
     """
 
+    PATH = '/nf/rrd_graph'
+    DEFAULT_START_TIME = -7200
+    DEFAULT_END_TIME = 0
+    AP_GRAPH_TYPES = (u'ap_client_count', u'ap_bandwidth', u'dot11_counters')
+    RADIO_GRAPH_TYPES = (u'radio_channel', u'radio_noise', u'radio_power',
+                         u'radio_errors', u'radio_goodput',
+                         u'channel_utilization')
+
     def __init__(self, url, obj):
         """Initialize AirWaveAPIClient.
 
@@ -60,29 +86,70 @@ class APGraph(OrderedDict):
 
         """
         self.url = url
-        self.path = '/nf/rrd_graph'
-        self.default_start_time = -7200
-        self.default_end_time = 0
+        self.path = APGraph.PATH
+        self.default_start_time = APGraph.DEFAULT_START_TIME
+        self.default_end_time = APGraph.DEFAULT_END_TIME
+        self.__radios = None
+        self.__parts = {}
         OrderedDict.__init__(self, obj)
 
-    def __graph_url(self, params):
-        """RRD Graph URL."""
-        if 'radio_index' in params:
-            start = params['start']
-            if not start:
-                start = self.default_start_time
+    def __setitem__(self, key, value):
+        """Set item, dropping the radio map and URL parts it changes."""
+        if key in ('@id', 'lan_mac', 'radio'):
+            self.__radios = None
+            self.__parts = {}
+        OrderedDict.__setitem__(self, key, value)
+
+    def __radio(self, radio_type):
+        """(index, interface) of the radio type, from the radio map."""
+        if self.__radios is None:
+            self.__radios = APGraph.radio_map(self)
+        return self.__radios.get(radio_type)
+
+    def __cached_url(self, graph_type, radio_type, key, start, end):
+        """RRD Graph URL from the cached parts of the radio.
+
+        Args:
+
+            :graph_type (str): Graph type.
+            :radio_type (str): Radio type.
+            :key (str): 'id' for access point graphs, 'ap_uid' for
+                radio graphs.
+            :start (int, optional): Graph start time(seconds ago).
+                Default is default_start_time.
+            :end (int, optional): Graph end time(seconds ago).
+                Default is default_end_time.
 
-            end = params['end']
-            if not end:
-                end = self.default_end_time
+        Returns:
 
-            params['start'] = APGraph.graph_time_format(start)
-            params['end'] = APGraph.graph_time_format(end)
+            :str: Graph URL string with the query parameters sorted by
+                key, or None if the Access Point has no such radio.
 
-            params = APGraph.urlencode(params)
-            path = urljoin(self.url, self.path)
-            return u'%s?%s' % (path, params)
-        return None
+        """
+        cache_key = (radio_type, key, self.url, self.path)
+        parts = self.__parts.get(cache_key)
+        if parts is None:
+            radio = self.__radio(radio_type)
+            if radio is None:
+                return None
+            params = {'radio_index': radio[0]}
+            if key == 'ap_uid':
+                if radio[1] is None:
+                    raise KeyError('radio_interface')
+                params['ap_uid'] = self['lan_mac']
+                params['radio_interface'] = radio[1]
+            else:
+                params['id'] = self['@id']
+            parts = APGraph.url_parts(urljoin(self.url, self.path), params)
+            self.__parts[cache_key] = parts
+
+        if not start:
+            start = self.default_start_time
+        if not end:
+            end = self.default_end_time
+        return u'%s%s%s%s&%s' % (parts[0], APGraph.graph_time_format(end),
+                                 parts[1], APGraph.graph_time_format(start),
+                                 type_param(graph_type))
 
     def __ap_graph(self, graph_type, radio_type, start, end):
         """RRD access point graph base method.
@@ -101,21 +168,7 @@ class APGraph(OrderedDict):
             :str: Graph URL string.
 
         """
-        params = {}
-        params['type'] = graph_type
-        params['id'] = self['@id']
-        if 'radio' in self:
-            radios = self['radio']
-            if not isinstance(radios, list):
-                radios = [radios]
-            for radio in radios:
-                if 'radio_type' in radio:
-                    if radio['radio_type'] == radio_type:
-                        params['radio_index'] = radio['@index']
-                        params['start'] = start
-                        params['end'] = end
-                        return self.__graph_url(params)
-        return None
+        return self.__cached_url(graph_type, radio_type, 'id', start, end)
 
     def client_count_802dot11bgn(self, start=None, end=None):
         """RRD graph URL for access point client count of radio type IEEE802.11BGN.
@@ -341,22 +394,7 @@ class APGraph(OrderedDict):
             :str: Graph URL string.
 
         """
-        params = {}
-        params['type'] = graph_type
-        params['ap_uid'] = self['lan_mac']
-        if 'radio' in self:
-            radios = self['radio']
-            if not isinstance(radios, list):
-                radios = [radios]
-            for radio in radios:
-                if 'radio_type' in radio:
-                    if radio['radio_type'] == radio_type:
-                        params['radio_index'] = radio['@index']
-                        params['radio_interface'] = radio['radio_interface']
-                        params['start'] = start
-                        params['end'] = end
-                        return self.__graph_url(params)
-        return None
+        return self.__cached_url(graph_type, radio_type, 'ap_uid', start, end)
 
     def radio_channel_802dot11bgn(self, start=None, end=None):
         """RRD graph URL for radio channel for radio type IEEE802.11BGN.
@@ -790,6 +828,145 @@ class APGraph(OrderedDict):
         """
         return self.__radio_graph(u'channel_utilization', u'ac', start, end)
 
+    @staticmethod
+    def radio_map(node):
+        """Map radio types to the (index, interface) of their first radio.
+
+        Args:
+
+            :node (dict): APList element, node or AP record.
+
+        Returns:
+
+            :dict: {radio_type: (radio index, radio interface)}. The
+                interface is None when the radio has none.
+
+        """
+        radios = node.get('radio')
+        if not radios:
+            return {}
+        if not isinstance(radios, list):
+            radios = [radios]
+        radio_map = {}
+        for radio in radios:
+            radio_type = radio.get('radio_type')
+            if radio_type is not None and radio_type not in radio_map:
+                radio_map[radio_type] = (radio['@index'],
+                                         radio.get('radio_interface'))
+        return radio_map
+
+    @classmethod
+    def bulk_urls(cls, url, ap_list, graph_types=None,
+                  radio_types=(u'bgn', u'aN', u'ac'), start=None, end=None):
+        """RRD graph URLs for many Access Points at once.
+
+        Each Access Point is read in place and its radios are walked
+        once. The graph path, the times and the per-radio part of the
+        query are encoded once, so each URL is a string join. URLs are
+        the same as those of the per-graph methods.
+
+        Args:
+
+            :url (str): AirWave URL.
+            :ap_list (iterable): APList, or Access Point nodes or records.
+            :graph_types (optional[iterable]): Graph types such as
+                'ap_client_count' or 'radio_noise'.
+                Default is None (all of AP_GRAPH_TYPES and
+                RADIO_GRAPH_TYPES).
+            :radio_types (optional[iterable]): Radio types.
+                Default is ('bgn', 'aN', 'ac').
+            :start (int, optional): Graph start time(seconds ago).
+                Default is -7200.
+            :end (int, optional): Graph end time(seconds ago).
+                Default is 0.
+
+        Returns:
+
+            :generator: (ap_id, graph_type, radio_type, url) tuples.
+                Radio types an Access Point does not have are skipped,
+                and so are Access Points without an @id and radio
+                graphs without a lan_mac or radio_interface.
+
+        Usage: ::
+
+            >>> for row in APGraph.bulk_urls(url, APList(res.text),
+            ...                              ['ap_client_count'], ['bgn']):
+            ...     row
+            ('1', 'ap_client_count', 'bgn', 'https://x.x.x.x/nf/rrd_graph?
+                end=0s&id=1&radio_index=1&start=-7200s&type=ap_client_count')
+
+        """
+        if graph_types is None:
+            graph_types = cls.AP_GRAPH_TYPES + cls.RADIO_GRAPH_TYPES
+        ap_types = []
+        radio_graph_types = []
+        for graph_type in graph_types:
+            if graph_type in cls.RADIO_GRAPH_TYPES:
+                radio_graph_types.append((graph_type, type_param(graph_type)))
+            else:
+                ap_types.append((graph_type, type_param(graph_type)))
+        radio_types = list(radio_types)
+        base = u'%s?' % urljoin(url, cls.PATH)
+        end = u'end=' + APGraph.graph_time_format(
+            end or cls.DEFAULT_END_TIME)
+        start = u'start=' + APGraph.graph_time_format(
+            start or cls.DEFAULT_START_TIME)
+
+        for node in ap_list:
+            ap_id = node.get('@id')
+            if ap_id is None:
+                continue
+            by_type = APGraph.radio_map(node)
+            if not by_type:
+                continue
+            ap_part = APGraph.urlencode({'id': ap_id})
+            lan_mac = node.get('lan_mac')
+            uid_part = APGraph.urlencode({'ap_uid': lan_mac})
+            for radio_type in radio_types:
+                radio = by_type.get(radio_type)
+                if radio is None:
+                    continue
+                index = APGraph.urlencode({'radio_index': radio[0]})
+                if ap_types:
+                    prefix = u'&'.join((base + end, ap_part, index, start))
+                    for graph_type, param in ap_types:
+                        yield (ap_id, graph_type, radio_type,
+                               u'%s&%s' % (prefix, param))
+                if (radio_graph_types and lan_mac is not None and
+                        radio[1] is not None):
+                    interface = APGraph.urlencode(
+                        {'radio_interface': radio[1]})
+                    prefix = u'&'.join((base + uid_part, end, index,
+                                        interface, start))
+                    for graph_type, param in radio_graph_types:
+                        yield (ap_id, graph_type, radio_type,
+                               u'%s&%s' % (prefix, param))
+
+    @staticmethod
+    def url_parts(path, params):
+        """Encode the graph URL parts around the end and start times.
+
+        Query parameters are sorted by key, so a graph URL is
+        head + end + middle + start + '&' + type.
+
+        Args:
+
+            :path (str): Graph URL without the query.
+            :params (dict): Query parameters other than end, start and
+                type.
+
+        Returns:
+
+            :tuple: (head, middle) strings.
+
+        """
+        head = dict((k, v) for k, v in params.items() if k < 'end')
+        middle = dict((k, v) for k, v in params.items()
+                      if 'end' < k < 'start')
+        head = APGraph.urlencode(head) + '&' if head else u''
+        middle = '&' + APGraph.urlencode(middle) if middle else u''
+        return (u'%s?%send=' % (path, head), u'%s&start=' % middle)
+
     @staticmethod
     def urlencode(params):
         """URL Encode."""
@@ -799,8 +976,9 @@ class APGraph(OrderedDict):
     @staticmethod
     def graph_time_format(seconds):
         """Graph time format."""
-        pat = re.compile(r'(-?\d+)')
-        res = pat.search(str(seconds))
+        if isinstance(seconds, int) and not isinstance(seconds, bool):
+            return '%ds' % seconds
+        res = TIME_PATTERN.search(str(seconds))
         num = 0
         if res:
             num = res.group(0)
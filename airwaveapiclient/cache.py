@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.cache"""
+
+
+from collections import OrderedDict
+import threading
+import time
+from requests.models import PreparedRequest
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+
+class CacheEntry(object):
+
+    """Cached response with its expiry time and parsed objects."""
+
+    __slots__ = ('response', 'expires', 'parsed')
+
+    def __init__(self, response, expires):
+        """Initialize CacheEntry."""
+        self.response = response
+        self.expires = expires
+        self.parsed = {}
+
+    def validators(self):
+        """Conditional GET headers for revalidation."""
+        headers = {}
+        etag = self.response.headers.get('ETag')
+        if etag:
+            headers['If-None-Match'] = etag
+        modified = self.response.headers.get('Last-Modified')
+        if modified:
+            headers['If-Modified-Since'] = modified
+        return headers
+
+
+class ResponseCache(object):
+
+    """LRU cache of API responses and of the objects parsed from them.
+
+    Responses are keyed by endpoint and query parameters. An expired
+    response carrying ETag or Last-Modified is revalidated with a
+    conditional GET, and a 304 answer renews it without a download.
+
+    Attributes:
+
+        :ttl (dict): Seconds to keep responses, by API path.
+        :default_ttl (int): Seconds for API paths not in ttl.
+            0 disables caching for them.
+        :maxsize (int): Maximum number of responses kept.
+        :hits (int): Requests answered from the cache.
+        :misses (int): Requests sent to AirWave.
+        :revalidations (int): Expired responses renewed by a 304.
+
+    """
+
+    def __init__(self, ttl=None, default_ttl=0, maxsize=128):
+        """Initialize ResponseCache.
+
+        Args:
+
+            :ttl (optional[dict]): Seconds to keep responses, by API
+                path such as 'ap_list.xml'. Default is None.
+            :default_ttl (optional[int]): Seconds for other API paths.
+                Default is 0 (not cached).
+            :maxsize (optional[int]): Maximum number of responses kept.
+                Default is 128.
+
+        Usage: ::
+
+            >>> from airwaveapiclient import AirWaveAPIClient
+            >>> from airwaveapiclient import ResponseCache
+            >>> cache = ResponseCache(ttl={'ap_list.xml': 60,
+            ...                            'folder_list.xml': 300,
+            ...                            'amp_stats.xml': 30})
+            >>> airwave = AirWaveAPIClient(username='admin',
+            >>>                            password='xxxxx',
+            >>>                            url='https://192.168.1.1/',
+            >>>                            cache=cache)
+
+        """
+        self.ttl = dict(ttl or {})
+        self.default_ttl = default_ttl
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.clock = time.time
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    def ttl_for(self, url):
+        """Seconds to keep responses of the URL."""
+        path = urlparse(url).path
+        for endpoint, ttl in self.ttl.items():
+            if path.endswith('/' + endpoint.lstrip('/')):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def key(url, params=None):
+        """Cache key, the full request URL."""
+        prepared = PreparedRequest()
+        prepared.prepare_url(url, params)
+        return prepared.url
+
+    def request(self, send, url, params=None):
+        """Answer a GET request from the cache or through send.
+
+        Args:
+
+            :send (callable): send(headers) sends the request with the
+                extra headers and returns the Response.
+            :url (str): URL.
+            :params (optional[dict or str]): Query parameters.
+
+        Returns:
+
+            :Response: requests.models.Response.
+
+        """
+        ttl = self.ttl_for(url)
+        if ttl <= 0:
+            return send({})
+        key = ResponseCache.key(url, params)
+        headers = {}
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry.expires > self.clock():
+                    self.entries.pop(key)
+                    self.entries[key] = entry
+                    self.hits += 1
+                    return entry.response
+                headers = entry.validators()
+                if not headers:
+                    self.entries.pop(key)
+                    entry = None
+            self.misses += 1
+        res = send(headers)
+        with self.lock:
+            if res.status_code == 304 and entry is not None:
+                entry.expires = self.clock() + ttl
+                self.revalidations += 1
+                return entry.response
+            if res.status_code == 200:
+                self.entries.pop(key, None)
+                self.entries[key] = CacheEntry(res, self.clock() + ttl)
+                while len(self.entries) > self.maxsize:
+                    self.entries.popitem(last=False)
+        return res
+
+    def parse(self, res, cls):
+        """Parse a response, reusing the object parsed for a cached one.
+
+        Args:
+
+            :res (requests.models.Response): Response.
+            :cls (type): Class taking the XML document, such as APList.
+
+        Returns:
+
+            :object: cls(res).
+
+        """
+        key = res.request.url if res.request is not None else None
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry.response is not res:
+                entry = None
+            elif cls in entry.parsed:
+                return entry.parsed[cls]
+        obj = cls(res)
+        if entry is not None:
+            with self.lock:
+                entry.parsed[cls] = obj
+        return obj
+
+    def clear(self):
+        """Remove all responses."""
+        with self.lock:
+            self.entries.clear()
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.client_table"""
+
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections import OrderedDict
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# pylint: disable=import-error,relative-import
+try:
+    from airwaveapiclient.details import ap_nodes
+    from airwaveapiclient.details import as_list
+    from airwaveapiclient.details import iter_details
+    from airwaveapiclient.records import to_bool
+    from airwaveapiclient.records import to_int
+except ImportError:
+    from details import ap_nodes
+    from details import as_list
+    from details import iter_details
+    from records import to_bool
+    from records import to_int
+
+
+def to_flag(value):
+    """Convert an assoc/auth status to 1, 0 or -1 (unknown)."""
+    value = to_bool(value)
+    if value is True:
+        return 1
+    if value is False:
+        return 0
+    return -1
+
+
+def to_number(value):
+    """Convert a signal or SNR value to float, NaN if unknown."""
+    value = to_int(value)
+    if isinstance(value, int):
+        return float(value)
+    return float('nan')
+
+
+class ClientTable(object):
+
+    """Columnar table of the clients of many Access Points.
+
+    Clients are appended as rows of typed arrays, and an index maps
+    each client MAC address to its latest row. Adding a detail of an
+    Access Point again replaces its earlier rows: they are left out of
+    the index, the length and the histogram, and the arrays are
+    compacted once stale rows outnumber live ones.
+
+    Attributes:
+
+        :COLUMNS (tuple): (column, array typecode) pairs. Missing ids
+            are -1, missing signal and snr are NaN, and assoc_stat and
+            auth_stat are 1, 0 or -1 (unknown).
+        :radio_mac (list): Client MAC addresses, upper case.
+        :index (dict): Row of each client MAC address.
+        :ranges (dict): (first row, last row + 1) of each Access Point
+            ID.
+        :stale (set): Rows replaced by a later detail.
+
+    """
+
+    COLUMNS = (
+        ('client_id', 'l'),
+        ('ap_id', 'l'),
+        ('radio_index', 'l'),
+        ('signal', 'd'),
+        ('snr', 'd'),
+        ('assoc_stat', 'b'),
+        ('auth_stat', 'b'),
+    )
+
+    def __init__(self, details=None):
+        """Initialize ClientTable.
+
+        Args:
+
+            :details (optional[iterable]): APDetail objects to add.
+                Default is None.
+
+        Usage: ::
+
+            >>> from airwaveapiclient import ClientTable
+            >>> table = ClientTable()
+            >>> failed = table.extend(airwave.ap_detail_many(ap_ids))
+            >>> table.lookup('a1:01:00:00:00:c1')
+            OrderedDict([('client_id', 11000001), ('ap_id', 1), ...])
+            >>> table.snr_histogram(10)
+            [(30, 2), (40, 2), (50, 1)]
+
+        """
+        for name, typecode in ClientTable.COLUMNS:
+            setattr(self, name, array(typecode))
+        self.radio_mac = []
+        self.index = {}
+        self.ranges = {}
+        self.stale = set()
+        if details is not None:
+            self.extend(details)
+
+    def __len__(self):
+        """Number of clients."""
+        return len(self.radio_mac) - len(self.stale)
+
+    def add(self, detail):
+        """Add the clients of an Access Point detail.
+
+        Rows of an earlier detail of the same Access Point are
+        replaced.
+
+        Args:
+
+            :detail (APDetail or requests.models.Response): Detail, in
+                any of its forms (plain, typed or lazy), or an
+                ap_detail response, which is parsed as a stream.
+
+        """
+        for node in ap_nodes(detail):
+            ap_id = to_int(node.get('@id'))
+            self.__drop(ap_id)
+            start = len(self.radio_mac)
+            for radio in as_list(node.get('radio')):
+                radio_index = to_int(radio.get('@index'))
+                for client in as_list(radio.get('client')):
+                    self.__append(ap_id, radio_index, client)
+            if ap_id is not None:
+                self.ranges[ap_id] = (start, len(self.radio_mac))
+        if len(self.stale) * 2 > len(self.radio_mac):
+            self.__compact()
+
+    def extend(self, details):
+        """Add the clients of many Access Point details.
+
+        Args:
+
+            :details (iterable): APDetail objects or responses, or the
+                (ap_id, APDetail or Exception) pairs of ap_detail_many.
+
+        Returns:
+
+            :list: (ap_id, Exception) pairs of the failed details.
+
+        """
+        failed = []
+        for node in iter_details(details, failed):
+            self.add(node)
+        return failed
+
+    def __append(self, ap_id, radio_index, client):
+        """Append one client row."""
+        mac = client.get('radio_mac')
+        mac = mac.upper() if mac else None
+        if mac is not None:
+            self.index[mac] = len(self.radio_mac)
+        self.radio_mac.append(mac)
+        self.client_id.append(ClientTable.__id(client.get('@id')))
+        self.ap_id.append(ClientTable.__id(ap_id))
+        self.radio_index.append(ClientTable.__id(radio_index))
+        self.signal.append(to_number(client.get('signal')))
+        self.snr.append(to_number(client.get('snr')))
+        self.assoc_stat.append(to_flag(client.get('assoc_stat')))
+        self.auth_stat.append(to_flag(client.get('auth_stat')))
+
+    def __drop(self, ap_id):
+        """Mark the rows of an Access Point stale."""
+        start, stop = self.ranges.pop(ap_id, (0, 0))
+        for row in range(start, stop):
+            mac = self.radio_mac[row]
+            if mac is not None and self.index.get(mac) == row:
+                del self.index[mac]
+            self.stale.add(row)
+
+    def __compact(self):
+        """Remove the stale rows, renumbering the others."""
+        if not self.stale:
+            return
+        stale = sorted(self.stale)
+        keep = [row for row in range(len(self.radio_mac))
+                if row not in self.stale]
+        for name, typecode in ClientTable.COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, array(typecode, [column[row]
+                                                 for row in keep]))
+        self.radio_mac = [self.radio_mac[row] for row in keep]
+        self.index = {}
+        for row, mac in enumerate(self.radio_mac):
+            if mac is not None:
+                self.index[mac] = row
+        for ap_id, (start, stop) in self.ranges.items():
+            shift = bisect_left(stale, start)
+            self.ranges[ap_id] = (start - shift, stop - shift)
+        self.stale = set()
+
+    @staticmethod
+    def __id(value):
+        """Convert an id to int, -1 if unknown."""
+        value = to_int(value)
+        return value if isinstance(value, int) else -1
+
+    def row(self, index):
+        """Return a row.
+
+        Args:
+
+            :index (int): Row number. Rows are renumbered when stale
+                rows are removed.
+
+        Returns:
+
+            :OrderedDict: Column values of the row, with radio_mac.
+
+        """
+        row = OrderedDict()
+        for name, _ in ClientTable.COLUMNS:
+            row[name] = getattr(self, name)[index]
+        row['radio_mac'] = self.radio_mac[index]
+        return row
+
+    def lookup(self, mac):
+        """Find a client by MAC address through the index.
+
+        Args:
+
+            :mac (str): Client MAC address, in any case.
+
+        Returns:
+
+            :OrderedDict: Latest row of the client, or None.
+
+        """
+        index = self.index.get(mac.upper())
+        if index is None:
+            return None
+        return self.row(index)
+
+    def snr_histogram(self, bin_width=5):
+        """Count clients per SNR bin.
+
+        Args:
+
+            :bin_width (optional[int]): dB per bin. Default is 5.
+
+        Returns:
+
+            :list: (bin start, count) pairs sorted by bin, clients with
+                an unknown SNR left out.
+
+        """
+        self.__compact()
+        if numpy is not None:
+            snr = numpy.frombuffer(self.snr, dtype='float64')
+            snr = snr[~numpy.isnan(snr)]
+            bins = (numpy.floor(snr / bin_width) * bin_width).astype('int64')
+            starts, counts = numpy.unique(bins, return_counts=True)
+            return [(int(start), int(count))
+                    for start, count in zip(starts, counts)]
+        counts = Counter(int(snr // bin_width) * bin_width
+                         for snr in self.snr if snr == snr)
+        return sorted(counts.items())
+
+    def to_numpy(self):
+        """Convert the columns to NumPy arrays. Requires numpy.
+
+        Returns:
+
+            :OrderedDict: Arrays keyed by column name, with radio_mac
+                as a text array.
+
+        """
+        if numpy is None:
+            raise ImportError('ClientTable.to_numpy requires numpy.')
+        self.__compact()
+        columns = OrderedDict()
+        for name, typecode in ClientTable.COLUMNS:
+            columns[name] = numpy.frombuffer(getattr(self, name),
+                                             dtype=typecode)
+        columns['radio_mac'] = numpy.array(
+            [mac or '' for mac in self.radio_mac])
+        return columns
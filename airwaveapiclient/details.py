@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.details"""
+
+
+import requests
+# pylint: disable=import-error,relative-import
+try:
+    from airwaveapiclient.xmlstream import iterparse
+except ImportError:
+    from xmlstream import iterparse
+
+
+def as_list(value):
+    """Normalize a repeated element to a sequence."""
+    if value is None:
+        return []
+    if hasattr(value, 'keys'):
+        return [value]
+    return value
+
+
+def ap_nodes(detail):
+    """Yield the ap nodes of an Access Point detail.
+
+    Args:
+
+        :detail (APDetail or requests.models.Response): Detail, in any
+            of its forms (plain, typed or lazy), or an ap_detail
+            response, which is parsed as a stream.
+
+    """
+    if isinstance(detail, requests.Response):
+        chunks = detail.iter_content(65536)
+        for _, node in iterparse(chunks, depth=2, tags=['ap']):
+            yield node
+    else:
+        yield detail
+
+
+def iter_details(details, failed):
+    """Yield the ap nodes of many Access Point details.
+
+    Args:
+
+        :details (iterable): APDetail objects or responses, or the
+            (ap_id, APDetail or Exception) pairs of ap_detail_many.
+        :failed (list): List to append the (ap_id, Exception) pairs of
+            the failed details to.
+
+    """
+    for detail in details:
+        if isinstance(detail, tuple):
+            if isinstance(detail[1], Exception):
+                failed.append(detail)
+                continue
+            detail = detail[1]
+        for node in ap_nodes(detail):
+            yield node
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.graph_data"""
+
+
+from array import array
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# pylint: disable=import-error,relative-import
+try:
+    from airwaveapiclient.xmlstream import iterparse
+    from airwaveapiclient.xmlparse import document
+except ImportError:
+    from xmlstream import iterparse
+    from xmlparse import document
+
+
+class GraphData(object):
+
+    """Time series of an RRD graph, in rrdtool xport XML format.
+
+    Rows are decoded one at a time into typed arrays, so a series takes
+    8 bytes per timestamp and per value.
+
+    Attributes:
+
+        :start (int): First timestamp in seconds since the epoch.
+        :end (int): Last timestamp in seconds since the epoch.
+        :step (int): Seconds between rows.
+        :legend (list): Column names.
+        :timestamps (array.array): Row timestamps ('l').
+        :columns (list): One array.array('d') per legend entry.
+            Unknown values are NaN.
+
+    """
+
+    def __init__(self, xml):
+        """Initialize GraphData.
+
+        Args:
+
+            :xml (str, bytes or requests.models.Response): rrdtool
+                xport XML.
+
+        Usage: ::
+
+            >>> res = airwave.graph_data(ap_graph.radio_noise_802dot11an())
+            >>> obj = GraphData(res)
+            >>> obj.legend
+            ['noise']
+            >>> obj.timestamps[0], obj.columns[0][0]
+            (1565000000, -95.0)
+
+        """
+        self.start = None
+        self.end = None
+        self.step = None
+        self.legend = []
+        self.timestamps = array('l')
+        self.columns = []
+        for tag, item in iterparse(document(xml), depth=3):
+            if tag == 'row':
+                self.__add_row(item)
+            elif tag in ('start', 'end', 'step'):
+                setattr(self, tag, int(item))
+            elif tag == 'legend':
+                entries = (item or {}).get('entry') or []
+                if not isinstance(entries, list):
+                    entries = [entries]
+                self.legend = [entry or '' for entry in entries]
+                self.columns = [array('d') for _ in self.legend]
+
+    def __add_row(self, row):
+        """Append one <row> to the arrays."""
+        values = row.get('v') or []
+        if not isinstance(values, list):
+            values = [values]
+        while len(self.columns) < len(values):
+            self.columns.append(array('d'))
+        timestamp = row.get('t')
+        if timestamp is None:
+            timestamp = self.start + self.step * len(self.timestamps)
+        self.timestamps.append(int(timestamp))
+        for column, value in zip(self.columns, values):
+            column.append(float(value) if value else float('nan'))
+
+    def __len__(self):
+        """Number of rows."""
+        return len(self.timestamps)
+
+    def column(self, name):
+        """Values of a column.
+
+        Args:
+
+            :name (str): Legend entry.
+
+        Returns:
+
+            :array.array: Values ('d').
+
+        """
+        return self.columns[self.legend.index(name)]
+
+    def to_numpy(self):
+        """Convert to NumPy arrays. Requires numpy.
+
+        Returns:
+
+            :tuple: (timestamps, values), an int64 array of rows and a
+                float64 array of rows x columns.
+
+        """
+        if numpy is None:
+            raise ImportError('GraphData.to_numpy requires numpy.')
+        timestamps = numpy.frombuffer(self.timestamps, dtype='l')
+        values = numpy.empty((len(self), len(self.columns)), dtype='float64')
+        for i, column in enumerate(self.columns):
+            values[:, i] = numpy.frombuffer(column, dtype='float64')
+        return timestamps.astype('int64'), values
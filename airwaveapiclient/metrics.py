@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.metrics"""
+
+
+import functools
+import threading
+import time
+import requests
+
+
+METRICS = None
+
+
+def set_metrics(metrics):
+    """Select the Metrics recording requests and parsing, or None.
+
+    Recording is off by default; when off, requests and parsers only
+    check this setting.
+
+    Args:
+
+        :metrics (Metrics): Metrics to record into, or None to stop.
+
+    Usage: ::
+
+        >>> from airwaveapiclient import Metrics
+        >>> from airwaveapiclient import set_metrics
+        >>> metrics = Metrics()
+        >>> set_metrics(metrics)
+
+    """
+    global METRICS  # pylint: disable=global-statement
+    METRICS = metrics
+
+
+def timed_parse(func):
+    """Record the parse time of a response class __init__(xml, ...)."""
+    @functools.wraps(func)
+    def wrapper(self, xml, *args, **kwargs):
+        """Parse, timing it when metrics are on."""
+        metrics = METRICS
+        if metrics is None:
+            return func(self, xml, *args, **kwargs)
+        start = time.time()
+        try:
+            return func(self, xml, *args, **kwargs)
+        finally:
+            metrics.record_parse(type(self).__name__, time.time() - start,
+                                 document_size(xml))
+    return wrapper
+
+
+def document_size(xml):
+    """Size of an XML document in bytes or characters, None if unknown."""
+    if isinstance(xml, requests.Response):
+        xml = xml.content
+    if isinstance(xml, (bytes, type(u''))):
+        return len(xml)
+    return None
+
+
+class Histogram(object):
+
+    """Log-linear histogram in the style of HdrHistogram.
+
+    Values are counted in buckets whose width is a fixed fraction of
+    their magnitude, so memory stays small for any range of values and
+    percentiles keep a relative error below 2 ** -(sub_bucket_bits - 1).
+
+    Attributes:
+
+        :scale (float): Units per recorded value, e.g. 1e6 to count
+            seconds in microseconds.
+        :count (int): Number of values.
+        :total (float): Sum of values.
+        :min (float): Lowest value, or None.
+        :max (float): Highest value, or None.
+
+    """
+
+    def __init__(self, scale=1, sub_bucket_bits=7):
+        """Initialize Histogram.
+
+        Args:
+
+            :scale (optional[float]): Units per recorded value.
+                Default is 1.
+            :sub_bucket_bits (optional[int]): Buckets per power of two
+                are 2 ** (sub_bucket_bits - 1). Default is 7 (1.6%).
+
+        """
+        self.scale = scale
+        self.bits = sub_bucket_bits
+        self.half = 1 << (sub_bucket_bits - 1)
+        self.counts = []
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def index(self, units):
+        """Bucket index of a value in units."""
+        shift = units.bit_length() - self.bits
+        if shift <= 0:
+            return units
+        return shift * self.half + (units >> shift)
+
+    def bounds(self, index):
+        """Lowest and highest+1 value in units of a bucket."""
+        if index < 2 * self.half:
+            return index, index + 1
+        shift = index // self.half - 1
+        sub = index - shift * self.half
+        return sub << shift, (sub + 1) << shift
+
+    def record(self, value):
+        """Count a value.
+
+        Args:
+
+            :value (float): Value, negative values are counted as 0.
+
+        """
+        units = max(0, int(value * self.scale))
+        index = self.index(units)
+        counts = self.counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percent):
+        """Value below which percent of the values fall.
+
+        Args:
+
+            :percent (float): Percentile, from 0 to 100.
+
+        Returns:
+
+            :float: Highest value of the bucket holding the percentile,
+                within [min, max], or None if empty.
+
+        """
+        if not self.count:
+            return None
+        rank = max(1, int(round(percent / 100.0 * self.count)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                value = (self.bounds(index)[1] - 1) / float(self.scale)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def mean(self):
+        """Average value, or None if empty."""
+        if not self.count:
+            return None
+        return self.total / self.count
+
+
+class Metrics(object):
+
+    """Request and parse metrics of the client.
+
+    Records per endpoint request latency ('request_seconds'), response
+    size ('response_bytes') and errors ('errors_total', by status or
+    exception), and parse time ('parse_seconds') and document size
+    ('parse_bytes') per response class. Every value is also passed to
+    the callbacks, which can forward it to another monitoring system.
+
+    Attributes:
+
+        :callbacks (list): Functions called as callback(name, labels,
+            value) for each recorded value.
+        :histograms (dict): Histogram by (name, labels) where labels is
+            a tuple of (label, value) pairs.
+        :counters (dict): Count by (name, labels).
+
+    """
+
+    SCALES = {
+        'request_seconds': 1e6,
+        'parse_seconds': 1e6,
+        'response_bytes': 1,
+        'parse_bytes': 1,
+    }
+
+    def __init__(self, callbacks=None):
+        """Initialize Metrics.
+
+        Args:
+
+            :callbacks (optional[list]): Functions called as
+                callback(name, labels, value). Default is None.
+
+        Usage: ::
+
+            >>> from airwaveapiclient import Metrics
+            >>> from airwaveapiclient import set_metrics
+            >>> metrics = Metrics()
+            >>> set_metrics(metrics)
+            >>> objs = APList(airwave.ap_list())
+            >>> metrics.histogram('request_seconds', method='GET',
+            ...                   endpoint='/ap_list.xml').percentile(99)
+            0.412
+            >>> print(metrics.to_prometheus())
+            # TYPE airwave_client_request_seconds summary
+            ...
+
+        """
+        self.callbacks = list(callbacks or [])
+        self.histograms = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def observe(self, name, labels, value):
+        """Record a value into a histogram.
+
+        Args:
+
+            :name (str): Metric name.
+            :labels (dict): Label values.
+            :value (float): Value.
+
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = Histogram(Metrics.SCALES.get(name, 1))
+                self.histograms[key] = histogram
+            histogram.record(value)
+        for callback in self.callbacks:
+            callback(name, labels, value)
+
+    def increment(self, name, labels, value=1):
+        """Add to a counter.
+
+        Args:
+
+            :name (str): Metric name.
+            :labels (dict): Label values.
+            :value (optional[int]): Increment. Default is 1.
+
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+        for callback in self.callbacks:
+            callback(name, labels, value)
+
+    def record_request(self, method, endpoint, seconds, **kwargs):
+        """Record a request sent to AirWave.
+
+        Args:
+
+            :method (str): HTTP method.
+            :endpoint (str): URL path.
+            :seconds (float): Time until the response.
+            :status (optional[int]): Response status.
+            :size (optional[int]): Response body size in bytes.
+            :error (optional[Exception]): Exception raised instead of a
+                response.
+
+        """
+        labels = {'method': method.upper(), 'endpoint': endpoint}
+        self.observe('request_seconds', labels, seconds)
+        error = kwargs.get('error')
+        status = kwargs.get('status')
+        if error is not None:
+            kind = type(error).__name__
+        elif status is not None and status >= 400:
+            kind = str(status)
+        else:
+            kind = None
+        if kind is not None:
+            self.increment('errors_total', {'endpoint': endpoint,
+                                            'kind': kind})
+        if kwargs.get('size') is not None:
+            self.observe('response_bytes', {'endpoint': endpoint},
+                         kwargs['size'])
+
+    def record_parse(self, cls_name, seconds, size=None):
+        """Record the parse of a document.
+
+        Args:
+
+            :cls_name (str): Response class name, such as 'APList'.
+            :seconds (float): Parse time.
+            :size (optional[int]): Document size.
+
+        """
+        labels = {'type': cls_name}
+        self.observe('parse_seconds', labels, seconds)
+        if size is not None:
+            self.observe('parse_bytes', labels, size)
+
+    def histogram(self, name, **labels):
+        """Find a histogram.
+
+        Args:
+
+            :name (str): Metric name.
+            :labels: Label values.
+
+        Returns:
+
+            :Histogram: Histogram, or None.
+
+        """
+        return self.histograms.get((name, tuple(sorted(labels.items()))))
+
+    def counter(self, name, **labels):
+        """Value of a counter, 0 if never incremented."""
+        return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+
+    def reset(self):
+        """Forget all values."""
+        with self.lock:
+            self.histograms = {}
+            self.counters = {}
+
+    def to_prometheus(self, prefix='airwave_client',
+                      quantiles=(0.5, 0.9, 0.99)):
+        """Export in the Prometheus text format.
+
+        Histograms are exported as summaries with quantiles, _sum and
+        _count, counters as counters.
+
+        Args:
+
+            :prefix (optional[str]): Metric name prefix.
+                Default is 'airwave_client'.
+            :quantiles (optional[tuple]): Quantiles of the summaries.
+                Default is (0.5, 0.9, 0.99).
+
+        Returns:
+
+            :str: Exposition text.
+
+        """
+        with self.lock:
+            histograms = sorted(self.histograms.items())
+            counters = sorted(self.counters.items())
+        lines = []
+        typed = set()
+        for (name, labels), histogram in histograms:
+            full_name = '%s_%s' % (prefix, name)
+            if full_name not in typed:
+                typed.add(full_name)
+                lines.append('# TYPE %s summary' % full_name)
+            for quantile in quantiles:
+                value = histogram.percentile(quantile * 100)
+                lines.append('%s%s %r' % (
+                    full_name,
+                    format_labels(labels + (('quantile', str(quantile)),)),
+                    float(value)))
+            lines.append('%s_sum%s %r' % (full_name, format_labels(labels),
+                                          float(histogram.total)))
+            lines.append('%s_count%s %d' % (full_name, format_labels(labels),
+                                            histogram.count))
+        for (name, labels), value in counters:
+            full_name = '%s_%s' % (prefix, name)
+            if full_name not in typed:
+                typed.add(full_name)
+                lines.append('# TYPE %s counter' % full_name)
+            lines.append('%s%s %d' % (full_name, format_labels(labels),
+                                      value))
+        return ''.join(line + '\n' for line in lines)
+
+
+def format_labels(labels):
+    """Format (label, value) pairs as a Prometheus label set."""
+    if not labels:
+        return ''
+    return '{%s}' % ','.join(
+        '%s="%s"' % (label, value.replace('\\', '\\\\')
+                     .replace('"', '\\"').replace('\n', '\\n'))
+        for label, value in labels)
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.neighbors"""
+
+
+from collections import OrderedDict
+import time
+# pylint: disable=import-error,relative-import
+try:
+    from airwaveapiclient.details import ap_nodes
+    from airwaveapiclient.details import as_list
+    from airwaveapiclient.details import iter_details
+    from airwaveapiclient.records import to_int
+    from airwaveapiclient.xmlparse import document
+    from airwaveapiclient.xmlstream import iterparse
+except ImportError:
+    from details import ap_nodes
+    from details import as_list
+    from details import iter_details
+    from records import to_int
+    from xmlparse import document
+    from xmlstream import iterparse
+
+
+class Neighbor(object):
+
+    """Neighbor radio seen by one or more Access Points.
+
+    Attributes:
+
+        :radio_mac (str): Radio MAC address, upper case.
+        :ssid (str): Latest SSID.
+        :channel (int): Latest channel.
+        :last_discovered (int): Latest discovery time in seconds since
+            the epoch.
+        :signals (dict): Latest signal by Access Point ID.
+        :updated (float): Poll time of the latest sighting.
+
+    """
+
+    __slots__ = ('radio_mac', 'ssid', 'channel', 'last_discovered',
+                 'signals', 'updated')
+
+    def __init__(self, radio_mac):
+        """Initialize Neighbor."""
+        self.radio_mac = radio_mac
+        self.ssid = None
+        self.channel = None
+        self.last_discovered = None
+        self.signals = {}
+        self.updated = None
+
+    @property
+    def seen_by(self):
+        """Access Point IDs seeing the radio."""
+        return set(self.signals)
+
+    @property
+    def signal(self):
+        """Best signal, or None if no Access Point reported one."""
+        signals = [value for value in self.signals.values()
+                   if value is not None]
+        return max(signals) if signals else None
+
+    @property
+    def best_ap(self):
+        """ID of the Access Point with the best signal."""
+        best = None
+        for ap_id, value in self.signals.items():
+            if value is not None and (best is None or
+                                      value > self.signals[best]):
+                best = ap_id
+        return best
+
+    def __repr__(self):
+        """Representation."""
+        return '<Neighbor %s: seen by %d>' % (self.radio_mac,
+                                              len(self.signals))
+
+
+class NeighborStore(object):
+
+    """Neighbor and rogue radios of a fleet, keyed by radio MAC.
+
+    Each APDetail replaces the neighbor sightings of its Access Point,
+    so feeding every poll keeps the store current without rebuilding
+    it: a radio no Access Point sees anymore is dropped. Rogue
+    sightings from rogue_detail are kept apart and are not replaced by
+    details. The store keeps at most maxsize radios and evicts the
+    least recently seen first.
+
+    Attributes:
+
+        :maxsize (int): Maximum number of radios kept.
+        :neighbors (OrderedDict): Neighbor by radio MAC, least recently
+            seen first.
+        :sightings (dict): Neighbor radio MACs seen by each Access
+            Point ID in its details.
+        :rogue_sightings (dict): Radio MACs seen by each Access Point
+            ID in rogue_detail.
+
+    """
+
+    def __init__(self, maxsize=100000):
+        """Initialize NeighborStore.
+
+        Args:
+
+            :maxsize (optional[int]): Maximum number of radios kept.
+                Default is 100000.
+
+        Usage: ::
+
+            >>> from airwaveapiclient import NeighborStore
+            >>> store = NeighborStore()
+            >>> failed = store.extend(airwave.ap_detail_many(ap_ids))
+            >>> neighbor = store.get('a1:01:00:00:00:a1')
+            >>> neighbor.signal, neighbor.best_ap, neighbor.seen_by
+            (-81, 1, {1, 2})
+            >>> store.expire(3600)  # radios not seen in the last hour
+
+        """
+        self.maxsize = maxsize
+        self.neighbors = OrderedDict()
+        self.sightings = {}
+        self.rogue_sightings = {}
+        self.clock = time.time
+
+    def __len__(self):
+        """Number of radios."""
+        return len(self.neighbors)
+
+    def __iter__(self):
+        """Iterate Neighbor objects, least recently seen first."""
+        return iter(list(self.neighbors.values()))
+
+    def __contains__(self, radio_mac):
+        """Check if a radio is known."""
+        return radio_mac.upper() in self.neighbors
+
+    def get(self, radio_mac):
+        """Find a radio.
+
+        Args:
+
+            :radio_mac (str): Radio MAC address, in any case.
+
+        Returns:
+
+            :Neighbor: Neighbor, or None.
+
+        """
+        return self.neighbors.get(radio_mac.upper())
+
+    def update(self, ap_id, node, poll=None):
+        """Record one neighbor sighting of a radio.
+
+        Args:
+
+            :ap_id (int): ID of the Access Point seeing the radio.
+            :node (dict or NeighborAP): neighbor_ap node or record.
+            :poll (optional[float]): Poll time. Default is now.
+
+        Returns:
+
+            :Neighbor: Updated Neighbor, or None if the node has no
+                radio_mac.
+
+        """
+        return self.__update(ap_id, node, poll, self.sightings)
+
+    def __update(self, ap_id, node, poll, sightings):
+        """Record one sighting of a radio into sightings."""
+        radio_mac = node.get('radio_mac')
+        if not radio_mac:
+            return None
+        radio_mac = radio_mac.upper()
+        ap_id = to_int(ap_id)
+        neighbor = self.neighbors.pop(radio_mac, None)
+        if neighbor is None:
+            neighbor = Neighbor(radio_mac)
+        self.neighbors[radio_mac] = neighbor
+        signal = to_int(node.get('signal'))
+        neighbor.signals[ap_id] = signal if isinstance(signal, int) else None
+        channel = to_int(node.get('channel'))
+        if channel is not None:
+            neighbor.channel = channel
+        ssid = node.get('ssid')
+        if ssid:
+            neighbor.ssid = ssid
+        discovered = to_int(node.get('last_discovered'))
+        if isinstance(discovered, int) and (
+                neighbor.last_discovered is None or
+                discovered > neighbor.last_discovered):
+            neighbor.last_discovered = discovered
+        neighbor.updated = self.clock() if poll is None else poll
+        sightings.setdefault(ap_id, set()).add(radio_mac)
+        while len(self.neighbors) > self.maxsize:
+            self.__remove(self.neighbors.popitem(last=False)[1])
+        return neighbor
+
+    def add(self, detail, poll=None):
+        """Replace the neighbor sightings of an Access Point.
+
+        Args:
+
+            :detail (APDetail or requests.models.Response): Detail, in
+                any of its forms (plain, typed or lazy), or an
+                ap_detail response, which is parsed as a stream.
+            :poll (optional[float]): Poll time. Default is now.
+
+        """
+        for node in ap_nodes(detail):
+            ap_id = to_int(node.get('@id'))
+            previous = self.sightings.pop(ap_id, set())
+            for radio in as_list(node.get('radio')):
+                for item in as_list(radio.get('neighbor_ap')):
+                    self.update(ap_id, item, poll)
+            previous -= self.sightings.get(ap_id, set())
+            previous -= self.rogue_sightings.get(ap_id, set())
+            for radio_mac in previous:
+                self.__forget(ap_id, radio_mac)
+
+    def add_rogue_detail(self, ap_id, xml, poll=None):
+        """Merge the radios of a rogue_detail response.
+
+        Every element under the root carrying a radio_mac is recorded
+        as a rogue sighting of ap_id. Sightings of other polls are
+        kept, and later details of ap_id do not replace them.
+
+        Args:
+
+            :ap_id (int): ID passed to rogue_detail.
+            :xml (str, bytes or requests.models.Response): rogue_detail
+                XML.
+            :poll (optional[float]): Poll time. Default is now.
+
+        """
+        xml = document(xml)
+        if isinstance(xml, (bytes, type(u''))):
+            xml = [xml]
+        for _, node in iterparse(xml, depth=2):
+            if hasattr(node, 'keys'):
+                self.__update(ap_id, node, poll, self.rogue_sightings)
+
+    def extend(self, details, poll=None):
+        """Add many Access Point details.
+
+        Args:
+
+            :details (iterable): APDetail objects or responses, or the
+                (ap_id, APDetail or Exception) pairs of ap_detail_many.
+            :poll (optional[float]): Poll time. Default is now.
+
+        Returns:
+
+            :list: (ap_id, Exception) pairs of the failed details.
+
+        """
+        failed = []
+        for node in iter_details(details, failed):
+            self.add(node, poll)
+        return failed
+
+    def expire(self, max_age, now=None):
+        """Drop radios not seen for max_age seconds.
+
+        Args:
+
+            :max_age (float): Seconds.
+            :now (optional[float]): Current time. Default is now.
+
+        Returns:
+
+            :int: Number of radios dropped.
+
+        """
+        limit = (self.clock() if now is None else now) - max_age
+        count = 0
+        while self.neighbors:
+            neighbor = next(iter(self.neighbors.values()))
+            if neighbor.updated >= limit:
+                break
+            self.__remove(self.neighbors.pop(neighbor.radio_mac))
+            count += 1
+        return count
+
+    def __forget(self, ap_id, radio_mac):
+        """Remove one sighting, and the radio if nothing sees it."""
+        neighbor = self.neighbors.get(radio_mac)
+        if neighbor is None:
+            return
+        neighbor.signals.pop(ap_id, None)
+        if not neighbor.signals:
+            del self.neighbors[radio_mac]
+
+    def __remove(self, neighbor):
+        """Remove the sightings of an evicted radio."""
+        for sightings in (self.sightings, self.rogue_sightings):
+            for ap_id in neighbor.signals:
+                radio_macs = sightings.get(ap_id)
+                if radio_macs is not None:
+                    radio_macs.discard(neighbor.radio_mac)
+                    if not radio_macs:
+                        del sightings[ap_id]
@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.records"""
+
+
+from collections import OrderedDict
+try:
+    from sys import intern
+except ImportError:
+    pass
+
+
+def to_text(value):
+    """Keep a text value as is."""
+    return value
+
+
+def to_symbol(value):
+    """Intern a low-cardinality text value such as a radio type."""
+    if isinstance(value, str):
+        return intern(value)
+    return value
+
+
+def to_int(value):
+    """Convert a text value to int, keeping it if it is not numeric."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def to_float(value):
+    """Convert a text value to float, keeping it if it is not numeric."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, float):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def to_bool(value):
+    """Convert 'true'/'false' to bool, keeping other values as is."""
+    if value == 'true':
+        return True
+    if value == 'false':
+        return False
+    if value == '':
+        return None
+    return value
+
+
+def to_text_list(value):
+    """Normalize a repeated text element to a list."""
+    if value is None:
+        return None
+    if not isinstance(value, list):
+        return [value]
+    return value
+
+
+def to_records(cls):
+    """Return a converter of a repeated element to a list of records."""
+    def convert(value):
+        """Convert dict or list of dicts to a list of records."""
+        if value is None:
+            return None
+        if not isinstance(value, list):
+            value = [value]
+        return [cls.from_dict(node) for node in value]
+    return convert
+
+
+def to_record(cls):
+    """Return a converter of an element to a record."""
+    def convert(value):
+        """Convert dict or text to a record."""
+        if value is None:
+            return None
+        if not hasattr(value, 'items'):
+            value = {'#text': value}
+        return cls.from_dict(value)
+    return convert
+
+
+class Record(object):
+
+    """Compact record with a read-only dict-like interface.
+
+    Subclasses declare FIELDS as (xml key, attribute, converter) tuples.
+    Values are stored in __slots__ attributes, already converted, and
+    can be read either as attributes (ap.name) or with the xmltodict
+    keys (ap['name'], ap['@id']). Missing or empty values read as None.
+    Elements not declared in FIELDS are kept in an extra dict.
+
+    """
+
+    __slots__ = ('_extra',)
+    FIELDS = ()
+    _KEYS = {}
+
+    @classmethod
+    def from_dict(cls, node):
+        """Create a record from an xmltodict node.
+
+        Args:
+
+            :node (dict): xmltodict node, or a dict from to_dict.
+
+        Returns:
+
+            :Record: Record instance.
+
+        """
+        obj = cls.__new__(cls)
+        for _, attr, _ in cls.FIELDS:
+            setattr(obj, attr, None)
+        obj._extra = None
+        keys = cls._KEYS
+        for key, value in node.items():
+            spec = keys.get(key)
+            if spec is None:
+                if obj._extra is None:
+                    obj._extra = OrderedDict()
+                obj._extra[key] = value
+            else:
+                setattr(obj, spec[0], spec[1](value))
+        return obj
+
+    def __getitem__(self, key):
+        """Get value by xmltodict key."""
+        spec = self._KEYS.get(key)
+        if spec is not None:
+            return getattr(self, spec[0])
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        """Get value by xmltodict key with default."""
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        if value is None:
+            return default
+        return value
+
+    def __contains__(self, key):
+        """Return True if the key has a value."""
+        return self.get(key) is not None
+
+    def keys(self):
+        """Return the keys having a value, in field order."""
+        keys = [key for key, attr, _ in self.FIELDS
+                if getattr(self, attr) is not None]
+        if self._extra is not None:
+            keys.extend(self._extra)
+        return keys
+
+    def values(self):
+        """Return the values, in field order."""
+        return [self[key] for key in self.keys()]
+
+    def items(self):
+        """Return (key, value) pairs, in field order."""
+        return [(key, self[key]) for key in self.keys()]
+
+    def __iter__(self):
+        """Iterate keys."""
+        return iter(self.keys())
+
+    def __len__(self):
+        """Return the number of keys having a value."""
+        return len(self.keys())
+
+    def __eq__(self, other):
+        """Compare type and values."""
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.items() == other.items()
+
+    def __ne__(self, other):
+        """Compare type and values."""
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Representation."""
+        return '%s(%r)' % (type(self).__name__, dict(self.items()))
+
+    def to_dict(self):
+        """Convert to an OrderedDict, converting nested records too.
+
+        Returns:
+
+            :OrderedDict: Typed values keyed by the xmltodict keys.
+
+        """
+        data = OrderedDict()
+        for key, value in self.items():
+            if isinstance(value, Record):
+                value = value.to_dict()
+            elif isinstance(value, list):
+                value = [v.to_dict() if isinstance(v, Record) else v
+                         for v in value]
+            data[key] = value
+        return data
+
+
+class Ref(Record):
+
+    """Reference element with an id attribute and a text, like <group>."""
+
+    FIELDS = (
+        ('@id', 'id', to_int),
+        ('#text', 'text', to_symbol),
+    )
+    __slots__ = tuple(attr for _, attr, _ in FIELDS)
+    _KEYS = dict((key, (attr, conv)) for key, attr, conv in FIELDS)
+
+
+class Client(Record):
+
+    """Client record of APDetail radios."""
+
+    FIELDS = (
+        ('@id', 'id', to_int),
+        ('assoc_stat', 'assoc_stat', to_bool),
+        ('auth_stat', 'auth_stat', to_bool),
+        ('bw', 'bw', to_float),
+        ('device_type', 'device_type', to_symbol),
+        ('ipv4', 'ipv4', to_text),
+        ('name', 'name', to_text),
+        ('radio_mac', 'radio_mac', to_text),
+        ('radio_mode', 'radio_mode', to_symbol),
+        ('rssi', 'rssi', to_int),
+        ('signal', 'signal', to_int),
+        ('snr', 'snr', to_int),
+        ('vendor', 'vendor', to_symbol),
+    )
+    __slots__ = tuple(attr for _, attr, _ in FIELDS)
+    _KEYS = dict((key, (attr, conv)) for key, attr, conv in FIELDS)
+
+
+class NeighborAP(Record):
+
+    """Neighbor access point record of APDetail radios."""
+
+    FIELDS = (
+        ('@id', 'id', to_int),
+        ('channel', 'channel', to_int),
+        ('last_discovered', 'last_discovered', to_int),
+        ('name', 'name', to_text),
+        ('neighbor_mode', 'neighbor_mode', to_symbol),
+        ('neighbor_type', 'neighbor_type', to_symbol),
+        ('radio_mac', 'radio_mac', to_text),
+        ('rssi', 'rssi', to_int),
+        ('security', 'security', to_symbol),
+        ('signal', 'signal', to_int),
+        ('snr', 'snr', to_int),
+        ('ssid', 'ssid', to_text),
+        ('vendor', 'vendor', to_symbol),
+    )
+    __slots__ = tuple(attr for _, attr, _ in FIELDS)
+    _KEYS = dict((key, (attr, conv)) for key, attr, conv in FIELDS)
+
+
+class Radio(Record):
+
+    """Radio record of APList and APDetail access points."""
+
+    FIELDS = (
+        ('@index', 'index', to_int),
+        ('antenna', 'antenna', to_symbol),
+        ('antenna_gain', 'antenna_gain', to_symbol),
+        ('bssid', 'bssid', to_text_list),
+        ('bw', 'bw', to_float),
+        ('channel', 'channel', to_int),
+        ('client', 'client', to_records(Client)),
+        ('display_channel', 'display_channel', to_symbol),
+        ('display_enabled', 'display_enabled', to_bool),
+        ('display_transmit_power', 'display_transmit_power', to_symbol),
+        ('neighbor_ap', 'neighbor_ap', to_records(NeighborAP)),
+        ('operational_mode', 'operational_mode', to_symbol),
+        ('radio_interface', 'radio_interface', to_int),
+        ('radio_mac', 'radio_mac', to_text),
+        ('radio_role', 'radio_role', to_symbol),
+        ('radio_type', 'radio_type', to_symbol),
+    )
+    __slots__ = tuple(attr for _, attr, _ in FIELDS)
+    _KEYS = dict((key, (attr, conv)) for key, attr, conv in FIELDS)
+
+
+class AP(Record):
+
+    """Access point record of APList and APDetail."""
+
+    FIELDS = (
+        ('@id', 'id', to_int),
+        ('ap_folder', 'ap_folder', to_symbol),
+        ('ap_group', 'ap_group', to_symbol),
+        ('controller_id', 'controller_id', to_int),
+        ('device_category', 'device_category', to_symbol),
+        ('firmware', 'firmware', to_symbol),
+        ('group', 'group', to_record(Ref)),
+        ('is_up', 'is_up', to_bool),
+        ('lan_ip', 'lan_ip', to_text),
+        ('lan_mac', 'lan_mac', to_text),
+        ('mfgr', 'mfgr', to_symbol),
+        ('model', 'model', to_record(Ref)),
+        ('monitor_only', 'monitor_only', to_bool),
+        ('name', 'name', to_text),
+        ('operating_mode', 'operating_mode', to_symbol),
+        ('planned_maintenance_mode', 'planned_maintenance_mode', to_bool),
+        ('radio', 'radio', to_records(Radio)),
+        ('serial_number', 'serial_number', to_text),
+        ('snmp_uptime', 'snmp_uptime', to_int),
+        ('syscontact', 'syscontact', to_text),
+        ('syslocation', 'syslocation', to_text),
+        ('upstream_device_id', 'upstream_device_id', to_int),
+        ('upstream_port_index', 'upstream_port_index', to_int),
+    )
+    __slots__ = tuple(attr for _, attr, _ in FIELDS)
+    _KEYS = dict((key, (attr, conv)) for key, attr, conv in FIELDS)
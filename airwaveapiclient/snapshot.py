@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.snapshot"""
+
+
+from collections import OrderedDict
+import json
+import mmap
+import os
+import struct
+import time
+# pylint: disable=import-error,relative-import
+try:
+    from airwaveapiclient.airwaveapiclient import APList
+    from airwaveapiclient.airwaveapiclient import APDetail
+    from airwaveapiclient.records import AP
+except ImportError:
+    from airwaveapiclient import APList
+    from airwaveapiclient import APDetail
+    from records import AP
+
+
+MAGIC = b'AWSNAP01'
+HEADER = struct.Struct('<8sdII')
+OFFSET = struct.Struct('<Q')
+DETAIL_ID = struct.Struct('<q')
+
+
+def encode_record(node):
+    """Encode a node or record as compact JSON bytes."""
+    return json.dumps(node, separators=(',', ':'),
+                      default=encode_default).encode('utf-8')
+
+
+def encode_default(obj):
+    """Convert records and lazy elements for JSON."""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    return list(obj)
+
+
+def save_snapshot(path, ap_list, details=None, timestamp=None):
+    """Write Access Points and details to a snapshot file.
+
+    The file is a fixed header (magic, timestamp, counts), offset tables
+    and one compact JSON record per Access Point or detail, so a single
+    record can be decoded from the memory-mapped file without reading
+    the others. The file is replaced atomically.
+
+    Args:
+
+        :path (str): Snapshot file path.
+        :ap_list (iterable): APList, or Access Point nodes or records.
+        :details (optional[iterable]): APDetail objects. Default is None.
+        :timestamp (optional[float]): Poll time in seconds since the
+            epoch. Default is now.
+
+    Usage: ::
+
+        >>> from airwaveapiclient import save_snapshot
+        >>> save_snapshot('aps.snap', APList(res.text))
+
+    """
+    if timestamp is None:
+        timestamp = time.time()
+    records = [encode_record(node) for node in ap_list]
+    detail_map = {}
+    for detail in details or []:
+        detail_map[int(detail['@id'])] = encode_record(detail)
+    detail_ids = sorted(detail_map)
+    records.extend(detail_map[ap_id] for ap_id in detail_ids)
+
+    ap_count = len(records) - len(detail_ids)
+    base = (HEADER.size + DETAIL_ID.size * len(detail_ids) +
+            OFFSET.size * (len(records) + 1))
+    offsets = [base]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+
+    tmp_path = '%s.tmp%d' % (path, os.getpid())
+    with open(tmp_path, 'wb') as _file:
+        _file.write(HEADER.pack(MAGIC, timestamp, ap_count, len(detail_ids)))
+        for ap_id in detail_ids:
+            _file.write(DETAIL_ID.pack(ap_id))
+        for offset in offsets:
+            _file.write(OFFSET.pack(offset))
+        for record in records:
+            _file.write(record)
+    if os.name == 'nt' and os.path.exists(path):
+        os.remove(path)
+    os.rename(tmp_path, path)
+
+
+class Snapshot(object):
+
+    """Memory-mapped snapshot of Access Points and details.
+
+    Opening only reads the header; records are decoded on access.
+    It is a read-only sequence of Access Point nodes.
+
+    Attributes:
+
+        :path (str): Snapshot file path.
+        :timestamp (float): Poll time in seconds since the epoch.
+        :typed (bool): Decode into typed AP records.
+
+    """
+
+    def __init__(self, path, typed=False):
+        """Open a snapshot.
+
+        Args:
+
+            :path (str): Snapshot file path.
+            :typed (optional[bool]): Decode into typed AP records.
+                Default is False.
+
+        Usage: ::
+
+            >>> from airwaveapiclient import Snapshot
+            >>> snap = Snapshot('aps.snap')
+            >>> if snap.age() > 300:
+            ...     snap.close()  # too old, refresh from AirWave
+            >>> objs = snap.ap_list()
+
+        """
+        self.path = path
+        self.typed = typed
+        with open(path, 'rb') as _file:
+            self.mmap = mmap.mmap(_file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self.timestamp,
+         self.ap_count, self.detail_count) = HEADER.unpack_from(self.mmap, 0)
+        if magic != MAGIC:
+            self.mmap.close()
+            raise ValueError('%s is not a snapshot file.' % path)
+        self.detail_ids_offset = HEADER.size
+        self.offsets_offset = (HEADER.size +
+                               DETAIL_ID.size * self.detail_count)
+
+    def __enter__(self):
+        """Enter."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit."""
+        self.close()
+
+    def close(self):
+        """Unmap the file."""
+        self.mmap.close()
+
+    def age(self):
+        """Seconds since the snapshot was taken."""
+        return time.time() - self.timestamp
+
+    def __len__(self):
+        """Number of Access Points."""
+        return self.ap_count
+
+    def __getitem__(self, index):
+        """Decode the Access Point at index."""
+        if index < 0:
+            index += self.ap_count
+        if not 0 <= index < self.ap_count:
+            raise IndexError(index)
+        node = self.__record(index)
+        if self.typed:
+            return AP.from_dict(node)
+        return node
+
+    def __iter__(self):
+        """Iterate Access Points."""
+        for index in range(self.ap_count):
+            yield self[index]
+
+    def ap_list(self):
+        """Decode all Access Points.
+
+        Returns:
+
+            :APList: Access Points.
+
+        """
+        return APList.from_nodes(self)
+
+    def detail_ids(self):
+        """Access Point IDs having a detail, sorted."""
+        return [self.__detail_id(i) for i in range(self.detail_count)]
+
+    def detail(self, ap_id):
+        """Decode an Access Point detail.
+
+        Args:
+
+            :ap_id (int): Access Point ID.
+
+        Returns:
+
+            :APDetail: Detail, or None if the snapshot has none.
+
+        """
+        ap_id = int(ap_id)
+        low, high = 0, self.detail_count
+        while low < high:
+            mid = (low + high) // 2
+            if self.__detail_id(mid) < ap_id:
+                low = mid + 1
+            else:
+                high = mid
+        if low == self.detail_count or self.__detail_id(low) != ap_id:
+            return None
+        node = self.__record(self.ap_count + low)
+        if self.typed:
+            node = AP.from_dict(node)
+        return APDetail.from_dict(node)
+
+    def __detail_id(self, index):
+        """Access Point ID of detail number index."""
+        position = self.detail_ids_offset + DETAIL_ID.size * index
+        return DETAIL_ID.unpack_from(self.mmap, position)[0]
+
+    def __record(self, index):
+        """Decode record number index."""
+        position = self.offsets_offset + OFFSET.size * index
+        start = OFFSET.unpack_from(self.mmap, position)[0]
+        end = OFFSET.unpack_from(self.mmap, position + OFFSET.size)[0]
+        data = self.mmap[start:end].decode('utf-8')
+        return json.loads(data, object_pairs_hook=OrderedDict)
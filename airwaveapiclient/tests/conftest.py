@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+
+"""pytest configuration."""
+
+import sys
+
+# aio.py uses async generators, which need Python 3.6.
+collect_ignore = []
+if sys.version_info < (3, 6):
+    collect_ignore.append('test_aio.py')
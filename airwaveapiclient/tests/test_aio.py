@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for aio."""
+
+import asyncio
+import os
+import unittest
+from airwaveapiclient import APDetail
+from airwaveapiclient.aio import AsyncAirWaveAPIClient
+from airwaveapiclient.tests import test_utils
+
+
+class FakeResponse(object):
+
+    """aiohttp.ClientResponse stand-in."""
+
+    def __init__(self, url, params, status, text):
+        """Initialize FakeResponse."""
+        self.url = url
+        self.params = params
+        self.status = status
+        self.body = text
+
+    async def __aenter__(self):
+        """Enter."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Exit."""
+
+    async def read(self):
+        """Read body."""
+        return self.body.encode('utf-8')
+
+    async def text(self):
+        """Body text."""
+        return self.body
+
+    def raise_for_status(self):
+        """Raise for error status."""
+        if self.status >= 400:
+            raise IOError(self.status)
+
+
+class FakeSession(object):
+
+    """aiohttp.ClientSession stand-in counting requests in flight."""
+
+    def __init__(self, text):
+        """Initialize FakeSession."""
+        self.text = text
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+
+    def request(self, method, url, params=None):
+        """Return a response context manager."""
+        self.requests.append((method, url, params))
+        session = self
+
+        class Context(object):
+
+            """Request context."""
+
+            async def __aenter__(self):
+                """Enter."""
+                session.in_flight += 1
+                session.max_in_flight = max(session.max_in_flight,
+                                            session.in_flight)
+                await asyncio.sleep(0.01)
+                status = 500 if params == [('id', '3')] else 200
+                return FakeResponse(url, params, status, session.text)
+
+            async def __aexit__(self, *args):
+                """Exit."""
+                session.in_flight -= 1
+
+        return Context()
+
+    async def close(self):
+        """Close."""
+
+
+def run(coro):
+    """Run a coroutine on a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class AsyncAirWaveAPIClientUnitTests(unittest.TestCase):
+
+    """Class AsyncAirWaveAPIClientUnitTests.
+
+    Unit test for AsyncAirWaveAPIClient.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        self.url = 'https://192.168.1.1'
+        self.obj = AsyncAirWaveAPIClient(username='username',
+                                         password='password',
+                                         url=self.url,
+                                         max_concurrency=2)
+        here = os.path.dirname(os.path.abspath(__file__))
+        xml = test_utils.read_file(os.path.join(here, 'test_apdetail.xml'))
+        self.obj.session = FakeSession(xml)
+
+    def tearDown(self):
+        """Tear down."""
+
+    def test_init(self):
+        """Test init."""
+        self.assertEqual(self.obj.username, 'username')
+        self.assertEqual(self.obj.password, 'password')
+        self.assertEqual(self.obj.url, self.url)
+        self.assertEqual(self.obj.max_concurrency, 2)
+
+    def test_requests(self):
+        """Test request URLs and parameters."""
+        res = run(self.obj.ap_list([1, 2]))
+        self.assertEqual(res.url, '%s/ap_list.xml' % self.url)
+        self.assertEqual(res.params, [('id', '1'), ('id', '2')])
+
+        res = run(self.obj.client_detail('12:34:56:78:90:AB'))
+        self.assertEqual(res.url, '%s/client_detail.xml' % self.url)
+        self.assertEqual(res.params, [('mac', '12:34:56:78:90:AB')])
+
+        res = run(self.obj.latest_report(1))
+        self.assertEqual(res.url, '%s/latest_report.xml' % self.url)
+        self.assertEqual(res.params, [('id', '1')])
+
+    def test_ap_detail_many(self):
+        """Test ap_detail_many."""
+        async def collect():
+            """Collect results."""
+            return [item async for item in
+                    self.obj.ap_detail_many([1, 2, 3, 4, 5])]
+
+        results = dict(run(collect()))
+        self.assertEqual(sorted(results), [1, 2, 3, 4, 5])
+        self.assertTrue(isinstance(results[1], APDetail))
+        self.assertTrue(isinstance(results[3], Exception))
+        self.assertEqual(self.obj.session.max_in_flight, 2)
@@ -2,9 +2,38 @@
 
 """UnitTests for airwaveapiclient."""
 
+import os
+import threading
 import unittest
 from httmock import all_requests, response, HTTMock
+import requests
 from airwaveapiclient import AirWaveAPIClient
+from airwaveapiclient import APDetail
+from airwaveapiclient import APList
+from airwaveapiclient import ConcurrencyLimiter
+from airwaveapiclient import FolderList
+from airwaveapiclient import TokenBucket
+from airwaveapiclient.tests import test_utils
+
+
+class PoolAdapter(requests.adapters.HTTPAdapter):
+
+    """HTTPAdapter taking a connection of its pool without sending."""
+
+    def send(self, request, **kwargs):
+        """Check a connection out of the pool and back, answer 200."""
+        # pylint: disable=protected-access
+        pool = self.poolmanager.connection_from_url(request.url)
+        conn = pool._get_conn()
+        pool.num_requests += 1
+        pool._put_conn(conn)
+        res = requests.Response()
+        res.status_code = 200
+        res.headers['content-type'] = 'application/xml'
+        res._content = b'xml string'
+        res.url = request.url
+        res.request = request
+        return res
 
 
 # pylint: disable=unused-argument
@@ -42,6 +71,49 @@ class AirWaveAPIClientUnitTests(unittest.TestCase):
         self.assertEqual(self.obj.url, self.url)
         self.assertNotEqual(self.obj.session, None)
 
+    def test_pool_options(self):
+        """Test connection pool options."""
+        adapter = self.obj.session.get_adapter(self.url)
+        self.assertEqual(adapter._pool_connections, 10)
+        self.assertEqual(adapter._pool_maxsize, 10)
+        self.assertNotEqual(self.obj.session.headers.get('Connection'),
+                            'close')
+
+        obj = AirWaveAPIClient(username=self.username,
+                               password=self.password,
+                               url=self.url,
+                               pool_connections=2,
+                               pool_maxsize=32,
+                               pool_block=True,
+                               keep_alive=False,
+                               timeout=(5, 60))
+        with HTTMock(AirWaveAPIClientUnitTests.content_login):
+            obj.login()
+        adapter = obj.session.get_adapter(self.url)
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter._pool_block, True)
+        self.assertEqual(obj.session.headers['Connection'], 'close')
+        self.assertEqual(obj.timeout, (5, 60))
+        obj.logout()
+
+    def test_pool_stats(self):
+        """Test pool_stats."""
+        with HTTMock(AirWaveAPIClientUnitTests.content_api_xml):
+            self.obj.ap_list()
+        stats = self.obj.pool_stats()
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertEqual(stats['max_in_flight'], 1)
+        self.assertEqual(stats['concurrency'], None)
+        self.assertEqual(stats['pools'], [])
+
+        self.obj.session.mount('https://', PoolAdapter(pool_maxsize=4))
+        self.obj.ap_list()
+        self.obj.ap_list()
+        self.assertEqual(self.obj.pool_stats()['pools'], [
+            {'host': '192.168.1.1', 'maxsize': 4, 'num_connections': 1,
+             'num_requests': 2, 'idle': 1}])
+
     def test_api_path(self):
         """Test API path."""
         path = 'ap_list.xml'
@@ -54,6 +126,14 @@ class AirWaveAPIClientUnitTests(unittest.TestCase):
         params = self.obj.id_params(ap_ids)
         self.assertEqual(params, 'id=1&id=2&id=3')
 
+    def test_id_chunks(self):
+        """Test ID chunks."""
+        chunks = list(self.obj.id_chunks(range(1, 30), 20))
+        self.assertEqual(sum(chunks, []), list(range(1, 30)))
+        for chunk in chunks:
+            self.assertTrue(len(self.obj.id_params(chunk)) <= 20)
+        self.assertEqual(list(self.obj.id_chunks([], 20)), [])
+
     def test_urlencode(self):
         """Test urlencode."""
         params = {'mac': '12:34:56:78:90:AB'}
@@ -140,6 +220,237 @@ class AirWaveAPIClientUnitTests(unittest.TestCase):
         url = '%s/%s?%s' % (self.url, path_latest_report, params)
         self.assertEqual(res.url, url)
 
+    def test_ap_detail_many(self):
+        """Test ap_detail_many."""
+        here = os.path.dirname(os.path.abspath(__file__))
+        xml = test_utils.read_file(os.path.join(here, 'test_apdetail.xml'))
+
+        @all_requests
+        def content_ap_detail(url, request):
+            """Test content for ap_detail, failing for id=3."""
+            if url.query == 'id=3':
+                return response(status_code=500, request=request)
+            headers = {'content-type': 'application/xml'}
+            return response(status_code=200,
+                            content=xml.encode('utf-8'),
+                            headers=headers,
+                            request=request)
+
+        with HTTMock(content_ap_detail):
+            results = dict(self.obj.ap_detail_many([1, 2, 3],
+                                                   max_workers=2))
+        self.assertEqual(sorted(results), [1, 2, 3])
+        self.assertTrue(isinstance(results[1], APDetail))
+        self.assertEqual(results[2]['@id'], '1')
+        self.assertTrue(isinstance(results[3], Exception))
+
+    def test_graph_data_many(self):
+        """Test graph_data and graph_data_many."""
+        xport = (b'<xport><meta><start>0</start><step>300</step>'
+                 b'<legend><entry>noise</entry></legend></meta>'
+                 b'<data><row><t>0</t><v>-9.5e+01</v></row></data></xport>')
+        requested = []
+
+        @all_requests
+        def content_graph_data(url, request):
+            """Test content for graph_data, failing for id=3."""
+            requested.append(request.url)
+            if 'id=3' in url.query:
+                return response(status_code=500, request=request)
+            return response(status_code=200,
+                            content=xport,
+                            headers={'content-type': 'application/xml'},
+                            request=request)
+
+        urls = ['%s/nf/rrd_graph?end=0s&id=%d&radio_index=1&start=-7200s'
+                '&type=ap_client_count' % (self.url, i) for i in (1, 2, 3)]
+        with HTTMock(content_graph_data):
+            res = self.obj.graph_data(urls[0])
+            results = dict(self.obj.graph_data_many(urls, max_workers=2))
+        self.assertEqual(res.url, urls[0].replace('rrd_graph', 'rrd_xport'))
+        self.assertEqual(len(requested), 4)
+        self.assertEqual(sorted(results), sorted(urls))
+        self.assertEqual(list(results[urls[1]].column('noise')), [-95.0])
+        self.assertTrue(isinstance(results[urls[2]], Exception))
+
+    def test_ap_list_many(self):
+        """Test ap_list_many."""
+        requested = []
+
+        @all_requests
+        def content_ap_list(url, request):
+            """Test content for ap_list with the requested ids."""
+            ids = [param[3:] for param in url.query.split('&')]
+            requested.append(ids)
+            aps = ''.join(['<ap id="%s"><name>AP%s</name></ap>' % (i, i)
+                           for i in ids])
+            content = ('<?xml version="1.0" encoding="utf-8"?>'
+                       '<amp:amp_ap_list xmlns:amp="http://www.airwave.com">'
+                       '%s</amp:amp_ap_list>' % aps)
+            return response(status_code=200,
+                            content=content.encode('utf-8'),
+                            headers={'content-type': 'application/xml'},
+                            request=request)
+
+        self.obj.max_url_length = 100
+        ap_ids = list(range(1, 101))
+        with HTTMock(content_ap_list):
+            objs = self.obj.ap_list_many(ap_ids, max_workers=4)
+        self.assertTrue(isinstance(objs, APList))
+        self.assertTrue(len(requested) > 1)
+        self.assertEqual([int(obj['@id']) for obj in objs], ap_ids)
+        self.assertEqual(objs.search(50)['name'], 'AP50')
+
+        with HTTMock(content_ap_list):
+            objs = self.obj.ap_list_many([7], typed=True)
+        self.assertEqual(objs[0].id, 7)
+
+        with HTTMock(content_ap_list):
+            objs = self.obj.ap_list_many([7])
+        self.assertEqual(len(objs), 1)
+        self.assertEqual(objs.search(7)['name'], 'AP7')
+
+        self.obj.max_url_length = 30
+        with HTTMock(content_ap_list):
+            objs = self.obj.ap_list_many([1, 2, 3])
+        self.assertEqual([obj['@id'] for obj in objs], ['1', '2', '3'])
+        self.assertEqual(objs.search(3)['name'], 'AP3')
+
+    def test_folder_list_many(self):
+        """Test folder_list_many."""
+        @all_requests
+        def content_folder_list(url, request):
+            """Test content for folder_list."""
+            content = ('<?xml version="1.0" encoding="utf-8"?>'
+                       '<amp:amp_folder_list '
+                       'xmlns:amp="http://www.airwave.com">'
+                       '<folder id="1"><name>Top</name></folder>'
+                       '</amp:amp_folder_list>')
+            return response(status_code=200,
+                            content=content.encode('utf-8'),
+                            headers={'content-type': 'application/xml'},
+                            request=request)
+
+        with HTTMock(content_folder_list):
+            objs = self.obj.folder_list_many([1, 2])
+        self.assertTrue(isinstance(objs, FolderList))
+        self.assertEqual(objs[0]['name'], 'Top')
+
+    def test_relogin(self):
+        """Test login again when the session expired."""
+        login_page = (b'<html><form><input name="credential_0">'
+                      b'</form></html>')
+        here = os.path.dirname(os.path.abspath(__file__))
+        xml = test_utils.read_file(os.path.join(here, 'test_apdetail.xml'))
+        state = {'logins': 0}
+        lock = threading.Lock()
+
+        @all_requests
+        def content_expiring(url, request):
+            """Login page until a new login, then API XML."""
+            with lock:
+                if url.path == '/LOGIN':
+                    state['logins'] += 1
+                    return response(status_code=200, content='',
+                                    request=request)
+                expired = state['logins'] < 1
+            if expired:
+                return response(status_code=200,
+                                content=login_page,
+                                headers={'content-type': 'text/html'},
+                                request=request)
+            return response(status_code=200,
+                            content=xml.encode('utf-8'),
+                            headers={'content-type': 'application/xml'},
+                            request=request)
+
+        with HTTMock(content_expiring):
+            results = dict(self.obj.ap_detail_many(range(1, 9),
+                                                   max_workers=4))
+        self.assertEqual(state['logins'], 1)
+        self.assertEqual(self.obj.login_generation, 1)
+        for obj in results.values():
+            self.assertTrue(isinstance(obj, APDetail))
+
+        @all_requests
+        def content_login_page(url, request):
+            """Login page for every request."""
+            return response(status_code=200,
+                            content=login_page,
+                            headers={'content-type': 'text/html'},
+                            request=request)
+
+        with HTTMock(content_login_page):
+            self.assertRaises(requests.exceptions.HTTPError,
+                              self.obj.ap_detail, 1)
+            self.obj.relogin = False
+            self.assertEqual(self.obj.ap_detail(1).content, login_page)
+
+    def test_retries(self):
+        """Test retries with backoff."""
+        statuses = [500, 503, 200]
+        requested = []
+
+        @all_requests
+        def content_flaky(url, request):
+            """Fail with 5xx, then succeed."""
+            status = statuses[len(requested)]
+            requested.append(status)
+            if status == 503:
+                raise requests.exceptions.ConnectionError('reset')
+            return response(status_code=status, content='xml string',
+                            request=request)
+
+        delays = []
+        self.obj.sleep = delays.append
+        self.obj.retries = 3
+        self.obj.backoff = 1
+        self.obj.backoff_max = 1.5
+        with HTTMock(content_flaky):
+            res = self.obj.ap_detail(1)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(requested, [500, 503, 200])
+        self.assertEqual(len(delays), 2)
+        self.assertTrue(0 <= delays[0] <= 1)
+        self.assertTrue(0 <= delays[1] <= 1.5)
+
+        del requested[:]
+        self.obj.retries = 1
+        with HTTMock(content_flaky):
+            self.assertRaises(requests.exceptions.ConnectionError,
+                              self.obj.ap_detail, 1)
+        self.assertEqual(requested, [500, 503])
+
+    def test_rate_limit_and_concurrency(self):
+        """Test rate_limit and concurrency."""
+        lock = threading.Lock()
+        state = {'in_flight': 0, 'max_in_flight': 0}
+
+        @all_requests
+        def content_overloaded(url, request):
+            """Fail ids above 10 with 503."""
+            with lock:
+                state['in_flight'] += 1
+                state['max_in_flight'] = max(state['max_in_flight'],
+                                             state['in_flight'])
+            status = 503 if int(url.query[3:]) > 10 else 200
+            with lock:
+                state['in_flight'] -= 1
+            return response(status_code=status, content='xml string',
+                            request=request)
+
+        self.obj.rate_limit = TokenBucket(1000, burst=100)
+        self.obj.concurrency = ConcurrencyLimiter(initial=2, max_limit=2)
+        with HTTMock(content_overloaded):
+            results = list(self.obj.ap_detail_many(range(1, 21),
+                                                   max_workers=8))
+        self.assertEqual(len(results), 20)
+        self.assertTrue(state['max_in_flight'] <= 2)
+        stats = self.obj.pool_stats()['concurrency']
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertTrue(stats['error_rate'] > 0)
+        self.assertTrue(stats['limit'] < 2)
+
     @staticmethod
     @all_requests
     def content_login(url, request):
@@ -38,3 +38,29 @@ class APDetailUnitTests(unittest.TestCase):
                 self.assertEqual(radio['radio_interface'], '2')
             if radio['radio_type'] == 'aN':
                 self.assertEqual(radio['radio_interface'], '1')
+
+    def test_init_bytes(self):
+        """Test init from bytes."""
+        content = self.ap_detail.encode('utf-8')
+        self.assertEqual(APDetail(content), self.obj)
+        self.assertEqual(APDetail(content, typed=True),
+                         APDetail(self.ap_detail, typed=True))
+
+    def test_init_lazy(self):
+        """Test init with lazy clients and neighbor access points."""
+        obj = APDetail(self.ap_detail.encode('utf-8'), lazy=True)
+        self.assertEqual(list(obj), list(self.obj))
+        for radio, _radio in zip(obj['radio'], self.obj['radio']):
+            self.assertEqual(list(radio), list(_radio))
+            for tag in ('client', 'neighbor_ap'):
+                lazy = radio[tag]
+                self.assertTrue(lazy.items is None)
+                nodes = _radio[tag]
+                if not isinstance(nodes, list):
+                    nodes = [nodes]
+                self.assertEqual(len(lazy), len(nodes))
+                self.assertTrue(lazy.items is None)
+                self.assertEqual(lazy[0], nodes[0])
+                self.assertEqual(lazy, nodes)
+        self.assertRaises(ValueError, APDetail, self.ap_detail,
+                          typed=True, lazy=True)
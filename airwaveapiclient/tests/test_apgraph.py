@@ -59,28 +59,23 @@ class APGraphUnitTests(unittest.TestCase):
         self.assertEqual(ap_graph.default_start_time, -7200)
         self.assertEqual(ap_graph.default_end_time, 0)
 
-    # pylint: disable=protected-access
     def test_graph_url(self):
-        """Test Graph URL."""
-        params = {u'aaa': u''}
-        ap_graph = APGraph(self.url, self.objs[0])
-        url = ap_graph._APGraph__graph_url(params)
-        self.assertEqual(url, None)
-
-        params = {u'radio_index': u'',
-                  u'start': u'',
-                  u'end': u''}
-        ap_graph = APGraph(self.url, self.objs[0])
-        url = ap_graph._APGraph__graph_url(params)
-        _url = (u'https://192.168.1.1/nf/rrd_graph?'
-                u'end=0s&radio_index=&start=-7200s')
-        self.assertEqual(url, _url)
-
+        """Test Graph URL defaults and instance settings."""
         ap_graph = APGraph(self.url, self.objs[3])
-        url = ap_graph._APGraph__graph_url(params)
+        self.assertEqual(ap_graph.client_count_802dot11an(), None)
         _url = (u'https://192.168.1.1/nf/rrd_graph?'
-                u'end=0s&radio_index=&start=-7200s')
-        self.assertEqual(url, _url)
+                u'end=0s&id=4&radio_index=1&start=-7200s&'
+                u'type=ap_client_count')
+        self.assertEqual(ap_graph.client_count_802dot11bgn(start=u'',
+                                                           end=u''), _url)
+
+        ap_graph.default_start_time = -60
+        ap_graph.default_end_time = -30
+        ap_graph.path = u'/nf/other_graph'
+        _url = (u'https://192.168.1.1/nf/other_graph?'
+                u'end=-30s&id=4&radio_index=1&start=-60s&'
+                u'type=ap_client_count')
+        self.assertEqual(ap_graph.client_count_802dot11bgn(), _url)
 
     def test_client_count_802dot11bgn(self):
         """Test for client_count_802dot11bgn."""
@@ -468,3 +463,100 @@ class APGraphUnitTests(unittest.TestCase):
         ap_graph = APGraph(self.url, self.objs[0])
         graph_url = ap_graph.channel_utilization_802dot11ac()
         self.assertEqual(graph_url, None)
+
+    def test_bulk_urls(self):
+        """Test for bulk_urls."""
+        names = {u'ap_client_count': u'client_count',
+                 u'ap_bandwidth': u'bandwidth'}
+        suffixes = {u'bgn': u'802dot11bgn',
+                    u'aN': u'802dot11an',
+                    u'ac': u'802dot11ac'}
+        expected = []
+        for obj in self.objs:
+            ap_graph = APGraph(self.url, obj)
+            for radio_type in (u'bgn', u'aN', u'ac'):
+                for graph_type in (APGraph.AP_GRAPH_TYPES +
+                                   APGraph.RADIO_GRAPH_TYPES):
+                    name = u'%s_%s' % (names.get(graph_type, graph_type),
+                                       suffixes[radio_type])
+                    graph_url = getattr(ap_graph, name)(start=-3600)
+                    if graph_url is not None:
+                        expected.append((obj['@id'], graph_type,
+                                         radio_type, graph_url))
+        rows = list(APGraph.bulk_urls(self.url, self.objs, start=-3600))
+        self.assertEqual(rows, expected)
+
+        rows = list(APGraph.bulk_urls(self.url, self.objs[:1],
+                                      [u'ap_client_count'], [u'aN']))
+        _graph_url = ('https://192.168.1.1/nf/rrd_graph?'
+                      'end=0s&'
+                      'id=1&'
+                      'radio_index=2&'
+                      'start=-7200s&'
+                      'type=ap_client_count')
+        self.assertEqual(rows, [(u'1', u'ap_client_count', u'aN',
+                                 _graph_url)])
+        self.assertEqual(list(APGraph.bulk_urls(self.url, self.objs,
+                                                radio_types=[u'xx'])), [])
+
+    def test_bulk_urls_missing_ids(self):
+        """Test bulk_urls skips what the per-AP methods cannot build."""
+        first, second = self.objs[0], self.objs[1]
+        del first['@id']
+        del second['lan_mac']
+        rows = list(APGraph.bulk_urls(self.url, [first, second],
+                                      radio_types=['bgn']))
+        self.assertEqual([row[1] for row in rows],
+                         list(APGraph.AP_GRAPH_TYPES))
+        self.assertEqual(set(row[0] for row in rows), set([u'2']))
+
+    def test_missing_radio_interface(self):
+        """Test radios without radio_interface."""
+        node = self.objs[0]
+        del node['radio'][0]['radio_interface']
+        ap_graph = APGraph(self.url, node)
+        self.assertRaises(KeyError, ap_graph.radio_noise_802dot11bgn)
+        self.assertNotEqual(ap_graph.client_count_802dot11bgn(), None)
+        rows = list(APGraph.bulk_urls(self.url, [node], radio_types=['bgn']))
+        self.assertEqual([row[1] for row in rows],
+                         list(APGraph.AP_GRAPH_TYPES))
+
+    def test_graph_time_format(self):
+        """Test for graph_time_format."""
+        self.assertEqual(APGraph.graph_time_format(-3600), '-3600s')
+        self.assertEqual(APGraph.graph_time_format(0), '0s')
+        self.assertEqual(APGraph.graph_time_format('-3600'), '-3600s')
+        self.assertEqual(APGraph.graph_time_format('-3600s'), '-3600s')
+        self.assertEqual(APGraph.graph_time_format(-3600.0), '-3600s')
+        self.assertEqual(APGraph.graph_time_format('now'), '0s')
+
+    def test_cached_url(self):
+        """Test graph URLs built from cached parts."""
+        ap_graph = APGraph(self.url, self.objs[0])
+        graph_url = ap_graph.radio_noise_802dot11bgn(start=-3600, end=-60)
+        _graph_url = ('https://192.168.1.1/nf/rrd_graph?'
+                      'ap_uid=00%3A00%3A10%3A00%3A00%3A01&'
+                      'end=-60s&'
+                      'radio_index=1&'
+                      'radio_interface=2&'
+                      'start=-3600s&'
+                      'type=radio_noise')
+        self.assertEqual(graph_url, _graph_url)
+        self.assertEqual(ap_graph.radio_noise_802dot11bgn(start=-3600,
+                                                          end=-60),
+                         _graph_url)
+
+        ap_graph['lan_mac'] = u'00:00:10:00:00:09'
+        graph_url = ap_graph.radio_noise_802dot11bgn(start=-3600, end=-60)
+        self.assertEqual(graph_url,
+                         _graph_url.replace('%3A01&', '%3A09&'))
+
+        ap_graph.url = u'https://192.168.1.2/'
+        graph_url = ap_graph.client_count_802dot11bgn()
+        _graph_url = ('https://192.168.1.2/nf/rrd_graph?'
+                      'end=0s&'
+                      'id=1&'
+                      'radio_index=1&'
+                      'start=-7200s&'
+                      'type=ap_client_count')
+        self.assertEqual(graph_url, _graph_url)
@@ -2,8 +2,11 @@
 
 """UnitTests for airwaveapiclient."""
 
+import copy
 import os
 import unittest
+import requests
+from httmock import all_requests, response, HTTMock
 from airwaveapiclient import APList
 from airwaveapiclient.tests import test_utils
 
@@ -74,3 +77,123 @@ class APListUnitTests(unittest.TestCase):
         ap_name = 'AP005'
         ap_node = self.obj.search(ap_name)
         self.assertEqual(ap_node, None)
+
+    def test_iter_from_response(self):
+        """Test iter_from_response."""
+        @all_requests
+        def content_ap_list(url, request):
+            """Test content for ap_list."""
+            headers = {'content-type': 'application/xml'}
+            return response(status_code=200,
+                            content=self.ap_list.encode('utf-8'),
+                            headers=headers,
+                            request=request)
+
+        with HTTMock(content_ap_list):
+            res = requests.get('https://192.168.1.1/ap_list.xml',
+                               stream=True)
+            nodes = list(APList.iter_from_response(res, chunk_size=64))
+        self.assertEqual(len(nodes), 4)
+        self.assertEqual(nodes, list(self.obj))
+
+    def test_search_by(self):
+        """Test search_by."""
+        ap_node = self.obj.search_by('@id', '2')
+        self.assertEqual(ap_node['name'], 'AP002')
+
+        ap_node = self.obj.search_by('lan_mac', '00:00:10:00:00:03')
+        self.assertEqual(ap_node['@id'], '3')
+
+        ap_node = self.obj.search_by('lan_ip', '10.0.0.4')
+        self.assertEqual(ap_node['@id'], '4')
+
+        ap_node = self.obj.search_by('serial_number', 'BT0000001')
+        self.assertEqual(ap_node['@id'], '1')
+
+        ap_node = self.obj.search_by('radio_mac', '10:00:00:00:00:02')
+        self.assertEqual(ap_node['@id'], '1')
+
+        ap_node = self.obj.search_by('name', 'AP005')
+        self.assertEqual(ap_node, None)
+
+        with self.assertRaises(ValueError):
+            self.obj.search_by('firmware', '6.3.1.14')
+
+    def test_search_invalidate(self):
+        """Test indexes are invalidated on mutation."""
+        self.assertNotEqual(self.obj.search(1), None)
+        node = self.obj.pop(0)
+        self.assertEqual(self.obj.search(1), None)
+        self.obj.append(node)
+        self.assertEqual(self.obj.search(1), node)
+        self.obj[-1] = self.obj[0]
+        self.assertEqual(self.obj.search(1), None)
+        del self.obj[:]
+        self.assertEqual(self.obj.search('AP002'), None)
+
+    def test_search_invalidate_order(self):
+        """Test indexes are invalidated by sort and reverse."""
+        node = copy.deepcopy(self.obj[1])
+        node['@id'] = '9'
+        self.obj.append(node)
+        self.assertEqual(self.obj.search_by('name', 'AP002')['@id'], '2')
+        self.obj.reverse()
+        self.assertEqual(self.obj.search_by('name', 'AP002')['@id'], '9')
+        self.obj.sort(key=lambda node: int(node['@id']))
+        self.assertEqual(self.obj.search_by('name', 'AP002')['@id'], '2')
+
+    def test_diff(self):
+        """Test diff."""
+        new = APList(self.ap_list)
+        delta = self.obj.diff(new)
+        self.assertEqual(delta, ([], [], []))
+
+        removed = new.pop(3)
+        added = copy.deepcopy(new[0])
+        added['@id'] = '5'
+        new.append(added)
+        new[0]['is_up'] = 'false'
+        new[1]['radio'][1]['display_channel'] = '64'
+        new[1]['group']['#text'] = 'Other'
+        delta = self.obj.diff(new)
+        self.assertEqual(delta.added, [added])
+        self.assertEqual(delta.removed, [removed])
+        changed = [(old['@id'], node['@id'], paths)
+                   for old, node, paths in delta.changed]
+        self.assertEqual(changed, [
+            ('1', '1', ['is_up']),
+            ('2', '2', ['group.#text', 'radio[2].display_channel'])])
+
+        new[2]['radio'] = new[2]['radio'][0]
+        delta = self.obj.diff(new)
+        self.assertEqual(delta.changed[-1][2], ['radio[2]'])
+
+    def test_diff_typed(self):
+        """Test diff of typed records."""
+        old = APList(self.ap_list, typed=True)
+        new = APList(self.ap_list.replace('<firmware>6.3.1.14',
+                                          '<firmware>6.4.0.0'), typed=True)
+        delta = old.diff(new)
+        self.assertEqual(len(delta.changed), 4)
+        self.assertEqual(delta.changed[0][2], ['firmware'])
+
+    def test_init_bytes_and_response(self):
+        """Test init from bytes and from a Response."""
+        content = self.ap_list.encode('utf-8')
+        self.assertEqual(APList(content), self.obj)
+        self.assertEqual(APList(content, typed=True),
+                         APList(self.ap_list, typed=True))
+
+        @all_requests
+        def content_ap_list(url, request):
+            """Test content for ap_list."""
+            headers = {'content-type': 'application/xml'}
+            return response(status_code=200,
+                            content=content,
+                            headers=headers,
+                            request=request)
+
+        with HTTMock(content_ap_list):
+            res = requests.get('https://192.168.1.1/ap_list.xml')
+        self.assertEqual(APList(res), self.obj)
+        self.assertEqual(len(APList(res, typed=True)), 4)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for cache."""
+
+import os
+import unittest
+from httmock import all_requests, response, HTTMock
+from airwaveapiclient import AirWaveAPIClient
+from airwaveapiclient import APList
+from airwaveapiclient import ResponseCache
+from airwaveapiclient.tests import test_utils
+
+
+class ResponseCacheUnitTests(unittest.TestCase):
+
+    """Class ResponseCacheUnitTests.
+
+    Unit test for ResponseCache.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        here = os.path.dirname(os.path.abspath(__file__))
+        self.ap_list = test_utils.read_file(os.path.join(here,
+                                                         'test_aplist.xml'))
+        self.now = 1000.0
+        self.cache = ResponseCache(ttl={'ap_list.xml': 60}, maxsize=2)
+        self.cache.clock = lambda: self.now
+        self.obj = AirWaveAPIClient(username='username',
+                                    password='password',
+                                    url='https://192.168.1.1',
+                                    cache=self.cache)
+        self.requests = []
+        with HTTMock(self.content):
+            self.obj.login()
+
+    def tearDown(self):
+        """Tear down."""
+        self.obj.logout()
+
+    def content(self, url, request):
+        """Test content with an ETag."""
+        self.requests.append(request)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return response(status_code=304, request=request)
+        headers = {'content-type': 'application/xml', 'ETag': '"v1"'}
+        return response(status_code=200,
+                        content=self.ap_list.encode('utf-8'),
+                        headers=headers,
+                        request=request)
+
+    def get(self, func, *args):
+        """Call a client method with the test content."""
+        with HTTMock(all_requests(self.content)):
+            return func(*args)
+
+    def test_hit(self):
+        """Test fresh responses are served from the cache."""
+        del self.requests[:]
+        res1 = self.get(self.obj.ap_list)
+        res2 = self.get(self.obj.ap_list)
+        self.assertTrue(res1 is res2)
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        # Parameters are part of the key.
+        res3 = self.get(self.obj.ap_list, [1, 2])
+        self.assertFalse(res3 is res1)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_not_cached(self):
+        """Test endpoints without TTL are not cached."""
+        del self.requests[:]
+        self.get(self.obj.amp_stats)
+        self.get(self.obj.amp_stats)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_revalidate(self):
+        """Test expired responses are revalidated."""
+        del self.requests[:]
+        res1 = self.get(self.obj.ap_list)
+        self.now += 61
+        res2 = self.get(self.obj.ap_list)
+        self.assertTrue(res1 is res2)
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[1].headers['If-None-Match'], '"v1"')
+        self.assertEqual(self.cache.revalidations, 1)
+
+        self.get(self.obj.ap_list)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_lru(self):
+        """Test the cache size is bounded."""
+        for ap_ids in ([1], [2], [3]):
+            self.get(self.obj.ap_list, ap_ids)
+        self.assertEqual(len(self.cache.entries), 2)
+        self.cache.clear()
+        self.assertEqual(len(self.cache.entries), 0)
+
+    def test_parse(self):
+        """Test parsed objects are reused."""
+        res = self.get(self.obj.ap_list)
+        objs1 = self.obj.parse(res, APList)
+        objs2 = self.obj.parse(self.get(self.obj.ap_list), APList)
+        self.assertTrue(objs1 is objs2)
+        self.assertEqual(len(objs1), 4)
+
+        res = self.get(self.obj.amp_stats)
+        self.assertFalse(self.cache.parse(res, list) is
+                         self.cache.parse(res, list))
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for client_table."""
+
+import math
+import os
+import unittest
+from httmock import HTTMock, all_requests
+import requests
+from airwaveapiclient import APDetail
+from airwaveapiclient import ClientTable
+from airwaveapiclient import client_table
+from airwaveapiclient.tests import test_utils
+
+
+class ClientTableUnitTests(unittest.TestCase):
+
+    """Class ClientTableUnitTests.
+
+    Unit test for ClientTable.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        self.here = os.path.dirname(os.path.abspath(__file__))
+        path = os.path.join(self.here, 'test_apdetail.xml')
+        self.ap_detail = test_utils.read_file(path)
+
+    def tearDown(self):
+        """Tear down."""
+
+    def test_add(self):
+        """Test add."""
+        for kwargs in ({}, {'typed': True}, {'lazy': True}):
+            table = ClientTable()
+            table.add(APDetail(self.ap_detail, **kwargs))
+            self.assertEqual(len(table), 6)
+            self.assertEqual(list(table.ap_id), [1] * 6)
+            self.assertEqual(list(table.radio_index), [1, 1, 1, 2, 2, 2])
+            self.assertEqual(list(table.assoc_stat), [0, 0, 0, 1, 1, 1])
+            self.assertEqual(table.snr[0], 51.0)
+            self.assertTrue(math.isnan(table.snr[3]))
+
+    def test_add_response(self):
+        """Test add with a response."""
+        @all_requests
+        def _response(*_):
+            """Set response."""
+            return {'status_code': 200, 'content': self.ap_detail}
+
+        with HTTMock(_response):
+            res = requests.get('https://192.168.1.1/ap_detail.xml',
+                               stream=True)
+        table = ClientTable()
+        table.add(res)
+        self.assertEqual(len(table), 6)
+
+    def test_extend(self):
+        """Test extend."""
+        error = requests.exceptions.HTTPError('404')
+        details = [(1, APDetail(self.ap_detail)), (2, error)]
+        table = ClientTable()
+        self.assertEqual(table.extend(details), [(2, error)])
+        self.assertEqual(len(table), 6)
+
+    def test_repoll(self):
+        """Test adding an Access Point again replaces its rows."""
+        ap_detail_2 = self.ap_detail.replace('<ap id="1">', '<ap id="2">')
+        table = ClientTable()
+        table.add(APDetail(self.ap_detail))
+        table.add(APDetail(self.ap_detail))
+        self.assertEqual(len(table), 6)
+        self.assertEqual(table.snr_histogram(10), [(30, 2), (40, 2), (50, 1)])
+        self.assertEqual(len(table.radio_mac), 6)
+        table.add(APDetail(ap_detail_2))
+        self.assertEqual(table.lookup('A1:02:00:00:00:C2')['ap_id'], 2)
+        table.add(APDetail(self.ap_detail))
+        self.assertEqual(len(table), 12)
+        self.assertEqual(table.lookup('A1:02:00:00:00:C2')['ap_id'], 1)
+        self.assertEqual(table.snr_histogram(10), [(30, 4), (40, 4), (50, 2)])
+        self.assertEqual(list(table.ap_id), [2] * 6 + [1] * 6)
+        self.assertEqual(table.ranges, {2: (0, 6), 1: (6, 12)})
+
+    def test_missing_mac(self):
+        """Test rows without a MAC address are not indexed."""
+        table = ClientTable()
+        table.add({'@id': '1', 'radio': {'@index': '1', 'client': [
+            {'@id': '1', 'snr': '20'}, {'@id': '2', 'snr': '30'}]}})
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.index, {})
+
+    def test_lookup(self):
+        """Test lookup."""
+        table = ClientTable([APDetail(self.ap_detail)])
+        row = table.lookup('a1:02:00:00:00:c2')
+        self.assertEqual(row['client_id'], 12000002)
+        self.assertEqual(row['radio_index'], 2)
+        self.assertEqual(row['radio_mac'], 'A1:02:00:00:00:C2')
+        self.assertEqual(table.lookup('00:00:00:00:00:00'), None)
+
+    def test_snr_histogram(self):
+        """Test snr_histogram."""
+        table = ClientTable([APDetail(self.ap_detail)])
+        expected = [(30, 2), (40, 2), (50, 1)]
+        self.assertEqual(table.snr_histogram(10), expected)
+        numpy = client_table.numpy
+        client_table.numpy = None
+        try:
+            self.assertEqual(table.snr_histogram(10), expected)
+        finally:
+            client_table.numpy = numpy
+
+    def test_to_numpy(self):
+        """Test to_numpy."""
+        table = ClientTable([APDetail(self.ap_detail)])
+        if client_table.numpy is None:
+            self.assertRaises(ImportError, table.to_numpy)
+            return
+        columns = table.to_numpy()
+        self.assertEqual(list(columns['assoc_stat']), [0, 0, 0, 1, 1, 1])
+        self.assertEqual(columns['radio_mac'][0], 'A1:01:00:00:00:C1')
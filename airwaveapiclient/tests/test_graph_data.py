@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for graph_data."""
+
+import math
+import unittest
+from airwaveapiclient import GraphData
+from airwaveapiclient import graph_data
+
+
+XPORT = b'''<?xml version="1.0" encoding="ISO-8859-1"?>
+<xport>
+  <meta>
+    <start>1565000000</start>
+    <step>300</step>
+    <end>1565000600</end>
+    <rows>3</rows>
+    <columns>2</columns>
+    <legend>
+      <entry>noise</entry>
+      <entry>utilization</entry>
+    </legend>
+  </meta>
+  <data>
+    <row><t>1565000000</t><v>-9.5000000000e+01</v><v>1.2e+01</v></row>
+    <row><t>1565000300</t><v>NaN</v><v>1.4e+01</v></row>
+    <row><t>1565000600</t><v>-9.3000000000e+01</v><v>1.6e+01</v></row>
+  </data>
+</xport>
+'''
+
+
+class GraphDataUnitTests(unittest.TestCase):
+
+    """Class GraphDataUnitTests.
+
+    Unit test for GraphData.
+
+    """
+
+    def test_init(self):
+        """Test init."""
+        obj = GraphData(XPORT)
+        self.assertEqual(obj.start, 1565000000)
+        self.assertEqual(obj.end, 1565000600)
+        self.assertEqual(obj.step, 300)
+        self.assertEqual(obj.legend, ['noise', 'utilization'])
+        self.assertEqual(len(obj), 3)
+        self.assertEqual(list(obj.timestamps),
+                         [1565000000, 1565000300, 1565000600])
+        self.assertEqual(obj.columns[0].typecode, 'd')
+        self.assertEqual(obj.column('noise')[0], -95.0)
+        self.assertTrue(math.isnan(obj.column('noise')[1]))
+        self.assertEqual(list(obj.column('utilization')), [12.0, 14.0, 16.0])
+
+    def test_init_without_timestamps(self):
+        """Test rows without <t>, as newer rrdtool versions write them."""
+        xml = XPORT.replace(b'<t>', b'<!--').replace(b'</t>', b'-->')
+        obj = GraphData(xml.decode('utf-8'))
+        self.assertEqual(list(obj.timestamps),
+                         [1565000000, 1565000300, 1565000600])
+
+    def test_to_numpy(self):
+        """Test to_numpy."""
+        obj = GraphData(XPORT)
+        if graph_data.numpy is None:
+            self.assertRaises(ImportError, obj.to_numpy)
+            return
+        timestamps, values = obj.to_numpy()
+        self.assertEqual(str(timestamps.dtype), 'int64')
+        self.assertEqual(values.shape, (3, 2))
+        self.assertEqual(values[2, 0], -93.0)
+        self.assertEqual(list(values[:, 1]), [12.0, 14.0, 16.0])
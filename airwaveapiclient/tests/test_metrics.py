@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for metrics."""
+
+import os
+import unittest
+from httmock import HTTMock, all_requests, response
+import requests
+from airwaveapiclient import AirWaveAPIClient
+from airwaveapiclient import APDetail
+from airwaveapiclient import Metrics
+from airwaveapiclient import set_metrics
+from airwaveapiclient.metrics import Histogram
+from airwaveapiclient.tests import test_utils
+
+
+class HistogramUnitTests(unittest.TestCase):
+
+    """Class HistogramUnitTests.
+
+    Unit test for Histogram.
+
+    """
+
+    def test_bounds(self):
+        """Test bucket bounds cover values without gaps."""
+        obj = Histogram()
+        previous = 0
+        for index in range(2000):
+            low, high = obj.bounds(index)
+            self.assertEqual(low, previous)
+            self.assertEqual(obj.index(low), index)
+            self.assertEqual(obj.index(high - 1), index)
+            self.assertTrue(high - low <= max(1, low / 64.0))
+            previous = high
+
+    def test_percentile(self):
+        """Test percentile."""
+        obj = Histogram(scale=1e6)
+        self.assertEqual(obj.percentile(50), None)
+        for millis in range(1, 1001):
+            obj.record(millis / 1000.0)
+        self.assertEqual(obj.count, 1000)
+        self.assertAlmostEqual(obj.mean(), 0.5005)
+        self.assertAlmostEqual(obj.percentile(50), 0.5, delta=0.5 / 64)
+        self.assertAlmostEqual(obj.percentile(99), 0.99, delta=0.99 / 64)
+        self.assertEqual(obj.percentile(100), 1.0)
+        self.assertAlmostEqual(obj.percentile(0), 0.001, delta=0.001 / 64)
+
+
+class MetricsUnitTests(unittest.TestCase):
+
+    """Class MetricsUnitTests.
+
+    Unit test for Metrics.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        self.events = []
+        self.obj = Metrics(callbacks=[
+            lambda *event: self.events.append(event)])
+        set_metrics(self.obj)
+
+    def tearDown(self):
+        """Tear down."""
+        set_metrics(None)
+
+    def test_client(self):
+        """Test request and parse metrics of the client."""
+        here = os.path.dirname(os.path.abspath(__file__))
+        xml = test_utils.read_file(os.path.join(here, 'test_apdetail.xml'))
+
+        @all_requests
+        def content_ap_detail(url, request):
+            """Test content for ap_detail, failing for id=3 and id=4."""
+            if url.query == 'id=3':
+                return response(status_code=500, request=request)
+            if url.query == 'id=4':
+                raise requests.exceptions.ConnectionError('reset')
+            return response(status_code=200,
+                            content=xml.encode('utf-8'),
+                            request=request)
+
+        airwave = AirWaveAPIClient(username='username',
+                                   password='password',
+                                   url='https://192.168.1.1')
+        with HTTMock(content_ap_detail):
+            airwave.login()
+            results = dict(airwave.ap_detail_many([1, 2, 3, 4]))
+        airwave.logout()
+        self.assertTrue(isinstance(results[1], APDetail))
+
+        latency = self.obj.histogram('request_seconds', method='GET',
+                                     endpoint='/ap_detail.xml')
+        self.assertEqual(latency.count, 4)
+        size = self.obj.histogram('response_bytes', endpoint='/ap_detail.xml')
+        self.assertEqual(size.max, len(xml.encode('utf-8')))
+        self.assertEqual(self.obj.counter('errors_total', kind='500',
+                                          endpoint='/ap_detail.xml'), 1)
+        self.assertEqual(self.obj.counter('errors_total',
+                                          kind='ConnectionError',
+                                          endpoint='/ap_detail.xml'), 1)
+        parse = self.obj.histogram('parse_seconds', type='APDetail')
+        self.assertEqual(parse.count, 2)
+        self.assertTrue(('parse_bytes', {'type': 'APDetail'},
+                         len(xml.encode('utf-8'))) in self.events)
+
+    def test_to_prometheus(self):
+        """Test to_prometheus."""
+        self.obj.observe('request_seconds',
+                         {'method': 'GET', 'endpoint': '/ap_list.xml'}, 0.25)
+        self.obj.increment('errors_total',
+                           {'endpoint': '/a"b.xml', 'kind': '500'})
+        text = self.obj.to_prometheus()
+        self.assertEqual(text.splitlines(), [
+            '# TYPE airwave_client_request_seconds summary',
+            'airwave_client_request_seconds{endpoint="/ap_list.xml",'
+            'method="GET",quantile="0.5"} 0.25',
+            'airwave_client_request_seconds{endpoint="/ap_list.xml",'
+            'method="GET",quantile="0.9"} 0.25',
+            'airwave_client_request_seconds{endpoint="/ap_list.xml",'
+            'method="GET",quantile="0.99"} 0.25',
+            'airwave_client_request_seconds_sum{endpoint="/ap_list.xml",'
+            'method="GET"} 0.25',
+            'airwave_client_request_seconds_count{endpoint="/ap_list.xml",'
+            'method="GET"} 1',
+            '# TYPE airwave_client_errors_total counter',
+            'airwave_client_errors_total{endpoint="/a\\"b.xml",'
+            'kind="500"} 1',
+        ])
+        self.obj.reset()
+        self.assertEqual(self.obj.to_prometheus(), '')
+
+    def test_disabled(self):
+        """Test nothing is recorded when metrics are off."""
+        set_metrics(None)
+        here = os.path.dirname(os.path.abspath(__file__))
+        APDetail(test_utils.read_file(os.path.join(here,
+                                                   'test_apdetail.xml')))
+        self.assertEqual(self.obj.histograms, {})
+        self.assertEqual(self.events, [])
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for neighbors."""
+
+import os
+import unittest
+from airwaveapiclient import APDetail
+from airwaveapiclient import NeighborStore
+from airwaveapiclient.tests import test_utils
+
+
+ROGUE_DETAIL = u'''<?xml version="1.0" encoding="utf-8"?>
+<amp:amp_rogue_detail version="1" xmlns:amp="http://www.airwave.com">
+  <rogue id="900001">
+    <channel>11</channel>
+    <radio_mac>B1:00:00:00:00:01</radio_mac>
+    <signal>-70</signal>
+  </rogue>
+</amp:amp_rogue_detail>
+'''
+
+EMPTY_DETAIL = u'''<?xml version="1.0" encoding="utf-8"?>
+<amp:amp_ap_detail version="1" xmlns:amp="http://www.airwave.com">
+  <ap id="1"></ap>
+</amp:amp_ap_detail>
+'''
+
+
+class NeighborStoreUnitTests(unittest.TestCase):
+
+    """Class NeighborStoreUnitTests.
+
+    Unit test for NeighborStore.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        self.here = os.path.dirname(os.path.abspath(__file__))
+        path = os.path.join(self.here, 'test_apdetail.xml')
+        self.ap_detail = test_utils.read_file(path)
+
+    def tearDown(self):
+        """Tear down."""
+
+    def test_add(self):
+        """Test add."""
+        for kwargs in ({}, {'typed': True}, {'lazy': True}):
+            store = NeighborStore()
+            store.add(APDetail(self.ap_detail, **kwargs), poll=100)
+            self.assertEqual(len(store), 6)
+            neighbor = store.get('a1:01:00:00:00:a1')
+            self.assertEqual(neighbor.signal, -87)
+            self.assertEqual(neighbor.seen_by, set([1]))
+            self.assertEqual(neighbor.channel, 1)
+            self.assertEqual(neighbor.last_discovered, 1435017030)
+            self.assertEqual(neighbor.updated, 100)
+
+    def test_update(self):
+        """Test update."""
+        store = NeighborStore()
+        store.add(APDetail(self.ap_detail), poll=100)
+        node = {'radio_mac': 'a1:01:00:00:00:a1', 'signal': '-50',
+                'last_discovered': '1435000000'}
+        store.update(2, node, poll=200)
+        neighbor = store.get('A1:01:00:00:00:A1')
+        self.assertEqual(neighbor.signal, -50)
+        self.assertEqual(neighbor.best_ap, 2)
+        self.assertEqual(neighbor.seen_by, set([1, 2]))
+        self.assertEqual(neighbor.last_discovered, 1435017030)
+        self.assertEqual(store.update(2, {'signal': '-50'}), None)
+
+    def test_add_replaces_sightings(self):
+        """Test add drops the radios an Access Point no longer sees."""
+        store = NeighborStore()
+        store.add(APDetail(self.ap_detail), poll=100)
+        store.update(2, {'radio_mac': 'A1:01:00:00:00:A1'}, poll=200)
+        store.add(APDetail(EMPTY_DETAIL), poll=300)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.get('A1:01:00:00:00:A1').seen_by, set([2]))
+        self.assertFalse('A1:01:00:00:00:A2' in store)
+
+    def test_add_rogue_detail(self):
+        """Test add_rogue_detail."""
+        store = NeighborStore()
+        store.add_rogue_detail(5, ROGUE_DETAIL)
+        neighbor = store.get('B1:00:00:00:00:01')
+        self.assertEqual(neighbor.seen_by, set([5]))
+        self.assertEqual(neighbor.signal, -70)
+        self.assertEqual(neighbor.channel, 11)
+
+    def test_add_keeps_rogue_sightings(self):
+        """Test add does not drop the rogue sightings of its ap_id."""
+        store = NeighborStore()
+        store.add_rogue_detail(1, ROGUE_DETAIL, poll=100)
+        store.update(1, {'radio_mac': 'B1:00:00:00:00:02'}, poll=100)
+        store.add(APDetail(self.ap_detail), poll=200)
+        store.add(APDetail(EMPTY_DETAIL), poll=300)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.get('B1:00:00:00:00:01').seen_by, set([1]))
+        self.assertEqual(store.sightings, {})
+        self.assertEqual(store.rogue_sightings,
+                         {1: set(['B1:00:00:00:00:01'])})
+
+    def test_maxsize(self):
+        """Test maxsize."""
+        store = NeighborStore(maxsize=4)
+        store.add(APDetail(self.ap_detail))
+        self.assertEqual(len(store), 4)
+        self.assertFalse('A1:01:00:00:00:A1' in store)
+        self.assertEqual(len(store.sightings[1]), 4)
+
+    def test_expire(self):
+        """Test expire."""
+        store = NeighborStore()
+        store.add(APDetail(self.ap_detail), poll=100)
+        store.update(2, {'radio_mac': 'B1:00:00:00:00:01'}, poll=200)
+        self.assertEqual(store.expire(50, now=220), 6)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(list(store.sightings), [2])
+
+    def test_extend(self):
+        """Test extend."""
+        error = ValueError('error')
+        store = NeighborStore()
+        failed = store.extend([(1, APDetail(self.ap_detail)), (2, error)])
+        self.assertEqual(failed, [(2, error)])
+        self.assertEqual(len(store), 6)
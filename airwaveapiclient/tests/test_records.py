@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for records."""
+
+import os
+import unittest
+from airwaveapiclient import APList
+from airwaveapiclient import APDetail
+from airwaveapiclient import AP
+from airwaveapiclient import Radio
+from airwaveapiclient import Client
+from airwaveapiclient import NeighborAP
+from airwaveapiclient.tests import test_utils
+
+
+class RecordsUnitTests(unittest.TestCase):
+
+    """Class RecordsUnitTests.
+
+    Unit test for typed records.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        self.here = os.path.dirname(os.path.abspath(__file__))
+        path = os.path.join(self.here, 'test_aplist.xml')
+        self.ap_list = test_utils.read_file(path)
+        path = os.path.join(self.here, 'test_apdetail.xml')
+        self.ap_detail = test_utils.read_file(path)
+
+    def tearDown(self):
+        """Tear down."""
+
+    def test_ap_list(self):
+        """Test typed APList."""
+        objs = APList(self.ap_list, typed=True)
+        self.assertEqual(len(objs), 4)
+        obj = objs[0]
+        self.assertTrue(isinstance(obj, AP))
+        self.assertEqual(obj.id, 1)
+        self.assertEqual(obj['@id'], 1)
+        self.assertEqual(obj['name'], 'AP001')
+        self.assertEqual(obj.is_up, True)
+        self.assertEqual(obj.planned_maintenance_mode, False)
+        self.assertEqual(obj['group']['@id'], 1)
+        self.assertEqual(obj.model.text, 'AP 105')
+        self.assertEqual(obj['syscontact'], None)
+        self.assertFalse('syscontact' in obj)
+        self.assertTrue('radio' in obj)
+        with self.assertRaises(KeyError):
+            obj['unknown']
+        with self.assertRaises(AttributeError):
+            obj.unknown = 1
+
+        radio = obj.radio[1]
+        self.assertTrue(isinstance(radio, Radio))
+        self.assertEqual(radio['@index'], 2)
+        self.assertEqual(radio.radio_interface, 1)
+        self.assertEqual(radio.radio_type, 'aN')
+
+        # Single radio is normalized to a list.
+        self.assertEqual(len(objs[3].radio), 1)
+        self.assertEqual(objs.search(4), objs[3])
+
+    def test_ap_list_compatible(self):
+        """Test typed nodes keep the keys of plain nodes."""
+        plain = APList(self.ap_list)
+        typed = APList(self.ap_list, typed=True)
+        for node, obj in zip(plain, typed):
+            keys = [key for key, value in node.items() if value is not None]
+            self.assertEqual(obj.keys(), keys)
+            self.assertEqual(obj['lan_mac'], node['lan_mac'])
+
+    def test_ap_detail(self):
+        """Test typed APDetail."""
+        obj = APDetail(self.ap_detail, typed=True)
+        self.assertEqual(obj['@id'], 1)
+        self.assertEqual(obj['snmp_uptime'], 182836)
+        radio = obj['radio'][1]
+        self.assertEqual(len(radio.bssid), 8)
+        self.assertEqual(radio.bw, 231.856)
+
+        client = radio['client'][1]
+        self.assertTrue(isinstance(client, Client))
+        self.assertEqual(client.id, 12000002)
+        self.assertEqual(client.assoc_stat, True)
+        self.assertEqual(client.signal, -46)
+        self.assertEqual(client.bw, 11.2)
+        self.assertEqual(radio['client'][0].snr, None)
+
+        neighbor = radio['neighbor_ap'][0]
+        self.assertTrue(isinstance(neighbor, NeighborAP))
+        self.assertEqual(neighbor.channel, 132)
+        self.assertEqual(neighbor.last_discovered, 1435174134)
+
+    def test_to_dict(self):
+        """Test to_dict round trip."""
+        obj = APDetail(self.ap_detail, typed=True)
+        ap = AP.from_dict(obj)
+        data = ap.to_dict()
+        self.assertEqual(data['radio'][0]['client'][0]['@id'], 11000001)
+        self.assertEqual(AP.from_dict(data), ap)
+
+    def test_extra(self):
+        """Test fields not declared are kept."""
+        obj = Client.from_dict({'@id': '1', 'ssid': 'SSID1'})
+        self.assertEqual(obj['ssid'], 'SSID1')
+        self.assertEqual(obj.keys(), ['@id', 'ssid'])
+        self.assertEqual(len(obj), 2)
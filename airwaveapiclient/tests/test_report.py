@@ -4,7 +4,10 @@
 
 import os
 import unittest
+from httmock import all_requests, response, HTTMock
+import requests
 from airwaveapiclient import Report
+from airwaveapiclient import airwaveapiclient
 from airwaveapiclient.tests import test_utils
 
 
@@ -33,3 +36,97 @@ class ReportUnitTests(unittest.TestCase):
         self.assertEqual(type(self.obj), Report)
         self.assertEqual(len(self.obj['pickled_ap_summary']), 3)
         self.assertEqual(len(self.obj['pickled_rf_health']), 6)
+
+    def test_table(self):
+        """Test table."""
+        if airwaveapiclient.numpy is None:
+            self.assertRaises(ImportError, self.obj.table,
+                              'pickled_ap_summary')
+            return
+        table = self.obj.table('pickled_ap_summary')
+        self.assertEqual(list(table)[:3],
+                         ['ap_folder_id', 'ap_folder_path', 'ap_group_id'])
+        self.assertEqual(str(table['ap_id'].dtype), 'int64')
+        self.assertEqual(list(table['ap_id']), [1, 2, 3])
+        self.assertEqual(str(table['avg_bw'].dtype), 'float64')
+        self.assertEqual(table['avg_bw'].sum(), 60.0)
+        self.assertEqual(list(table['name']), ['AP001', 'AP002', 'AP003'])
+
+        table = self.obj.table('pickled_rf_health')
+        self.assertEqual(len(table['ap_id']), 6)
+        self.assertEqual(str(table['radio_freq'].dtype), 'float64')
+        self.assertEqual(list(table['interfering_devices']), [''] * 6)
+
+        table = self.obj.table('pickled_client_summary')
+        self.assertEqual(list(table['unique_users']), [100])
+        self.assertEqual(self.obj.table('unknown'), {})
+
+    def test_table_missing(self):
+        """Test table with missing and non-numeric values."""
+        if airwaveapiclient.numpy is None:
+            return
+        obj = Report('<amp:report xmlns:amp="http://www.airwave.com">'
+                     '<row a="1" b="x" /><row a="2.5" /><row c="3" />'
+                     '</amp:report>')
+        table = obj.table('row')
+        self.assertEqual(list(table), ['a', 'b', 'c'])
+        self.assertEqual(list(table['a'][:2]), [1.0, 2.5])
+        self.assertTrue(airwaveapiclient.numpy.isnan(table['a'][2]))
+        self.assertEqual(list(table['b']), ['x', '', ''])
+        self.assertEqual(list(table['c'][2:]), [3.0])
+
+    def test_table_text_row(self):
+        """Test table with a row holding only text."""
+        if airwaveapiclient.numpy is None:
+            return
+        obj = Report('<amp:report xmlns:amp="http://www.airwave.com">'
+                     '<row>text</row><row a="1" /><row a="2" />'
+                     '</amp:report>')
+        table = obj.table('row')
+        self.assertEqual(list(table), ['a'])
+        self.assertTrue(airwaveapiclient.numpy.isnan(table['a'][0]))
+        self.assertEqual(list(table['a'][1:]), [1.0, 2.0])
+
+    def test_table_overflow(self):
+        """Test table with integers wider than int64."""
+        if airwaveapiclient.numpy is None:
+            return
+        obj = Report('<amp:report xmlns:amp="http://www.airwave.com">'
+                     '<row a="1" /><row a="18446744073709551616" />'
+                     '</amp:report>')
+        self.assertEqual(list(obj.table('row')['a']),
+                         [1.0, 18446744073709551616.0])
+
+    def test_iter_from_response(self):
+        """Test iter_from_response."""
+        @all_requests
+        def content_report(url, request):
+            """Test content for latest_report."""
+            headers = {'content-type': 'application/xml'}
+            return response(status_code=200,
+                            content=self.ap_list.encode('utf-8'),
+                            headers=headers,
+                            request=request)
+
+        with HTTMock(content_report):
+            res = requests.get('https://192.168.1.1/latest_report.xml',
+                               stream=True)
+            rows = list(Report.iter_from_response(res, chunk_size=64))
+        sections = [section for section, _ in rows]
+        self.assertEqual(sections.count('pickled_ap_summary'), 3)
+        self.assertEqual(sections.count('pickled_rf_health'), 6)
+        ap_rows = [row for section, row in rows
+                   if section == 'pickled_ap_summary']
+        self.assertEqual(ap_rows, self.obj['pickled_ap_summary'])
+
+        with HTTMock(content_report):
+            res = requests.get('https://192.168.1.1/latest_report.xml',
+                               stream=True)
+            rows = list(Report.iter_from_response(
+                res, sections=['pickled_client_summary']))
+        self.assertEqual(rows, [('pickled_client_summary',
+                                 self.obj['pickled_client_summary'])])
+
+    def test_init_bytes(self):
+        """Test init from bytes."""
+        self.assertEqual(Report(self.ap_list.encode('utf-8')), self.obj)
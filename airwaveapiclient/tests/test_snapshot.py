@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for snapshot."""
+
+import os
+import shutil
+import tempfile
+import unittest
+from airwaveapiclient import APList
+from airwaveapiclient import APDetail
+from airwaveapiclient import Snapshot
+from airwaveapiclient import save_snapshot
+from airwaveapiclient.tests import test_utils
+
+
+class SnapshotUnitTests(unittest.TestCase):
+
+    """Class SnapshotUnitTests.
+
+    Unit test for Snapshot.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        here = os.path.dirname(os.path.abspath(__file__))
+        self.ap_list = test_utils.read_file(os.path.join(here,
+                                                         'test_aplist.xml'))
+        self.ap_detail = test_utils.read_file(
+            os.path.join(here, 'test_apdetail.xml'))
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'aps.snap')
+
+    def tearDown(self):
+        """Tear down."""
+        shutil.rmtree(self.tmpdir)
+
+    def test_round_trip(self):
+        """Test save and open."""
+        objs = APList(self.ap_list)
+        detail = APDetail(self.ap_detail)
+        save_snapshot(self.path, objs, [detail], timestamp=1000.0)
+        with Snapshot(self.path) as snap:
+            self.assertEqual(snap.timestamp, 1000.0)
+            self.assertTrue(snap.age() > 0)
+            self.assertEqual(len(snap), 4)
+            self.assertEqual(snap[1], objs[1])
+            self.assertEqual(snap[-1], objs[-1])
+            with self.assertRaises(IndexError):
+                snap[4]
+            loaded = snap.ap_list()
+            self.assertTrue(isinstance(loaded, APList))
+            self.assertEqual(list(loaded), list(objs))
+            self.assertEqual(loaded.search('AP003')['@id'], '3')
+
+            self.assertEqual(snap.detail_ids(), [1])
+            loaded = snap.detail(1)
+            self.assertTrue(isinstance(loaded, APDetail))
+            self.assertEqual(loaded, detail)
+            self.assertEqual(snap.detail(2), None)
+
+    def test_typed(self):
+        """Test typed records."""
+        objs = APList(self.ap_list, typed=True)
+        detail = APDetail(self.ap_detail, typed=True)
+        save_snapshot(self.path, objs, [detail])
+        with Snapshot(self.path, typed=True) as snap:
+            self.assertEqual(list(snap.ap_list()), list(objs))
+            loaded = snap.detail(1)
+            self.assertEqual(loaded['radio'][1]['client'][1].snr, 47)
+
+    def test_not_snapshot(self):
+        """Test opening another file."""
+        with open(self.path, 'wb') as _file:
+            _file.write(b'x' * 64)
+        with self.assertRaises(ValueError):
+            Snapshot(self.path)
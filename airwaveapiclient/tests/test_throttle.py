@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for throttle."""
+
+import random
+import threading
+import unittest
+from airwaveapiclient import ConcurrencyLimiter
+from airwaveapiclient import TokenBucket
+
+
+class TokenBucketUnitTests(unittest.TestCase):
+
+    """Class TokenBucketUnitTests.
+
+    Unit test for TokenBucket.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        self.now = [100.0]
+        self.slept = []
+        self.obj = TokenBucket(10, burst=2)
+        self.obj.clock = lambda: self.now[0]
+        self.obj.sleep = self.slept.append
+        self.obj.updated = self.now[0]
+
+    def tearDown(self):
+        """Tear down."""
+
+    def test_reserve(self):
+        """Test reserve."""
+        self.assertEqual(self.obj.reserve(), 0)
+        self.assertEqual(self.obj.reserve(), 0)
+        self.assertAlmostEqual(self.obj.reserve(), 0.1)
+        self.assertAlmostEqual(self.obj.reserve(), 0.2)
+        self.now[0] += 1
+        self.assertEqual(self.obj.tokens, -2)
+        self.assertEqual(self.obj.reserve(), 0)
+        self.assertEqual(self.obj.tokens, 1)
+
+    def test_acquire(self):
+        """Test acquire."""
+        for _ in range(4):
+            self.obj.acquire()
+        self.assertEqual(len(self.slept), 2)
+        self.assertAlmostEqual(self.slept[1], 0.2)
+
+
+class ConcurrencyLimiterUnitTests(unittest.TestCase):
+
+    """Class ConcurrencyLimiterUnitTests.
+
+    Unit test for ConcurrencyLimiter.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        self.now = [100.0]
+        self.obj = ConcurrencyLimiter(initial=2, max_limit=4)
+        self.obj.clock = lambda: self.now[0]
+
+    def tearDown(self):
+        """Tear down."""
+
+    def test_increase(self):
+        """Test additive increase while the limit is in use."""
+        for _ in range(20):
+            self.obj.acquire()
+            self.obj.release(0.1)
+        self.assertEqual(self.obj.limit, 2)
+        for _ in range(20):
+            slots = int(self.obj.limit)
+            for _ in range(slots):
+                self.obj.acquire()
+            for _ in range(slots):
+                self.obj.release(0.1)
+        self.assertEqual(self.obj.limit, 4)
+        self.assertEqual(self.obj.in_flight, 0)
+
+    def test_decrease(self):
+        """Test multiplicative decrease, once per latency."""
+        self.obj.limit = 4.0
+        for _ in range(3):
+            self.obj.acquire()
+        for _ in range(3):
+            self.obj.release(0.1, error=True)
+        self.assertEqual(self.obj.limit, 2)
+        self.assertTrue(self.obj.error_rate > 0.2)
+        self.now[0] += 1
+        self.obj.acquire()
+        self.obj.release(0.1, error=True)
+        self.assertEqual(self.obj.limit, 1)
+        self.now[0] += 1
+        self.obj.acquire()
+        self.obj.release(0.1, error=True)
+        self.assertEqual(self.obj.limit, 1)
+
+    def test_latency_target(self):
+        """Test decrease on slow responses."""
+        self.obj.limit = 4.0
+        self.obj.acquire()
+        self.obj.release(0.1)
+        self.assertEqual(self.obj.target(), 0.1 * 3)
+        self.obj.acquire()
+        self.obj.release(2.0)
+        self.assertEqual(self.obj.limit, 2)
+        self.obj.latency_target = 5.0
+        self.assertEqual(self.obj.target(), 5.0)
+
+    def test_latency_spread(self):
+        """Test normal latency variation does not collapse the limit."""
+        obj = ConcurrencyLimiter(initial=4, max_limit=16)
+        obj.clock = lambda: self.now[0]
+        rand = random.Random(0)
+        for _ in range(2000):
+            slots = int(obj.limit)
+            for _ in range(slots):
+                obj.acquire()
+            for _ in range(slots):
+                obj.release(rand.uniform(0.05, 0.5))
+            self.now[0] += 0.5
+        self.assertTrue(obj.limit >= 8)
+        self.assertAlmostEqual(obj.baseline, 0.275, delta=0.1)
+
+    def test_acquire_blocks(self):
+        """Test acquire waits for a free slot."""
+        self.obj.acquire()
+        self.obj.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            """Take a third slot."""
+            self.obj.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        self.obj.release(0.1)
+        self.assertTrue(acquired.wait(1))
+        thread.join()
+        self.assertEqual(self.obj.stats()['in_flight'], 2)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for xmlparse."""
+
+import os
+import unittest
+from airwaveapiclient import APList
+from airwaveapiclient import set_backend
+from airwaveapiclient import xmlparse
+from airwaveapiclient.tests import test_utils
+
+
+class XmlParseUnitTests(unittest.TestCase):
+
+    """Class XmlParseUnitTests.
+
+    Unit test for xmlparse.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        self.here = os.path.dirname(os.path.abspath(__file__))
+        self.backend = xmlparse.BACKEND
+
+    def tearDown(self):
+        """Tear down."""
+        xmlparse.BACKEND = self.backend
+
+    def test_backends_agree(self):
+        """Test that the backends build the same structure."""
+        if xmlparse.etree is None:
+            return
+        for name in ('test_aplist.xml', 'test_apdetail.xml',
+                     'test_report.xml'):
+            xml = test_utils.read_file(os.path.join(self.here, name))
+            data = xmlparse.parse(xml, 'xmltodict')
+            self.assertEqual(xmlparse.parse(xml, 'lxml'), data)
+            self.assertEqual(xmlparse.parse(xml.encode('utf-8'), 'lxml'),
+                             data)
+
+    def test_lxml_item(self):
+        """Test text, repeats, comments and namespaces with lxml."""
+        if xmlparse.etree is None:
+            return
+        for xml in ('<a>x<!-- c -->y<b/>z</a>',
+                    '<a><b>1</b><c/><b>2</b></a>',
+                    '<a xmlns="urn:x" xmlns:p="urn:p" p:k="v"><b/></a>',
+                    u'<?xml version="1.0" encoding="ISO-8859-1"?>'
+                    u'<a>é</a>'):
+            self.assertEqual(xmlparse.parse(xml, 'lxml'),
+                             xmlparse.parse(xml, 'xmltodict'))
+
+    def test_set_backend(self):
+        """Test set_backend."""
+        path = os.path.join(self.here, 'test_aplist.xml')
+        xml = test_utils.read_file(path)
+        self.assertEqual(self.backend, 'xmltodict')
+        set_backend('xmltodict')
+        self.assertEqual(xmlparse.BACKEND, 'xmltodict')
+        objs = APList(xml)
+        if xmlparse.etree is not None:
+            set_backend('lxml')
+            self.assertEqual(APList(xml), objs)
+        else:
+            self.assertRaises(ImportError, set_backend, 'lxml')
+        self.assertRaises(ValueError, set_backend, 'unknown')
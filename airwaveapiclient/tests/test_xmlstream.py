@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""UnitTests for xmlstream."""
+
+import os
+import unittest
+import xmltodict
+from airwaveapiclient.xmlstream import iterparse
+from airwaveapiclient.xmlstream import parse_lazy
+from airwaveapiclient.tests import test_utils
+
+
+class XMLStreamUnitTests(unittest.TestCase):
+
+    """Class XMLStreamUnitTests.
+
+    Unit test for xmlstream.
+
+    """
+
+    def setUp(self):
+        """Setup."""
+        self.here = os.path.dirname(os.path.abspath(__file__))
+        path = os.path.join(self.here, 'test_report.xml')
+        self.report = test_utils.read_file(path)
+
+    def tearDown(self):
+        """Tear down."""
+
+    def test_iterparse(self):
+        """Test iterparse matches xmltodict."""
+        data = xmltodict.parse(self.report)['amp:report']
+        items = list(iterparse(self.report))
+        self.assertEqual(len(items), 11)
+        rows = [item for tag, item in items if tag == 'pickled_rf_health']
+        self.assertEqual(rows, data['pickled_rf_health'])
+
+    def test_iterparse_chunks(self):
+        """Test iterparse with small byte chunks."""
+        xml = self.report.encode('utf-8')
+        chunks = [xml[i:i + 7] for i in range(0, len(xml), 7)]
+        self.assertEqual(list(iterparse(chunks)), list(iterparse(xml)))
+
+    def test_iterparse_tags(self):
+        """Test iterparse tag filter."""
+        items = list(iterparse(self.report, tags=['pickled_ap_summary']))
+        self.assertEqual(len(items), 3)
+        self.assertEqual(items[0][1]['@ap_folder_path'], 'Top > OfficeA')
+
+    def test_parse_lazy(self):
+        """Test parse_lazy with empty, text and nested elements."""
+        xml = (b'<r><i n="1"><a x="1"/><a>t</a><a\n/><b/>'
+               b'<a><c>1</c><c>2</c></a></i></r>')
+        items = parse_lazy(xml, lazy_tags=['a'])
+        self.assertEqual(len(items), 1)
+        tag, item = items[0]
+        self.assertEqual(tag, 'i')
+        self.assertEqual(list(item), ['@n', 'a', 'b'])
+        self.assertEqual(len(item['a']), 4)
+        self.assertEqual(item['a'].raw()[2], b'<a\n/>')
+        self.assertEqual(item['a'], [{'@x': '1'}, 't', None,
+                                     {'c': ['1', '2']}])
+        self.assertRaises(ValueError, item['a'].raw)
+
+        encoded = (u'<?xml version="1.0" encoding="ISO-8859-1"?>'
+                   u'<r><i><a>\xe9</a></i></r>').encode('iso-8859-1')
+        items = parse_lazy(encoded, lazy_tags=['a'])
+        self.assertEqual(list(items[0][1]['a']), [u'\xe9'])
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.throttle"""
+
+
+import threading
+import time
+
+
+class TokenBucket(object):
+
+    """Token bucket rate limiter shared by the threads of a client.
+
+    Each request takes a token. Tokens refill at rate per second up to
+    burst; a request finding the bucket empty reserves the next token
+    and sleeps until it is due, so waiting threads are served in order.
+
+    Attributes:
+
+        :rate (float): Requests per second.
+        :burst (float): Maximum number of tokens.
+        :tokens (float): Tokens available, negative when reserved.
+
+    """
+
+    def __init__(self, rate, burst=None):
+        """Initialize TokenBucket.
+
+        Args:
+
+            :rate (float): Requests per second.
+            :burst (optional[float]): Requests allowed at once after an
+                idle period. Default is max(1, rate).
+
+        Usage: ::
+
+            >>> from airwaveapiclient import TokenBucket
+            >>> airwave = AirWaveAPIClient(username='admin',
+            >>>                            password='xxxxx',
+            >>>                            url='https://192.168.1.1/',
+            >>>                            rate_limit=TokenBucket(20))
+
+        """
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, rate))
+        self.tokens = self.burst
+        self.lock = threading.Lock()
+        self.clock = time.time
+        self.sleep = time.sleep
+        self.updated = self.clock()
+
+    def reserve(self):
+        """Take a token.
+
+        Returns:
+
+            :float: Seconds to wait before the token is due.
+
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens +
+                              (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """Take a token, sleeping until it is due."""
+        wait = self.reserve()
+        if wait > 0:
+            self.sleep(wait)
+
+
+class ConcurrencyLimiter(object):
+
+    """Adaptive limit of requests in flight (AIMD).
+
+    The limit grows by one per round of successful requests while it is
+    in use, and is cut by a factor on a 5xx status, a connection error
+    or when the average latency exceeds the latency target, at most
+    once per average latency so that a burst of failures counts once.
+
+    Without a fixed latency target, the target is tolerance times a
+    slow moving average of latencies (about the last 100 requests), so
+    it follows the normal latency of the server while a sudden slowdown
+    still exceeds it.
+
+    Attributes:
+
+        :limit (float): Current limit of requests in flight.
+        :min_limit (int): Lowest limit.
+        :max_limit (int): Highest limit.
+        :latency_target (float): Average latency in seconds above which
+            the server is overloaded, or None to use tolerance times the
+            baseline latency.
+        :tolerance (float): Factor of the baseline latency.
+        :decrease (float): Factor applied to the limit on overload.
+        :in_flight (int): Requests in flight.
+        :latency (float): Moving average of latencies in seconds.
+        :baseline (float): Slow moving average of latencies in seconds.
+        :error_rate (float): Moving average of failures, from 0 to 1.
+
+    """
+
+    def __init__(self, initial=4, min_limit=1, max_limit=32, **kwargs):
+        """Initialize ConcurrencyLimiter.
+
+        Args:
+
+            :initial (optional[int]): Initial limit. Default is 4.
+            :min_limit (optional[int]): Lowest limit. Default is 1.
+            :max_limit (optional[int]): Highest limit, at most the
+                pool_maxsize of the client. Default is 32.
+            :latency_target (optional[float]): Average latency in seconds
+                above which the server is overloaded. Default is None.
+            :tolerance (optional[float]): Overload factor of the
+                baseline latency when latency_target is None.
+                Default is 3.
+            :decrease (optional[float]): Factor applied to the limit on
+                overload. Default is 0.5.
+
+        Usage: ::
+
+            >>> from airwaveapiclient import ConcurrencyLimiter
+            >>> airwave = AirWaveAPIClient(username='admin',
+            >>>                            password='xxxxx',
+            >>>                            url='https://192.168.1.1/',
+            >>>                            pool_maxsize=32,
+            >>>                            concurrency=ConcurrencyLimiter())
+            >>> results = dict(airwave.ap_detail_many(ap_ids))
+            >>> airwave.concurrency.limit
+            11.5
+
+        """
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = kwargs.get('latency_target')
+        self.tolerance = kwargs.get('tolerance', 3)
+        self.decrease = kwargs.get('decrease', 0.5)
+        self.in_flight = 0
+        self.latency = None
+        self.baseline = None
+        self.error_rate = 0.0
+        self.condition = threading.Condition()
+        self.clock = time.time
+        self.cooldown = 0.0
+
+    def acquire(self):
+        """Wait for a free slot and take it."""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self, latency, error=False):
+        """Free a slot and adjust the limit.
+
+        Args:
+
+            :latency (float): Seconds the request took.
+            :error (optional[bool]): The request failed with a 5xx
+                status or a connection error. Default is False.
+
+        """
+        with self.condition:
+            saturated = self.in_flight >= int(self.limit)
+            self.in_flight -= 1
+            self.error_rate = 0.9 * self.error_rate + (0.1 if error else 0)
+            if not error:
+                self.latency = (latency if self.latency is None else
+                                0.8 * self.latency + 0.2 * latency)
+                self.baseline = (latency if self.baseline is None else
+                                 0.99 * self.baseline + 0.01 * latency)
+            if error or self.latency > self.target():
+                now = self.clock()
+                if now >= self.cooldown:
+                    self.limit = max(self.min_limit,
+                                     self.limit * self.decrease)
+                    self.cooldown = now + (self.latency or latency)
+            elif saturated:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self.condition.notify_all()
+
+    def target(self):
+        """Average latency in seconds above which to reduce the limit."""
+        if self.latency_target is not None:
+            return self.latency_target
+        if self.baseline is None:
+            return float('inf')
+        return self.baseline * self.tolerance
+
+    def stats(self):
+        """Limiter state.
+
+        Returns:
+
+            :dict: 'limit', 'in_flight', 'latency', 'baseline' and
+                'error_rate'.
+
+        """
+        with self.condition:
+            return {'limit': self.limit,
+                    'in_flight': self.in_flight,
+                    'latency': self.latency,
+                    'baseline': self.baseline,
+                    'error_rate': self.error_rate}
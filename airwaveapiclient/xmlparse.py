@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.xmlparse"""
+
+
+import requests
+import xmltodict
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+# pylint: disable=import-error,relative-import
+try:
+    from airwaveapiclient.xmlstream import push_item
+except ImportError:
+    from xmlstream import push_item
+
+
+def parse_xmltodict(xml):
+    """Parse XML with xmltodict."""
+    return xmltodict.parse(xml)
+
+
+def parse_lxml(xml):
+    """Parse XML with lxml into the same structure as xmltodict.
+
+    Namespace declarations are reported on the root element and on
+    elements using a namespace, which covers the AirWave documents.
+    """
+    encoding = None
+    if isinstance(xml, type(u'')):
+        xml = xml.encode('utf-8')
+        encoding = 'utf-8'
+    parser = etree.XMLParser(remove_comments=True, remove_pis=True,
+                             resolve_entities=False, huge_tree=True,
+                             encoding=encoding)
+    root = etree.fromstring(xml, parser)
+    nsmap = root.nsmap
+    item = declare(lxml_item(root, nsmap), nsmap.items())
+    return {qualified_name(root.tag, nsmap): item}
+
+
+def lxml_item(element, nsmap):
+    """Convert an lxml element the way xmltodict converts an element."""
+    item = None
+    attrib = element.items()
+    if attrib:
+        item = {}
+        for key, value in attrib:
+            if key[:1] == '{':
+                key = qualified_name(key, nsmap)
+            item['@' + key] = value
+    texts = [element.text] if element.text else []
+    for child in element:
+        if item is None:
+            item = {}
+        tag = child.tag
+        if tag[:1] == '{' or '{' in ''.join(child.keys()):
+            child_nsmap = child.nsmap
+            value = declare(lxml_item(child, child_nsmap),
+                            [(prefix, uri)
+                             for prefix, uri in child_nsmap.items()
+                             if nsmap.get(prefix) != uri])
+            tag = qualified_name(tag, child_nsmap)
+        else:
+            value = lxml_item(child, nsmap)
+        push_item(item, tag, value)
+        if child.tail:
+            texts.append(child.tail)
+    text = ''.join(texts).strip() or None
+    if item is None:
+        return text
+    if text:
+        item['#text'] = text
+    return item
+
+
+def declare(item, declarations):
+    """Put namespace declarations first in an item, as xmlns attributes."""
+    if not declarations:
+        return item
+    declared = {}
+    for prefix, uri in declarations:
+        declared['@xmlns:' + prefix if prefix else '@xmlns'] = uri
+    if isinstance(item, dict):
+        declared.update(item)
+    elif item is not None:
+        declared['#text'] = item
+    return declared
+
+
+def qualified_name(name, nsmap):
+    """Turn '{uri}local' back into 'prefix:local'."""
+    if name[:1] != '{':
+        return name
+    uri, local = name[1:].split('}', 1)
+    for prefix, value in nsmap.items():
+        if value == uri and prefix:
+            return '%s:%s' % (prefix, local)
+    return local
+
+
+BACKENDS = {
+    'xmltodict': parse_xmltodict,
+    'lxml': parse_lxml,
+}
+
+BACKEND = 'xmltodict'
+
+
+def set_backend(name):
+    """Select the XML parser backend used by the response classes.
+
+    APList, FolderList, APDetail and Report all parse through it.
+
+    Args:
+
+        :name (str): 'lxml' or 'xmltodict'. The default is
+            'xmltodict'. 'lxml' requires lxml and builds plain dicts,
+            which keep no key order before Python 3.7.
+
+    Usage: ::
+
+        >>> from airwaveapiclient import set_backend
+        >>> set_backend('lxml')
+
+    """
+    global BACKEND  # pylint: disable=global-statement
+    if name not in BACKENDS:
+        raise ValueError('Unknown XML parser backend: %s' % name)
+    if name == 'lxml' and etree is None:
+        raise ImportError('The lxml backend requires lxml.')
+    BACKEND = name
+
+
+def document(xml):
+    """Return the raw body of a Response, or the XML document as is.
+
+    Bytes go to the parsers undecoded, so they follow the encoding
+    declaration of the document and no decoded copy is made.
+    """
+    if isinstance(xml, requests.Response):
+        return xml.content
+    return xml
+
+
+def parse(xml, backend=None):
+    """Parse an XML document into xmltodict style dicts.
+
+    Args:
+
+        :xml (str, bytes or requests.models.Response): XML document.
+        :backend (optional[str]): Backend name. Default is the one
+            selected by set_backend.
+
+    Returns:
+
+        :dict: {root tag: root element}, as xmltodict.parse returns.
+
+    """
+    return BACKENDS[backend or BACKEND](document(xml))
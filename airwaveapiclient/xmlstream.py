@@ -0,0 +1,356 @@
+# -*- coding: utf-8 -*-
+
+"""airwaveapiclient.xmlstream"""
+
+
+from collections import OrderedDict
+import re
+from xml.parsers import expat
+
+
+START_TAG = re.compile(br'<[^\s/>]+(?:\s+[^\s=/>]+\s*=\s*'
+                       br'(?:"[^"]*"|\'[^\']*\'))*\s*/?>')
+
+
+class ItemBuilder(object):
+
+    """Expat handler building xmltodict style items.
+
+    Elements above the item depth are walked but never materialized,
+    so only one item at a time is held in memory.
+
+    Attributes:
+
+        :depth (int): Element depth of the items (the root is 1).
+        :tags (set): Item tag names to build. None builds every tag.
+        :items (list): Completed (tag, item) pairs not yet consumed.
+
+    """
+
+    def __init__(self, depth, tags=None):
+        """Initialize ItemBuilder.
+
+        Args:
+
+            :depth (int): Element depth of the items (the root is 1).
+            :tags (optional[iterable]): Item tag names to build.
+                Default is None (every tag).
+
+        """
+        self.depth = depth
+        self.tags = None if tags is None else set(tags)
+        self.items = []
+        self.level = 0
+        self.skip_level = 0
+        self.stack = []
+
+    def start(self, name, attrs):
+        """Expat StartElementHandler."""
+        self.level += 1
+        if self.skip_level or self.level < self.depth:
+            return
+        if self.level == self.depth:
+            if self.tags is not None and name not in self.tags:
+                self.skip_level = self.level
+                return
+        item = None
+        if attrs:
+            item = OrderedDict()
+            for i in range(0, len(attrs), 2):
+                item['@' + attrs[i]] = attrs[i + 1]
+        self.stack.append([name, item, []])
+
+    def end(self, name):
+        """Expat EndElementHandler."""
+        level = self.level
+        self.level -= 1
+        if self.skip_level:
+            if level == self.skip_level:
+                self.skip_level = 0
+            return
+        if level < self.depth:
+            return
+        name, item, data = self.stack.pop()
+        text = ''.join(data).strip() or None
+        if item is None:
+            item = text
+        elif text:
+            item['#text'] = text
+        if self.stack:
+            parent = self.stack[-1]
+            if parent[1] is None:
+                parent[1] = OrderedDict()
+            push_item(parent[1], name, item)
+        else:
+            self.items.append((name, item))
+
+    def data(self, text):
+        """Expat CharacterDataHandler."""
+        if self.stack and not self.skip_level:
+            self.stack[-1][2].append(text)
+
+    def attach(self, parser):
+        """Register handlers on an expat parser."""
+        parser.ordered_attributes = True
+        parser.buffer_text = True
+        parser.StartElementHandler = self.start
+        parser.EndElementHandler = self.end
+        parser.CharacterDataHandler = self.data
+
+
+class LazyItemBuilder(ItemBuilder):
+
+    """ItemBuilder leaving some repeated elements unparsed.
+
+    Elements named in lazy_tags inside an item are not built. Their
+    byte ranges in the document are collected in a LazyElements value
+    instead, which parses them when it is first read.
+
+    Attributes:
+
+        :lazy_tags (set): Tag names to leave unparsed.
+        :document (bytes): The whole XML document.
+        :encoding (str): Document encoding, or None for UTF-8.
+
+    """
+
+    def __init__(self, depth, tags, lazy_tags, document, encoding=None):
+        """Initialize LazyItemBuilder.
+
+        Args:
+
+            :depth (int): Element depth of the items (the root is 1).
+            :tags (iterable): Item tag names to build, or None.
+            :lazy_tags (iterable): Tag names to leave unparsed.
+            :document (bytes): The whole XML document.
+            :encoding (optional[str]): Encoding forced on the parser.
+
+        """
+        ItemBuilder.__init__(self, depth, tags)
+        self.lazy_tags = set(lazy_tags)
+        self.document = document
+        self.encoding = encoding
+        self.parser = None
+        self.lazy_level = 0
+        self.lazy_start = 0
+
+    def declaration(self, version, encoding, standalone):
+        """Expat XmlDeclHandler."""
+        if self.encoding is None and encoding:
+            self.encoding = encoding
+
+    def start(self, name, attrs):
+        """Expat StartElementHandler."""
+        if self.lazy_level:
+            self.level += 1
+            return
+        if (self.stack and not self.skip_level and
+                name in self.lazy_tags):
+            self.level += 1
+            self.lazy_level = self.level
+            self.lazy_start = self.parser.CurrentByteIndex
+            self.parser.CharacterDataHandler = None
+            return
+        ItemBuilder.start(self, name, attrs)
+
+    def end(self, name):
+        """Expat EndElementHandler."""
+        if not self.lazy_level:
+            ItemBuilder.end(self, name)
+            return
+        level = self.level
+        self.level -= 1
+        if level != self.lazy_level:
+            return
+        self.lazy_level = 0
+        self.parser.CharacterDataHandler = self.data
+        end = self.parser.CurrentByteIndex
+        start_tag = START_TAG.match(self.document, self.lazy_start)
+        empty = (start_tag is not None and start_tag.end() == end and
+                 self.document[end - 2:end] == b'/>')
+        if not empty:
+            end = self.document.index(b'>', end) + 1
+        parent = self.stack[-1]
+        if parent[1] is None:
+            parent[1] = OrderedDict()
+        elements = parent[1].get(name)
+        if elements is None:
+            elements = LazyElements(self.document, self.encoding)
+            parent[1][name] = elements
+        elements.ranges.append((self.lazy_start, end))
+
+    def attach(self, parser):
+        """Register handlers on an expat parser."""
+        ItemBuilder.attach(self, parser)
+        parser.XmlDeclHandler = self.declaration
+        self.parser = parser
+
+
+class LazyElements(object):
+
+    """Repeated elements parsed on first access.
+
+    Reads like a list of xmltodict items. len() does not parse.
+
+    Attributes:
+
+        :ranges (list): (start, end) byte ranges in the document.
+
+    """
+
+    __hash__ = None
+
+    def __init__(self, document, encoding=None):
+        """Initialize LazyElements.
+
+        Args:
+
+            :document (bytes): The whole XML document.
+            :encoding (optional[str]): Document encoding.
+
+        """
+        self.document = document
+        self.encoding = encoding
+        self.ranges = []
+        self.items = None
+
+    def raw(self):
+        """Return the unparsed elements as bytes."""
+        if self.items is not None:
+            raise ValueError('Elements are already parsed.')
+        return [self.document[start:end] for start, end in self.ranges]
+
+    def materialize(self):
+        """Parse the elements, once.
+
+        Returns:
+
+            :list: xmltodict style items.
+
+        """
+        if self.items is None:
+            body = b''.join([b'<lazy>'] + self.raw() + [b'</lazy>'])
+            self.items = [item for _, item in
+                          iterparse(body, depth=2, encoding=self.encoding)]
+            self.document = None
+        return self.items
+
+    def __len__(self):
+        """Number of elements."""
+        if self.items is None:
+            return len(self.ranges)
+        return len(self.items)
+
+    def __iter__(self):
+        """Iterate items."""
+        return iter(self.materialize())
+
+    def __getitem__(self, index):
+        """Get item by index."""
+        return self.materialize()[index]
+
+    def __eq__(self, other):
+        """Compare items with a list or LazyElements."""
+        if isinstance(other, LazyElements):
+            other = other.materialize()
+        if not isinstance(other, list):
+            return NotImplemented
+        return self.materialize() == other
+
+    def __ne__(self, other):
+        """Compare items with a list or LazyElements."""
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __repr__(self):
+        """Representation."""
+        if self.items is None:
+            return '<LazyElements: %d unparsed>' % len(self.ranges)
+        return 'LazyElements(%r)' % self.items
+
+
+def push_item(parent, name, item):
+    """Add a child the way xmltodict does, turning repeats into lists."""
+    if name in parent:
+        value = parent[name]
+        if isinstance(value, list):
+            value.append(item)
+        else:
+            parent[name] = [value, item]
+    else:
+        parent[name] = item
+
+
+def iterparse(chunks, depth=2, tags=None, encoding=None):
+    """Incrementally parse XML and yield items at a fixed depth.
+
+    Args:
+
+        :chunks (iterable or str or bytes): XML document, or an iterable
+            of chunks such as ``Response.iter_content()``.
+        :depth (optional[int]): Element depth of the items. Default is 2
+            (direct children of the root element).
+        :tags (optional[iterable]): Item tag names to build; others are
+            skipped without building objects. Default is None (all).
+        :encoding (optional[str]): Encoding overriding the document
+            declaration. Default is None.
+
+    Returns:
+
+        :generator: (tag, item) pairs. Items have the same shape as the
+            nodes returned by xmltodict.parse.
+
+    Usage: ::
+
+        >>> for tag, item in iterparse(res.iter_content(65536)):
+        ...     tag, item['@id']
+        ('ap', '1')
+        ('ap', '2')
+
+    """
+    if isinstance(chunks, (bytes, type(u''))):
+        chunks = [chunks]
+    builder = ItemBuilder(depth, tags)
+    parser = expat.ParserCreate(encoding)
+    builder.attach(parser)
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parser.Parse(chunk, False)
+        if builder.items:
+            items, builder.items = builder.items, []
+            for item in items:
+                yield item
+    parser.Parse(b'', True)
+    for item in builder.items:
+        yield item
+
+
+def parse_lazy(xml, depth=2, tags=None, lazy_tags=()):
+    """Parse a whole XML document, leaving lazy_tags elements unparsed.
+
+    Args:
+
+        :xml (str or bytes): XML document.
+        :depth (optional[int]): Element depth of the items. Default is 2.
+        :tags (optional[iterable]): Item tag names to build.
+            Default is None (all).
+        :lazy_tags (optional[iterable]): Tag names, below the items, to
+            keep as LazyElements. Default is ().
+
+    Returns:
+
+        :list: (tag, item) pairs.
+
+    """
+    encoding = None
+    if isinstance(xml, type(u'')):
+        xml = xml.encode('utf-8')
+        encoding = 'utf-8'
+    builder = LazyItemBuilder(depth, tags, lazy_tags, xml, encoding)
+    parser = expat.ParserCreate(encoding)
+    builder.attach(parser)
+    parser.Parse(xml, True)
+    return builder.items
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""Parse time of APDetail with eager and lazy neighbor lists.
+
+Repeats the <neighbor_ap> elements of test_apdetail.xml so each radio
+has count neighbors, then times reading the client lists of
+APDetail(xml) and APDetail(xml, lazy=True).
+
+    $ python benchmarks/apdetail_lazy.py [count]
+
+"""
+
+import os
+import re
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..'))
+# pylint: disable=wrong-import-position
+from airwaveapiclient import APDetail  # noqa: E402
+
+FIXTURE = os.path.join(HERE, '..', 'airwaveapiclient', 'tests',
+                       'test_apdetail.xml')
+
+
+def busy_ap_detail(count):
+    """Return test_apdetail.xml with count neighbors per radio."""
+    with open(FIXTURE) as _file:
+        xml = _file.read()
+
+    def repeat(match):
+        """Repeat the neighbor_ap elements of one radio."""
+        neighbors = re.findall(r'<neighbor_ap .*?</neighbor_ap>',
+                               match.group(0), re.S)
+        body = [neighbors[i % len(neighbors)] for i in range(count)]
+        return '\n      '.join(body) + '\n      '
+
+    return re.sub(r'(?:<neighbor_ap .*?</neighbor_ap>\s*)+', repeat, xml,
+                  flags=re.S).encode('utf-8')
+
+
+def main():
+    """Benchmark main."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    xml = busy_ap_detail(count)
+
+    def clients(lazy):
+        """Read every client of every radio."""
+        obj = APDetail(xml, lazy=lazy)
+        return [client for radio in obj['radio']
+                for client in radio['client']]
+
+    eager = min(timeit.repeat(lambda: clients(False), number=10, repeat=3))
+    lazy = min(timeit.repeat(lambda: clients(True), number=10, repeat=3))
+    print('neighbors per radio:  %d' % count)
+    print('APDetail(xml):        %.2f ms' % (eager * 100))
+    print('APDetail(xml, lazy):  %.2f ms' % (lazy * 100))
+
+
+if __name__ == '__main__':
+    main()
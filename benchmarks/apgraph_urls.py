@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""Per-URL cost of the APGraph graph methods.
+
+Builds an access point with three radios (bgn, aN, ac) and times every
+*_802dot11* graph method on one APGraph instance ("after"), next to
+the radio scan and query encoding the graph methods did per call before
+the radio map and cached URL parts ("before"). Both build the same
+URLs, which is checked before timing.
+
+    $ python benchmarks/apgraph_urls.py [rounds]
+
+"""
+
+from collections import OrderedDict
+import os
+import re
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..'))
+# pylint: disable=wrong-import-position
+from airwaveapiclient import APGraph  # noqa: E402
+from requests.compat import urljoin  # noqa: E402
+
+
+def three_radio_ap():
+    """Return an APList style node with three radios."""
+    radios = []
+    for index, radio_type in ((1, u'bgn'), (2, u'aN'), (3, u'ac')):
+        radio = OrderedDict()
+        radio['@index'] = str(index)
+        radio['radio_interface'] = str(index)
+        radio['radio_type'] = radio_type
+        radios.append(radio)
+    node = OrderedDict()
+    node['@id'] = u'1'
+    node['lan_mac'] = u'00:00:10:00:00:01'
+    node['name'] = u'AP001'
+    node['radio'] = radios
+    return node
+
+
+def linear_time_format(seconds):
+    """Graph time format, compiling the pattern per call as before."""
+    res = re.compile(r'(-?\d+)').search(str(seconds))
+    num = 0
+    if res:
+        num = res.group(0)
+    return '{0}s'.format(num)
+
+
+def linear_url(url, node, graph_type, radio_type, start=None, end=None):
+    """Graph URL from a scan of the radios, as the methods did before."""
+    params = {'type': graph_type}
+    radio_graph = graph_type in APGraph.RADIO_GRAPH_TYPES
+    if radio_graph:
+        params['ap_uid'] = node['lan_mac']
+    else:
+        params['id'] = node['@id']
+    radios = node['radio']
+    if not isinstance(radios, list):
+        radios = [radios]
+    for radio in radios:
+        if 'radio_type' in radio and radio['radio_type'] == radio_type:
+            params['radio_index'] = radio['@index']
+            if radio_graph:
+                params['radio_interface'] = radio['radio_interface']
+            params['start'] = linear_time_format(start or -7200)
+            params['end'] = linear_time_format(end or 0)
+            return u'%s?%s' % (urljoin(url, '/nf/rrd_graph'),
+                               APGraph.urlencode(params))
+    return None
+
+
+def main():
+    """Benchmark main."""
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    url = u'https://192.168.1.1/'
+    node = three_radio_ap()
+    ap_graph = APGraph(url, node)
+    methods = [getattr(ap_graph, name) for name in dir(APGraph)
+               if '_802dot11' in name]
+    graphs = [(graph_type, radio_type)
+              for graph_type in (APGraph.AP_GRAPH_TYPES +
+                                 APGraph.RADIO_GRAPH_TYPES)
+              for radio_type in (u'bgn', u'aN', u'ac')]
+    before = set(linear_url(url, node, *graph) for graph in graphs)
+    after = set(method() for method in methods)
+    if before != after:
+        raise SystemExit('before and after build different URLs')
+
+    def run_before():
+        """Build every graph URL once with the radio scan."""
+        for graph_type, radio_type in graphs:
+            linear_url(url, node, graph_type, radio_type)
+
+    def run_after():
+        """Call every graph method once."""
+        for method in methods:
+            method()
+
+    print('graph methods:        %d' % len(methods))
+    for name, func in (('before', run_before), ('after', run_after)):
+        seconds = min(timeit.repeat(func, number=rounds, repeat=7))
+        print('per URL %-7s       %.2f us'
+              % (name + ':', seconds / rounds / len(methods) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
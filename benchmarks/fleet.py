@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+
+"""Synthetic AirWave fleets for the benchmarks.
+
+Generates ap_list, ap_detail and report documents shaped like the
+test_aplist.xml, test_apdetail.xml and test_report.xml fixtures for any
+number of access points. Access points get one to three radios (bgn,
+aN, ac) and details get a varying number of clients and neighbors. The
+output only depends on the arguments, so runs on different commits
+parse the same documents.
+
+    >>> from fleet import Fleet
+    >>> fleet = Fleet(10000)
+    >>> xml = fleet.ap_list()
+
+"""
+
+import random
+
+NAMESPACES = ('version="1" xmlns:amp="http://www.airwave.com" '
+              'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"')
+
+RADIOS = (
+    # radio_type, radio_interface, operational_mode, channel
+    ('bgn', 2, 'n', 6),
+    ('aN', 1, 'N', 40),
+    ('ac', 3, 'ac', 100),
+)
+
+AP = u'''  <ap id="{id}">
+    <controller_id>1</controller_id>
+    <device_category>thin_ap</device_category>
+    <firmware>6.3.1.14</firmware>
+    <group id="{group}">Access Points {group}</group>
+    <is_up>{is_up}</is_up>
+    <lan_ip>10.{ip}</lan_ip>
+    <lan_mac>00:00:{mac}</lan_mac>
+    <mfgr>Aruba</mfgr>
+    <model id="296">AP 105</model>
+    <monitor_only>false</monitor_only>
+    <name>AP{id:06d}</name>
+    <operating_mode>ap</operating_mode>
+    <planned_maintenance_mode>false</planned_maintenance_mode>
+{radios}    <serial_number>BT{id:07d}</serial_number>
+    <syscontact></syscontact>
+    <syslocation></syslocation>
+    <upstream_device_id></upstream_device_id>
+    <upstream_port_index></upstream_port_index>
+  </ap>
+'''
+
+AP_RADIO = u'''    <radio index="{index}">
+      <antenna></antenna>
+      <antenna_gain></antenna_gain>
+      <channel>{channel}</channel>
+      <display_channel>{channel}</display_channel>
+      <display_enabled>true</display_enabled>
+      <display_transmit_power>12 dBm</display_transmit_power>
+      <operational_mode>{mode}</operational_mode>
+      <radio_interface>{interface}</radio_interface>
+      <radio_mac>10:{index:02X}:{mac}</radio_mac>
+      <radio_role>ap</radio_role>
+      <radio_type>{radio_type}</radio_type>
+    </radio>
+'''
+
+DETAIL_RADIO = u'''    <radio index="{index}">
+{bssids}      <bw>231.856</bw>
+{clients}{neighbors}      <operational_mode>{mode}</operational_mode>
+      <radio_interface>{interface}</radio_interface>
+      <radio_type>{radio_type}</radio_type>
+    </radio>
+'''
+
+CLIENT = u'''      <client id="{id}">
+        <assoc_stat>{assoc}</assoc_stat>
+        <auth_stat>{auth}</auth_stat>
+        <bw>11.2</bw>
+        <device_type>Unknown</device_type>
+        <ipv4>10.{ip}</ipv4>
+        <name>C{id}</name>
+        <radio_mac>C0:{mac}</radio_mac>
+        <radio_mode>N</radio_mode>
+        <rssi>{snr}</rssi>
+        <signal>{signal}</signal>
+        <snr>{snr}</snr>
+        <vendor>Unknown</vendor>
+      </client>
+'''
+
+NEIGHBOR = u'''      <neighbor_ap id="{id}">
+        <channel>{channel}</channel>
+        <last_discovered>{discovered}</last_discovered>
+        <name>N{id}</name>
+        <neighbor_mode>ap</neighbor_mode>
+        <neighbor_type>rogue</neighbor_type>
+        <radio_mac>A0:{mac}</radio_mac>
+        <rssi>{snr}</rssi>
+        <security>WEP</security>
+        <signal>{signal}</signal>
+        <snr>{snr}</snr>
+        <ssid>SSID_{id}</ssid>
+        <vendor>Unknown</vendor>
+      </neighbor_ap>
+'''
+
+AP_SUMMARY = (u'  <pickled_ap_summary ap_folder_id="1" '
+              u'ap_folder_path="Top &gt; Office{group}" '
+              u'ap_group_id="{group}" ap_group_name="Office{group}" '
+              u'ap_id="{id}" avg_bw="{bw:.3f}" controller_id="1" '
+              u'controller_name="APC1" max_simul_users="{users}" '
+              u'name="AP{id:06d}" report_id="1234" '
+              u'total_bw="{total_bw:.4f}" total_users="{users}" />\n')
+
+RF_HEALTH = (u'  <pickled_rf_health ap_folder_id="1" '
+             u'ap_folder_path="Top &gt; Office{group}" '
+             u'ap_group_id="{group}" ap_group_name="Office{group}" '
+             u'ap_id="{id}" ap_name="AP{id:06d}" average_noise="{noise}" '
+             u'channel_changes="{changes}" controller_id="1" '
+             u'controller_name="APC1" interference="0" '
+             u'interfering_device_count="0" interfering_devices="" '
+             u'mac_phy_errors="0" mode_changes="0" radio_bw="1000000" '
+             u'radio_freq="{freq}" radio_index="{index}" '
+             u'radio_users="{users}" report_id="1234" />\n')
+
+
+def mac(number):
+    """Last four octets of a MAC address from a number."""
+    return ':'.join('%02X' % ((number >> shift) & 0xff)
+                    for shift in (24, 16, 8, 0))
+
+
+def ip(number):
+    """Last three octets of an IPv4 address from a number."""
+    return '%d.%d.%d' % ((number >> 16) & 0xff, (number >> 8) & 0xff,
+                         number & 0xff)
+
+
+class Fleet(object):
+
+    """Synthetic fleet of count access points.
+
+    Attributes:
+
+        :count (int): Number of access points.
+        :seed (int): Random seed.
+        :radios (list): Radio count of each access point.
+
+    """
+
+    def __init__(self, count, seed=0, max_clients=30, max_neighbors=40):
+        """Initialize Fleet.
+
+        Args:
+
+            :count (int): Number of access points.
+            :seed (optional[int]): Random seed. Default is 0.
+            :max_clients (optional[int]): Most clients per radio.
+                Default is 30.
+            :max_neighbors (optional[int]): Most neighbors per radio.
+                Default is 40.
+
+        """
+        self.count = count
+        self.seed = seed
+        self.max_clients = max_clients
+        self.max_neighbors = max_neighbors
+        rand = random.Random(seed)
+        self.radios = [rand.choice((1, 2, 2, 2, 3)) for _ in range(count)]
+
+    def ap_ids(self):
+        """Access point IDs, from 1."""
+        return range(1, self.count + 1)
+
+    def ap_list(self):
+        """ap_list.xml of the whole fleet, as bytes."""
+        parts = [u'<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n'
+                 u'<amp:amp_ap_list %s>\n' % NAMESPACES]
+        for ap_id in self.ap_ids():
+            radios = []
+            for index in range(1, self.radios[ap_id - 1] + 1):
+                radio_type, interface, mode, channel = RADIOS[index - 1]
+                radios.append(AP_RADIO.format(
+                    index=index, channel=channel, mode=mode,
+                    interface=interface, radio_type=radio_type,
+                    mac=mac(ap_id)))
+            parts.append(AP.format(
+                id=ap_id, group=ap_id % 20 + 1,
+                is_up='false' if ap_id % 50 == 0 else 'true',
+                ip=ip(ap_id), mac=mac(ap_id), radios=''.join(radios)))
+        parts.append(u'</amp:amp_ap_list>\n')
+        return u''.join(parts).encode('utf-8')
+
+    def ap_detail(self, ap_id):
+        """ap_detail.xml of one access point, as bytes."""
+        rand = random.Random('%d-%d' % (self.seed, ap_id))
+        radios = []
+        for index in range(1, self.radios[ap_id - 1] + 1):
+            radio_type, interface, mode, channel = RADIOS[index - 1]
+            bssids = ''.join(u'      <bssid>10:%02X:%s</bssid>\n'
+                             % (index * 16 + i, mac(ap_id))
+                             for i in range(rand.randint(1, 8)))
+            clients = []
+            for i in range(rand.randint(0, self.max_clients)):
+                number = (ap_id * 4 + index) * 256 + i
+                snr = rand.randint(5, 60)
+                clients.append(CLIENT.format(
+                    id=number, assoc=rand.choice(('true', 'false')),
+                    auth=rand.choice(('true', 'false')), ip=ip(number),
+                    mac=mac(number), snr=snr, signal=snr - 95))
+            neighbors = []
+            for i in range(rand.randint(0, self.max_neighbors)):
+                # Neighbors are shared by nearby access points.
+                number = rand.randint(max(1, ap_id - 20), ap_id + 20) * 64 + i
+                snr = rand.randint(1, 40)
+                neighbors.append(NEIGHBOR.format(
+                    id=number, channel=channel,
+                    discovered=1435000000 + rand.randint(0, 86400),
+                    mac=mac(number), snr=snr, signal=snr - 95))
+            radios.append(DETAIL_RADIO.format(
+                index=index, bssids=bssids, clients=''.join(clients),
+                neighbors=''.join(neighbors), mode=mode,
+                interface=interface, radio_type=radio_type))
+        return (u'<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n'
+                u'<amp:amp_ap_detail %s>\n'
+                u'  <ap id="%d">\n'
+                u'    <ap_folder>Top &gt; Office%d</ap_folder>\n'
+                u'    <ap_group>Access Points</ap_group>\n'
+                u'    <is_up>true</is_up>\n'
+                u'%s'
+                u'    <snmp_uptime>182836</snmp_uptime>\n'
+                u'  </ap>\n'
+                u'</amp:amp_ap_detail>\n'
+                % (NAMESPACES, ap_id, ap_id % 20 + 1, ''.join(radios))
+                ).encode('utf-8')
+
+    def report(self):
+        """Report XML of the fleet, as bytes.
+
+        It has one pickled_ap_summary row per access point and one
+        pickled_rf_health row per radio.
+        """
+        parts = [u'<?xml version="1.0" encoding="utf-8" standalone="yes"?>\n'
+                 u'<amp:report report_id="1234" state="3" %s>\n' % NAMESPACES]
+        for ap_id in self.ap_ids():
+            users = ap_id % 40
+            parts.append(AP_SUMMARY.format(
+                id=ap_id, group=ap_id % 20 + 1, bw=users * 1.5,
+                total_bw=users * 100.0, users=users))
+        for ap_id in self.ap_ids():
+            for index in range(1, self.radios[ap_id - 1] + 1):
+                parts.append(RF_HEALTH.format(
+                    id=ap_id, group=ap_id % 20 + 1,
+                    noise=-90 + ap_id % 15, changes=ap_id % 7,
+                    freq='2.4' if index == 1 else '5', index=index,
+                    users=(ap_id + index) % 25))
+        parts.append(u'</amp:report>\n')
+        return u''.join(parts).encode('utf-8')
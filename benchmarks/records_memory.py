@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""Memory used by APList nodes and typed AP records.
+
+Scales the bundled test_aplist.xml fixture to 50k access points and
+reports the memory retained by APList(xml) and APList(xml, typed=True).
+
+    $ python benchmarks/records_memory.py [count]
+
+"""
+
+import gc
+import os
+import re
+import sys
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, '..'))
+# pylint: disable=wrong-import-position
+from airwaveapiclient import APList  # noqa: E402
+
+FIXTURE = os.path.join(HERE, '..', 'airwaveapiclient', 'tests',
+                       'test_aplist.xml')
+
+
+def scaled_ap_list(count):
+    """Return test_aplist.xml with its <ap> elements repeated count times."""
+    with open(FIXTURE) as _file:
+        xml = _file.read()
+    head, rest = xml.split('<ap id=', 1)
+    body, tail = rest.rsplit('</ap>', 1)
+    aps = re.findall(r'<ap id="\d+">.*?</ap>', '<ap id=' + body + '</ap>',
+                     re.S)
+    nodes = []
+    for i in range(count):
+        nodes.append(re.sub(r'<ap id="\d+">', '<ap id="%d">' % (i + 1),
+                            aps[i % len(aps)], count=1))
+    return head + '\n  '.join(nodes) + tail
+
+
+def retained(func):
+    """Return (object, bytes retained) after calling func."""
+    gc.collect()
+    tracemalloc.start()
+    obj = func()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def main():
+    """Benchmark main."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    xml = scaled_ap_list(count)
+    _, plain = retained(lambda: APList(xml))
+    _, typed = retained(lambda: APList(xml, typed=True))
+    mib = 1024.0 * 1024.0
+    print('APs:                  %d' % count)
+    print('APList(xml):          %.1f MiB' % (plain / mib))
+    print('APList(xml, typed):   %.1f MiB' % (typed / mib))
+    print('saved:                %.1f MiB (%.0f%%)'
+          % ((plain - typed) / mib, 100.0 * (plain - typed) / plain))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+
+"""Fleet-scale benchmark suite.
+
+Times and memory-profiles APList, APList.search, APDetail, Report and
+the APGraph URL methods on synthetic fleets (see fleet.py), offline,
+and writes the results as JSON so runs on different commits can be
+compared.
+
+    $ python benchmarks/suite.py --output base.json
+    $ git checkout my-branch
+    $ python benchmarks/suite.py --output new.json --sizes 1000,10000
+    $ python benchmarks/suite.py --compare base.json new.json
+
+Each case reports the best wall time of --repeat runs, and unless
+--no-memory is given, the peak and retained Python memory of one more
+run traced with tracemalloc.
+
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.join(HERE, '..'))
+# pylint: disable=wrong-import-position
+from fleet import Fleet  # noqa: E402
+from airwaveapiclient import APDetail  # noqa: E402
+from airwaveapiclient import APGraph  # noqa: E402
+from airwaveapiclient import APList  # noqa: E402
+from airwaveapiclient import Report  # noqa: E402
+from airwaveapiclient import xmlparse  # noqa: E402
+
+URL = u'https://192.168.1.1/'
+SEARCHES = 1000
+DETAILS = 1000
+GRAPH_APS = 1000
+
+
+def cases(fleet):
+    """Yield (name, items, setup) for a fleet.
+
+    setup() prepares the inputs and returns the function to measure,
+    so document generation is neither timed nor traced.
+    """
+    def ap_list(typed):
+        """Parse the ap_list document."""
+        xml = fleet.ap_list()
+        return lambda: APList(xml, typed=typed)
+
+    def search():
+        """Look up ids and names, building the indexes on first use."""
+        nodes = list(APList(fleet.ap_list()))
+        rand = random.Random(fleet.seed)
+        ap_ids = [rand.randint(1, fleet.count) for _ in range(SEARCHES)]
+        names = ['AP%06d' % ap_id for ap_id in ap_ids]
+
+        def run():
+            """Search a fresh list."""
+            objs = APList.from_nodes(nodes)
+            return ([objs.search(ap_id) for ap_id in ap_ids] +
+                    [objs.search(name) for name in names])
+        return run
+
+    def ap_detail(lazy):
+        """Parse ap_detail documents and read the client lists."""
+        details = [fleet.ap_detail(ap_id)
+                   for ap_id in range(1, min(fleet.count, DETAILS) + 1)]
+
+        def run():
+            """Parse every detail."""
+            objs = [APDetail(xml, lazy=lazy) for xml in details]
+            for obj in objs:
+                radios = obj['radio']
+                for radio in radios if isinstance(radios, list) else [radios]:
+                    len(radio.get('client') or [])
+            return objs
+        return run
+
+    def report():
+        """Parse the report document."""
+        xml = fleet.report()
+        return lambda: Report(xml)
+
+    def graph_methods():
+        """Call every *_802dot11* graph method of each APGraph."""
+        nodes = list(APList(fleet.ap_list()))[:GRAPH_APS]
+        names = [name for name in dir(APGraph) if '_802dot11' in name]
+
+        def run():
+            """Build the URLs."""
+            urls = []
+            for node in nodes:
+                graph = APGraph(URL, node)
+                urls.extend(getattr(graph, name)() for name in names)
+            return urls
+        return run
+
+    def bulk_urls():
+        """Build the graph URLs of the whole fleet with bulk_urls."""
+        objs = APList(fleet.ap_list())
+        return lambda: list(APGraph.bulk_urls(URL, objs))
+
+    methods = len([name for name in dir(APGraph) if '_802dot11' in name])
+    details = min(fleet.count, DETAILS)
+    yield 'aplist', fleet.count, lambda: ap_list(False)
+    yield 'aplist_typed', fleet.count, lambda: ap_list(True)
+    yield 'aplist_search', SEARCHES * 2, search
+    yield 'apdetail', details, lambda: ap_detail(False)
+    yield 'apdetail_lazy', details, lambda: ap_detail(True)
+    yield 'report', fleet.count + sum(fleet.radios), report
+    yield ('apgraph_methods', min(fleet.count, GRAPH_APS) * methods,
+           graph_methods)
+    yield 'apgraph_bulk_urls', fleet.count, bulk_urls
+
+
+def best(func, repeat):
+    """Best wall time of func in seconds."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def memory(func):
+    """Peak and retained bytes allocated by func."""
+    gc.collect()
+    tracemalloc.start()
+    obj = func()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del obj
+    return peak, retained
+
+
+def metadata():
+    """Environment of the run."""
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=HERE,
+            stderr=subprocess.STDOUT).decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {'commit': commit,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'xml_backend': xmlparse.BACKEND}
+
+
+def run(sizes, repeat, names=None, trace=True, seed=0):
+    """Run the suite.
+
+    Returns:
+
+        :dict: 'meta', the environment, and 'results', one dict per
+            case and fleet size.
+
+    """
+    results = []
+    for size in sizes:
+        fleet = Fleet(size, seed=seed)
+        for name, items, setup in cases(fleet):
+            if names and name not in names:
+                continue
+            func = setup()
+            seconds = best(func, repeat)
+            result = {'name': name, 'size': size, 'items': items,
+                      'seconds': seconds,
+                      'per_item_us': seconds / items * 1e6}
+            if trace:
+                result['peak_bytes'], result['retained_bytes'] = memory(func)
+            results.append(result)
+            report_result(result)
+            del func
+    return {'meta': metadata(), 'results': results}
+
+
+def report_result(result):
+    """Print one result."""
+    line = '%-18s %8d APs  %9.4f s  %9.2f us/item' % (
+        result['name'], result['size'], result['seconds'],
+        result['per_item_us'])
+    if 'peak_bytes' in result:
+        line += '  peak %8.1f MiB  retained %8.1f MiB' % (
+            result['peak_bytes'] / 1048576.0,
+            result['retained_bytes'] / 1048576.0)
+    sys.stderr.write(line + '\n')
+
+
+def compare(base, new):
+    """Print the ratios of new to base results.
+
+    Args:
+
+        :base (dict): Results of the reference run.
+        :new (dict): Results of the run to compare.
+
+    """
+    old = dict(((result['name'], result['size']), result)
+               for result in base['results'])
+    print('base %s, new %s' % (base['meta'].get('commit'),
+                               new['meta'].get('commit')))
+    print('%-18s %8s %10s %10s %7s %9s' % ('case', 'APs', 'base s', 'new s',
+                                           'time', 'peak'))
+    for result in new['results']:
+        ref = old.get((result['name'], result['size']))
+        if ref is None:
+            continue
+        peak = ''
+        if result.get('peak_bytes') and ref.get('peak_bytes'):
+            peak = '%8.2fx' % (float(result['peak_bytes']) /
+                               ref['peak_bytes'])
+        print('%-18s %8d %10.4f %10.4f %6.2fx %9s' % (
+            result['name'], result['size'], ref['seconds'],
+            result['seconds'], result['seconds'] / ref['seconds'], peak))
+
+
+def main():
+    """Benchmark main."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        help='fleet sizes, comma separated '
+                        '(default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='timed runs per case (default: %(default)s)')
+    parser.add_argument('--only', default='',
+                        help='cases to run, comma separated')
+    parser.add_argument('--backend', choices=sorted(xmlparse.BACKENDS),
+                        help='XML parser backend')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='skip the tracemalloc run')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='fleet random seed (default: %(default)s)')
+    parser.add_argument('--output', default='-',
+                        help='JSON results file, - for stdout')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'),
+                        help='compare two JSON results files')
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as _file:
+            base = json.load(_file)
+        with open(args.compare[1]) as _file:
+            new = json.load(_file)
+        compare(base, new)
+        return
+    if args.backend:
+        xmlparse.set_backend(args.backend)
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    names = [name for name in args.only.split(',') if name]
+    results = run(sizes, args.repeat, names, not args.no_memory, args.seed)
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.output == '-':
+        print(text)
+    else:
+        with open(args.output, 'w') as _file:
+            _file.write(text + '\n')
+
+
+if __name__ == '__main__':
+    main()
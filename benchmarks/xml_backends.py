@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""Parse time of the XML parser backends.
+
+Scales the bundled test_aplist.xml and test_report.xml fixtures and
+times APList and Report with each available backend.
+
+    $ python benchmarks/xml_backends.py [count]
+
+"""
+
+import os
+import re
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.join(HERE, '..'))
+# pylint: disable=wrong-import-position
+from records_memory import scaled_ap_list  # noqa: E402
+from airwaveapiclient import APList  # noqa: E402
+from airwaveapiclient import Report  # noqa: E402
+from airwaveapiclient import xmlparse  # noqa: E402
+
+REPORT = os.path.join(HERE, '..', 'airwaveapiclient', 'tests',
+                      'test_report.xml')
+
+
+def scaled_report(count):
+    """Return test_report.xml with its rows repeated to count rows."""
+    with open(REPORT) as _file:
+        xml = _file.read()
+    rows = re.findall(r'<pickled_\w+ [^>]*/>', xml)
+    head = xml[:xml.index(rows[0])]
+    tail = xml[xml.rindex(rows[-1]) + len(rows[-1]):]
+    body = [rows[i % len(rows)] for i in range(count)]
+    return head + '\n  '.join(body) + tail
+
+
+def best(func, repeat=3):
+    """Best wall time of func in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def main():
+    """Benchmark main."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    ap_list = scaled_ap_list(count)
+    report = scaled_report(count * 10)
+    print('APs: %d, report rows: %d' % (count, count * 10))
+    for backend in sorted(xmlparse.BACKENDS):
+        if backend == 'lxml' and xmlparse.etree is None:
+            print('%-10s  not installed' % backend)
+            continue
+        xmlparse.set_backend(backend)
+        print('%-10s  APList %.3f s  Report %.3f s'
+              % (backend, best(lambda: APList(ap_list)),
+                 best(lambda: Report(report))))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,6 @@
 
 from airwaveapiclient import AirWaveAPIClient
 from airwaveapiclient import APList
-from airwaveapiclient import APDetail
 from pprint import pprint
 
 
@@ -43,12 +42,12 @@ def main():
     # APDetail ######################################
     #################################################
 
-    for ap_node in ap_list:
-        res = airwave.ap_detail(ap_node['@id'])
-        if res.status_code == 200:
-            xml = res.text
-            ap_detail = APDetail(xml)
-            pprint(ap_detail)
+    ap_ids = [ap_node['@id'] for ap_node in ap_list]
+    for ap_id, ap_detail in airwave.ap_detail_many(ap_ids, max_workers=8):
+        if isinstance(ap_detail, Exception):
+            print('AP %s: %s' % (ap_id, ap_detail))
+            continue
+        pprint(ap_detail)
 
     #################################################
     # Logout ########################################
@@ -46,6 +46,7 @@ classifiers = [
     "Programming Language :: Python :: 3.5",
     "Programming Language :: Python :: 3.6",
     "Programming Language :: Python :: 3.7",
+    "Framework :: AsyncIO",
     "Programming Language :: Python :: Implementation :: CPython",
     "Programming Language :: Python :: Implementation :: PyPy",
     "Topic :: System :: Monitoring",
@@ -57,7 +58,8 @@ with open(os.path.join(here, 'README.rst')) as _file:
     README = _file.read()
 
 requires = ['requests',
-            'xmltodict']
+            'xmltodict',
+            'futures; python_version < "3.2"']
 
 with open('requirements.txt', 'w') as _file:
     _file.write('\n'.join(requires))
@@ -75,6 +77,9 @@ setup(
     packages=find_packages(),
     data_files=[],
     install_requires=requires,
+    extras_require={'async': ['aiohttp'],
+                    'numpy': ['numpy'],
+                    'lxml': ['lxml']},
     include_package_data=True,
     tests_require=['tox'],
     cmdclass={'test': Tox},